@@ -0,0 +1,9 @@
+"""
+Dars benchmarks - synthetic apps, timings per commit and regression checks
+
+    python -m benchmarks run --components 500 --depth 5 --pages 10
+    python -m benchmarks compare <base-commit> [<new-commit>] --threshold 10
+    python -m benchmarks imports
+
+Todo se ejecuta sin red; los resultados se guardan en benchmarks/results/<commit>.json.
+"""
@@ -0,0 +1,114 @@
+"""
+CLI de benchmarks: `python -m benchmarks run|compare|imports`
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.compare import compare_results, latest_results, load_results, print_comparison
+from benchmarks.generator import MIX_CHOICES
+from benchmarks.imports import check_import_budgets, measure_import_times
+from benchmarks.runner import DEFAULT_RESULTS_DIR, run_benchmarks, save_results
+
+
+def print_results(document):
+    from rich.console import Console
+    from rich.table import Table
+
+    label = document['commit'] + (' (dirty)' if document.get('dirty') else '')
+    table = Table(title=f"Benchmarks @ {label}")
+    table.add_column("Case", style="cyan")
+    table.add_column("Median ms", justify="right")
+    table.add_column("Min ms", justify="right")
+    table.add_column("Runs", justify="right")
+    for name, timing in document['results'].items():
+        table.add_row(name, f"{timing['median_ms']:.2f}", f"{timing['min_ms']:.2f}", str(timing['repeat']))
+    Console().print(table)
+
+
+def command_run(args) -> int:
+    document = run_benchmarks(
+        components=args.components, depth=args.depth, pages=args.pages, mix=args.mix.split(','),
+        style_size=args.style_size, repeat=args.repeat, include_imports=not args.no_imports,
+        only=args.only.split(',') if args.only else None,
+        progress=lambda name: print(f"running {name}...", file=sys.stderr),
+    )
+    if args.json:
+        print(json.dumps(document, indent=2))
+    else:
+        print_results(document)
+    if not args.no_save:
+        path = save_results(document, args.results_dir)
+        print(f"Results saved to {path}", file=sys.stderr)
+    if args.compare:
+        base = load_results(args.compare, args.results_dir)
+        rows, regressions, warnings = compare_results(base, document, args.threshold)
+        print_comparison(rows, regressions, warnings, base['commit'], document['commit'], args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+def command_compare(args) -> int:
+    base = load_results(args.base, args.results_dir)
+    if args.new:
+        new = load_results(args.new, args.results_dir)
+    else:
+        path = latest_results(args.results_dir)
+        if path is None:
+            print(f"No benchmark results in {args.results_dir}", file=sys.stderr)
+            return 2
+        new = load_results(path, args.results_dir)
+    rows, regressions, warnings = compare_results(base, new, args.threshold, args.metric)
+    print_comparison(rows, regressions, warnings, base['commit'], new['commit'], args.threshold)
+    return 1 if regressions else 0
+
+
+def command_imports(args) -> int:
+    results = measure_import_times(runs=args.runs)
+    for module, timing in results.items():
+        print(f"{module}: {timing['min_ms']:.1f} ms (budget {timing['budget_ms']:.0f} ms)")
+    violations = check_import_budgets(results)
+    for violation in violations:
+        print(f"OVER BUDGET {violation}")
+    return 1 if violations else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Dars benchmark suite")
+    results_options = argparse.ArgumentParser(add_help=False)
+    results_options.add_argument('--results-dir', default=DEFAULT_RESULTS_DIR)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Run the suite and save results keyed by commit",
+                                       parents=[results_options])
+    run_parser.add_argument('--components', '-n', type=int, default=200, help="Components per page")
+    run_parser.add_argument('--depth', '-d', type=int, default=4, help="Maximum nesting depth")
+    run_parser.add_argument('--pages', '-p', type=int, default=3, help="Number of pages (1 = single-page)")
+    run_parser.add_argument('--mix', default=','.join(MIX_CHOICES), help="Comma-separated: table,tabs,grid,form")
+    run_parser.add_argument('--style-size', type=int, default=8, help="Properties per style dict")
+    run_parser.add_argument('--repeat', '-r', type=int, default=5)
+    run_parser.add_argument('--only', help="Comma-separated subset of cases (e.g. export,hot_reload,imports)")
+    run_parser.add_argument('--no-imports', action='store_true', help="Skip the import-time measurements")
+    run_parser.add_argument('--no-save', action='store_true')
+    run_parser.add_argument('--json', action='store_true', help="Print the result document as JSON")
+    run_parser.add_argument('--compare', metavar='BASE', help="Compare against BASE (commit or file) after running")
+    run_parser.add_argument('--threshold', type=float, default=10.0, help="Regression threshold in percent")
+
+    compare_parser = subparsers.add_parser('compare', help="Compare two saved results and flag regressions",
+                                           parents=[results_options])
+    compare_parser.add_argument('base', help="Base commit (prefix) or result file")
+    compare_parser.add_argument('new', nargs='?', help="New commit or file (default: latest saved result)")
+    compare_parser.add_argument('--threshold', type=float, default=10.0, help="Regression threshold in percent")
+    compare_parser.add_argument('--metric', default='median_ms', choices=['median_ms', 'min_ms', 'mean_ms'])
+
+    imports_parser = subparsers.add_parser('imports', help="Check cold import times against their budget")
+    imports_parser.add_argument('--runs', type=int, default=5)
+
+    args = parser.parse_args(argv)
+    handlers = {'run': command_run, 'compare': command_compare, 'imports': command_imports}
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
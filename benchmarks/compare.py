@@ -0,0 +1,90 @@
+"""
+Compara dos resultados de benchmarks y marca regresiones por encima de un umbral.
+"""
+
+import glob
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.imports import check_import_budgets
+
+
+def load_results(reference: str, results_dir: str) -> Dict[str, Any]:
+    """Carga un resultado por ruta o por commit (prefijo) dentro de results_dir"""
+    if os.path.isfile(reference):
+        path = reference
+    else:
+        matches = sorted(glob.glob(os.path.join(results_dir, f'{reference}*.json')))
+        if not matches:
+            raise FileNotFoundError(f"No benchmark results for '{reference}' in {results_dir}")
+        path = matches[0]
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def latest_results(results_dir: str, exclude: Optional[str] = None) -> Optional[str]:
+    """Ruta del resultado más reciente (por mtime), opcionalmente excluyendo uno"""
+    paths = [p for p in glob.glob(os.path.join(results_dir, '*.json')) if p != exclude]
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
+def compare_results(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 10.0,
+                    metric: str = 'median_ms') -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """Devuelve (filas de comparación, regresiones, avisos). Una regresión es un caso
+    cuyo `metric` crece más de `threshold` % respecto a `base`"""
+    rows = []
+    regressions = []
+    warnings = []
+    for name, new_timing in new.get('results', {}).items():
+        base_timing = base.get('results', {}).get(name)
+        new_value = new_timing.get(metric)
+        if base_timing is None or new_value is None:
+            rows.append({'name': name, 'base': None, 'new': new_value, 'change_pct': None, 'regression': False})
+            continue
+        base_value = base_timing.get(metric)
+        change = ((new_value - base_value) / base_value * 100) if base_value else 0.0
+        regression = change > threshold
+        rows.append({'name': name, 'base': base_value, 'new': new_value,
+                     'change_pct': round(change, 1), 'regression': regression})
+        if regression:
+            regressions.append(f"{name}: {base_value:.2f} -> {new_value:.2f} ms (+{change:.1f}%)")
+    if base.get('params') != new.get('params'):
+        warnings.append("parameters differ between runs; the comparison may not be meaningful")
+    if base.get('platform') != new.get('platform') or base.get('python') != new.get('python'):
+        warnings.append("runs come from different machines or Python versions")
+    imports = {name.split(':', 1)[1]: timing for name, timing in new.get('results', {}).items()
+               if name.startswith('import:')}
+    regressions.extend(check_import_budgets(imports))
+    return rows, regressions, warnings
+
+
+def print_comparison(rows: List[Dict[str, Any]], regressions: List[str], warnings: List[str],
+                     base_label: str, new_label: str, threshold: float):
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Benchmarks: {base_label} -> {new_label} (threshold {threshold:.0f}%)")
+    table.add_column("Case", style="cyan")
+    table.add_column("Base ms", justify="right")
+    table.add_column("New ms", justify="right")
+    table.add_column("Change", justify="right")
+    for row in rows:
+        change = row['change_pct']
+        if change is None:
+            change_text = "new"
+        else:
+            style = "red" if row['regression'] else ("green" if change < -threshold else "white")
+            change_text = f"[{style}]{change:+.1f}%[/{style}]"
+        table.add_row(row['name'], "-" if row['base'] is None else f"{row['base']:.2f}",
+                      "-" if row['new'] is None else f"{row['new']:.2f}", change_text)
+    Console().print(table)
+
+    for warning in warnings:
+        print(f"Warning: {warning}")
+    if regressions:
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+    else:
+        print("No regressions.")
@@ -0,0 +1,134 @@
+"""
+Generador de apps sintéticas y deterministas para los benchmarks.
+
+    app = generate_app(components=500, depth=4, pages=5, mix=('table', 'tabs', 'grid', 'form'))
+
+`components` es el número aproximado de componentes por página, `depth` la
+profundidad máxima de anidamiento y `style_size` el número de propiedades de
+los diccionarios de estilo. Misma semilla -> misma app.
+"""
+
+import random
+from typing import Iterable, List
+
+from dars.core.app import App
+from dars.core.component import Component
+from dars.components.basic.button import Button
+from dars.components.basic.checkbox import Checkbox
+from dars.components.basic.container import Container
+from dars.components.basic.input import Input
+from dars.components.basic.select import Select
+from dars.components.basic.text import Text
+from dars.components.basic.textarea import Textarea
+from dars.components.advanced.table import Table
+from dars.components.advanced.tabs import Tabs
+from dars.components.layout.grid import GridLayout
+
+MIX_CHOICES = ('table', 'tabs', 'grid', 'form')
+
+_STYLE_PROPERTIES = (
+    ('padding', '{n}px'), ('margin', '{n}px 0'), ('color', '#{n:06x}'), ('background_color', '#{n:06x}'),
+    ('font_size', '{n}px'), ('border_radius', '{n}px'), ('line_height', '1.{n}'), ('width', '{n}%'),
+    ('max_width', '{n}0px'), ('border', '1px solid #{n:06x}'), ('opacity', '0.{n}'), ('gap', '{n}px'),
+)
+
+
+class _Budget:
+    """Cuenta los componentes que quedan por crear en una página"""
+
+    def __init__(self, total: int):
+        self.remaining = total
+
+    def take(self, count: int = 1) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= count
+        return True
+
+
+def _style(rng: random.Random, size: int) -> dict:
+    style = {}
+    for index in range(size):
+        name, template = _STYLE_PROPERTIES[index % len(_STYLE_PROPERTIES)]
+        if index >= len(_STYLE_PROPERTIES):
+            name = f"{name}_{index // len(_STYLE_PROPERTIES)}"
+        style[name] = template.format(n=rng.randint(1, 99))
+    return style
+
+
+def _leaf(rng: random.Random, budget: _Budget, style_size: int) -> Component:
+    budget.take()
+    kind = rng.randrange(3)
+    if kind == 0:
+        return Text(f"Lorem ipsum {rng.randint(0, 10 ** 6)} dolor sit amet", style=_style(rng, style_size))
+    if kind == 1:
+        return Button(f"Action {rng.randint(0, 999)}", style=_style(rng, style_size))
+    return Input(placeholder=f"Field {rng.randint(0, 999)}", style=_style(rng, style_size))
+
+
+def _table(rng: random.Random, budget: _Budget, style_size: int) -> Component:
+    budget.take()
+    columns = [{"title": f"Column {c}", "field": f"c{c}"} for c in range(5)]
+    data = [{f"c{c}": rng.randint(0, 10 ** 4) for c in range(5)} for _ in range(20)]
+    return Table(columns=columns, data=data, style=_style(rng, style_size))
+
+
+def _form(rng: random.Random, budget: _Budget, style_size: int) -> Component:
+    budget.take(5)
+    return Container(style=_style(rng, style_size), children=[
+        Input(placeholder="Name", style=_style(rng, style_size)),
+        Textarea(placeholder="Message", rows=3),
+        Checkbox(label="Subscribe", checked=bool(rng.randrange(2))),
+        Select(options=[f"Option {i}" for i in range(6)]),
+        Button("Send"),
+    ])
+
+
+def _subtree(rng: random.Random, budget: _Budget, depth: int, mix: List[str], style_size: int) -> Component:
+    if depth <= 1 or budget.remaining <= 1:
+        return _leaf(rng, budget, style_size)
+    budget.take()
+    kind = rng.choice(mix + ['container', 'container']) if mix else 'container'
+    if kind == 'table':
+        return _table(rng, budget, style_size)
+    if kind == 'form':
+        return _form(rng, budget, style_size)
+    if kind == 'tabs':
+        panels = [Container(children=[_subtree(rng, budget, depth - 1, mix, style_size)]) for _ in range(3)]
+        return Tabs(tabs=[f"Tab {i}" for i in range(len(panels))], panels=panels, style=_style(rng, style_size))
+    if kind == 'grid':
+        grid = GridLayout(rows=2, cols=2, style=_style(rng, style_size))
+        for index in range(4):
+            grid.add_child(_subtree(rng, budget, depth - 1, mix, style_size), row=index // 2, col=index % 2)
+        return grid
+    children = [_subtree(rng, budget, depth - 1, mix, style_size) for _ in range(rng.randint(2, 5))]
+    return Container(style=_style(rng, style_size), children=children)
+
+
+def generate_page(components: int = 200, depth: int = 4, mix: Iterable[str] = MIX_CHOICES,
+                  style_size: int = 8, seed: int = 0) -> Component:
+    """Genera el árbol de una página con ~`components` componentes"""
+    mix = [m for m in mix if m in MIX_CHOICES]
+    rng = random.Random(seed)
+    budget = _Budget(components)
+    children = []
+    while budget.remaining > 0:
+        children.append(_subtree(rng, budget, depth, mix, style_size))
+    return Container(class_name="bench-root", style=_style(rng, style_size), children=children)
+
+
+def generate_app(components: int = 200, depth: int = 4, pages: int = 1, mix: Iterable[str] = MIX_CHOICES,
+                 style_size: int = 8, seed: int = 0) -> App:
+    """Genera una App; con pages > 1 registra páginas (multipágina) en vez de set_root"""
+    mix = list(mix)
+    app = App(title=f"Benchmark app ({components}x{pages})")
+    for selector_index in range(max(1, style_size // 2)):
+        app.add_global_style(f".bench-{selector_index}", _style(random.Random(seed + selector_index), style_size))
+    if pages <= 1:
+        app.set_root(generate_page(components, depth, mix, style_size, seed))
+        return app
+    for page_index in range(pages):
+        root = generate_page(components, depth, mix, style_size, seed + page_index)
+        app.add_page(f"page{page_index}" if page_index else "home", root,
+                     title=f"Page {page_index}", index=page_index == 0)
+    return app
@@ -0,0 +1,82 @@
+"""
+Tiempo de importación en frío (python -X importtime) y presupuesto por módulo.
+
+Los módulos públicos cargan sus dependencias de forma perezosa (PEP 562); este
+presupuesto evita que una importación eager vuelva a colarse sin que nadie lo note.
+Además de módulos se miden comandos (IMPORT_COMMANDS): todo lo que importan después
+del arranque del intérprete, p. ej. `dars --help` con rich.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+# Presupuesto en ms del tiempo acumulado de importación (mínimo de varias ejecuciones)
+IMPORT_BUDGETS_MS = {
+    'dars': 10.0,
+    'dars.all': 25.0,
+    'dars.exporters.web.html_css_js': 60.0,
+    'dars.cli.main': 80.0,
+    'dars --help': 250.0,
+}
+
+# Comandos medidos como un todo: nombre -> argumentos del intérprete
+IMPORT_COMMANDS = {
+    'dars --help': ['-m', 'dars.cli.main', '--help'],
+}
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _top_level_imports(args: List[str]) -> List[Tuple[str, int]]:
+    """(módulo, µs acumulados) de cada import de primer nivel al ejecutar el intérprete con `args`"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get('PYTHONPATH')])))
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    # Formato: "import time: self [us] | cumulative | imported package"; los imports
+    # anidados llevan más sangría en el nombre
+    imports = []
+    for line in completed.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith('  '):
+            imports.append((parts[2].strip(), int(parts[1])))
+    return imports
+
+
+def _cumulative_import_us(module: str) -> int:
+    if module in IMPORT_COMMANDS:
+        # Lo que ya importa un intérprete vacío (site, encodings...) no cuenta
+        startup = {name for name, _ in _top_level_imports(['-c', 'pass'])}
+        return sum(us for name, us in _top_level_imports(IMPORT_COMMANDS[module]) if name not in startup)
+    for name, us in reversed(_top_level_imports(['-c', f'import {module}'])):
+        if name == module:
+            return us
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def measure_import_times(modules: Iterable[str] = tuple(IMPORT_BUDGETS_MS), runs: int = 5) -> Dict[str, Dict[str, float]]:
+    """Mide cada módulo en `runs` intérpretes nuevos; el mínimo es el valor de referencia"""
+    results = {}
+    for module in modules:
+        samples = [_cumulative_import_us(module) / 1000 for _ in range(runs)]
+        samples.sort()
+        results[module] = {
+            'median_ms': round(samples[len(samples) // 2], 3),
+            'min_ms': round(samples[0], 3),
+            'repeat': runs,
+            'budget_ms': IMPORT_BUDGETS_MS.get(module),
+        }
+    return results
+
+
+def check_import_budgets(results: Dict[str, Dict[str, float]]) -> List[str]:
+    """Devuelve un mensaje por cada módulo que supera su presupuesto"""
+    violations = []
+    for module, timing in results.items():
+        budget = timing.get('budget_ms') or IMPORT_BUDGETS_MS.get(module)
+        if budget is not None and timing['min_ms'] > budget:
+            violations.append(f"{module}: {timing['min_ms']:.1f} ms > budget {budget:.1f} ms")
+    return violations
@@ -0,0 +1,167 @@
+"""
+Ejecuta los benchmarks y guarda los resultados como JSON identificados por commit.
+
+Casos:
+    generate_html  render del HTML de la página index (sin escribir a disco)
+    generate_css   CSS global
+    export         exportación completa a un directorio temporal
+    validate       App.validate()
+    hot_reload     reconstrucción incremental tras cambiar una página (como `--watch`)
+    template_render  una página desde un PageTemplate precompilado (comparar con generate_html)
+    render_direct    render del árbol de la página index recorriendo el árbol
+    render_planned   el mismo árbol con plan_cache caliente y fingerprints ya calculados
+    plan_compile     compilar el plan de ese árbol (coste de un fallo de caché)
+    import:<mod>   tiempo de importación en frío, en un subproceso (ver imports.py)
+"""
+
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, Optional
+
+from benchmarks.generator import MIX_CHOICES, generate_app, generate_page
+from benchmarks.imports import measure_import_times
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+
+
+def git_commit() -> Dict[str, Any]:
+    """Commit actual (sin red). 'unknown' fuera de un repositorio git"""
+    def run(*args):
+        return subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    try:
+        commit = run('rev-parse', '--short=12', 'HEAD')
+        dirty = bool(run('status', '--porcelain', '--untracked-files=no'))
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': 'unknown', 'dirty': False}
+    return {'commit': commit, 'dirty': dirty}
+
+
+def time_call(function: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None,
+              warmup: int = 1) -> Dict[str, float]:
+    """Ejecuta `function` `repeat` veces (tras `warmup`) y devuelve estadísticas en ms.
+    `setup` se ejecuta antes de cada llamada y no se mide"""
+    for _ in range(warmup):
+        if setup:
+            setup()
+        function()
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'min_ms': round(min(samples), 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'stdev_ms': round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(components: int = 200, depth: int = 4, pages: int = 3, mix=MIX_CHOICES,
+                   style_size: int = 8, repeat: int = 5, include_imports: bool = True,
+                   only=None, progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Ejecuta la suite completa y devuelve el documento de resultados"""
+    from dars.components.basic.text import Text
+    from dars.core.fingerprint import subtree_fingerprints
+    from dars.exporters.incremental import IncrementalBuilder
+    from dars.exporters.web.page_template import PageTemplate, field
+    from dars.exporters.web.render_plan import PlanCache, compile_plan
+    from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+
+    params = {'components': components, 'depth': depth, 'pages': pages, 'mix': list(mix),
+              'style_size': style_size, 'repeat': repeat}
+    app = generate_app(components, depth, pages, mix, style_size)
+    exporter = HTMLCSSJSExporter()
+    index_slug, index_page, index_is_index = next(iter(exporter.iter_page_targets(app)))
+    page_app = exporter._page_app(app, index_page) if index_page is not None else app
+    workdir = tempfile.mkdtemp(prefix='dars-bench-')
+
+    def export_fresh():
+        shutil.rmtree(os.path.join(workdir, 'export'), ignore_errors=True)
+
+    builder_dir = os.path.join(workdir, 'watch')
+    builder = IncrementalBuilder(HTMLCSSJSExporter(), builder_dir)
+    builder.build(app)
+    toggle = [0]
+
+    def change_one_page():
+        # Simula editar un archivo: la app se regenera y solo cambia una página
+        toggle[0] += 1
+        if app.is_multipage():
+            slug = list(app.pages)[-1]
+            app.pages[slug].root = generate_page(components, depth, mix, style_size, seed=1000 + toggle[0] % 2)
+        else:
+            app.root = generate_page(components, depth, mix, style_size, seed=1000 + toggle[0] % 2)
+
+    # La misma página que generate_html, con un campo de plantilla en el título y otro en el cuerpo
+    template_root = generate_page(components, depth, mix, style_size)
+    template_root.add_child(Text(field('body')))
+    template_plan = PageTemplate(template_root, title=field('title')).compile(exporter, app)
+    template_record = {'title': 'Benchmark page', 'body': 'Lorem <ipsum> & dolor'}
+
+    # Render del árbol directo frente a plan precompilado (como en un hot reload sin cambios)
+    index_root = page_app.root
+    index_keys = subtree_fingerprints(index_root)
+    planned_exporter = HTMLCSSJSExporter(plan_cache=PlanCache())
+
+    def render_planned():
+        planned_exporter.render_tree(index_root, planned_exporter.new_context(subtree_keys=index_keys))
+
+    cases = {
+        'generate_html': (lambda: exporter.generate_html(page_app), None),
+        'generate_css': (lambda: exporter.generate_css(app), None),
+        'validate': (app.validate, None),
+        'export': (lambda: exporter.export(app, os.path.join(workdir, 'export')), export_fresh),
+        'hot_reload': (lambda: builder.build(app), change_one_page),
+        'template_render': (lambda: template_plan.render(template_record), None),
+        'render_direct': (lambda: exporter.render_tree(index_root), None),
+        'render_planned': (render_planned, None),
+        'plan_compile': (lambda: compile_plan(exporter, index_root), None),
+    }
+    results: Dict[str, Any] = {}
+    try:
+        for name, (function, setup) in cases.items():
+            if only and name not in only:
+                continue
+            if progress:
+                progress(name)
+            results[name] = time_call(function, repeat, setup)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if include_imports and (not only or 'imports' in only):
+        if progress:
+            progress('imports')
+        for module, timing in measure_import_times().items():
+            results[f'import:{module}'] = timing
+
+    return {
+        **git_commit(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'params': params,
+        'results': results,
+    }
+
+
+def save_results(document: Dict[str, Any], results_dir: str = DEFAULT_RESULTS_DIR) -> str:
+    """Guarda en results_dir/<commit>[-dirty].json y devuelve la ruta"""
+    os.makedirs(results_dir, exist_ok=True)
+    name = document['commit'] + ('-dirty' if document.get('dirty') else '')
+    path = os.path.join(results_dir, f'{name}.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    return path
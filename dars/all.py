@@ -1,41 +1,59 @@
 # Barrel import for all Dars components and core modules
 # Usage: from dars.all import *
+#
+# Los módulos se importan en el primer acceso (PEP 562): `from dars.all import Text`
+# solo carga Text, y `import dars.all` no importa ningún componente.
 
-# Core
-from dars.core.app import App
-from dars.core.component import Component
-from dars.core.events import EventManager
-
-# Basic Components
-from dars.components.basic.button import Button
-from dars.components.basic.checkbox import Checkbox
-from dars.components.basic.container import Container
-from dars.components.basic.datepicker import DatePicker
-from dars.components.basic.image import Image
-from dars.components.basic.input import Input
-from dars.components.basic.link import Link
-from dars.components.basic.page import Page
-from dars.components.basic.progressbar import ProgressBar
-from dars.components.basic.radiobutton import RadioButton
-from dars.components.basic.select import Select
-from dars.components.basic.slider import Slider
-from dars.components.basic.spinner import Spinner
-from dars.components.basic.text import Text
-from dars.components.basic.textarea import Textarea
-from dars.components.basic.tooltip import Tooltip
-
-# Advanced Components
-from dars.components.advanced.accordion import Accordion
-from dars.components.advanced.card import Card
-from dars.components.advanced.modal import Modal
-from dars.components.advanced.navbar import Navbar
-from dars.components.advanced.table import Table
-from dars.components.advanced.tabs import Tabs
-
-# Layout
-from dars.components.layout.grid import GridLayout, LayoutBase
-from dars.components.layout.flex import FlexLayout
-from dars.components.layout.anchor import AnchorPoint
+import importlib
+
+_LAZY_ATTRS = {
+    # Core
+    'App': 'dars.core.app',
+    'Component': 'dars.core.component',
+    'EventManager': 'dars.core.events',
+
+    # Basic Components
+    'Button': 'dars.components.basic.button',
+    'Checkbox': 'dars.components.basic.checkbox',
+    'Container': 'dars.components.basic.container',
+    'DatePicker': 'dars.components.basic.datepicker',
+    'Image': 'dars.components.basic.image',
+    'Input': 'dars.components.basic.input',
+    'Link': 'dars.components.basic.link',
+    'Page': 'dars.components.basic.page',
+    'ProgressBar': 'dars.components.basic.progressbar',
+    'RadioButton': 'dars.components.basic.radiobutton',
+    'Select': 'dars.components.basic.select',
+    'Slider': 'dars.components.basic.slider',
+    'Spinner': 'dars.components.basic.spinner',
+    'Text': 'dars.components.basic.text',
+    'Textarea': 'dars.components.basic.textarea',
+    'Tooltip': 'dars.components.basic.tooltip',
+    'Cached': 'dars.components.basic.cached',
+    'cache': 'dars.components.basic.cached',
+
+    # Advanced Components
+    'Accordion': 'dars.components.advanced.accordion',
+    'Card': 'dars.components.advanced.card',
+    'Modal': 'dars.components.advanced.modal',
+    'Navbar': 'dars.components.advanced.navbar',
+    'Table': 'dars.components.advanced.table',
+    'Tabs': 'dars.components.advanced.tabs',
+
+    # Layout
+    'GridLayout': 'dars.components.layout.grid',
+    'LayoutBase': 'dars.components.layout.grid',
+    'FlexLayout': 'dars.components.layout.flex',
+    'AnchorPoint': 'dars.components.layout.anchor',
+
+    # Page templates (compile once, render many)
+    'PageTemplate': 'dars.exporters.web.page_template',
+    'field': 'dars.exporters.web.page_template',
+
+    # Fragment cache stores
+    'MemoryFragmentStore': 'dars.exporters.web.fragment_cache',
+    'DiskFragmentStore': 'dars.exporters.web.fragment_cache',
+}
 
 # Exporters (optional, for direct use)
 # from dars.exporters.web.html_css_js import HTMLCSSJSExporter
@@ -46,7 +64,22 @@ from dars.components.layout.anchor import AnchorPoint
 __all__ = [
     'App', 'Component', 'EventManager',
     'Button', 'Checkbox', 'Container', 'DatePicker', 'Image', 'Input', 'Link', 'Page', 'ProgressBar',
-    'RadioButton', 'Select', 'Slider', 'Spinner', 'Text', 'Textarea', 'Tooltip',
+    'RadioButton', 'Select', 'Slider', 'Spinner', 'Text', 'Textarea', 'Tooltip', 'Cached', 'cache',
     'Accordion', 'Card', 'Modal', 'Navbar', 'Table', 'Tabs',
     'GridLayout', 'FlexLayout', 'LayoutBase', 'AnchorPoint',
+    'PageTemplate', 'field', 'MemoryFragmentStore', 'DiskFragmentStore',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cachear en el módulo: los siguientes accesos no pasan por __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
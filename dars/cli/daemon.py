@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Dars Daemon - Warm build server that keeps Dars pre-imported between exports
+
+`dars daemon` escucha en un socket Unix; `dars export` le reenvía el trabajo y
+cada petición se ejecuta en un proceso hijo (fork) para aislar el código del
+usuario. El hijo adopta el entorno del cliente (variables, cwd y PYTHONPATH); si el
+cliente usa otro Dars u otra versión de Python que el daemon, la petición se rechaza.
+Si el daemon no está corriendo o rechaza la petición, `dars export` exporta en el proceso.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Any, Dict, Optional
+
+PROTOCOL_VERSION = 3
+
+# Directorio del paquete dars: el daemon solo sirve a clientes que usan el mismo
+DARS_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_socket_path() -> str:
+    """Ruta del socket: $DARS_DAEMON_SOCKET o ~/.dars/daemon.sock"""
+    custom = os.environ.get('DARS_DAEMON_SOCKET')
+    if custom:
+        return custom
+    return os.path.join(os.path.expanduser('~'), '.dars', 'daemon.sock')
+
+
+def daemon_supported() -> bool:
+    return hasattr(os, 'fork') and hasattr(socket, 'AF_UNIX')
+
+
+def _send_message(sock: socket.socket, message: Dict[str, Any]):
+    sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+def _recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    with sock.makefile('rb') as stream:
+        line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line.decode('utf-8'))
+
+
+def send_request(message: Dict[str, Any], socket_path: Optional[str] = None,
+                 timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Envía una petición al daemon; devuelve None si no hay daemon escuchando"""
+    if not daemon_supported():
+        return None
+    path = socket_path or get_socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(2.0)
+        sock.connect(path)
+        sock.settimeout(timeout)
+        message = dict(message, version=PROTOCOL_VERSION)
+        _send_message(sock, message)
+        response = _recv_message(sock)
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+    if response is None or response.get('version') != PROTOCOL_VERSION:
+        return None
+    return response
+
+
+def forward_export(file_path: str, format_name: str, output_path: str, atomic: bool = False,
+                   socket_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Reenvía un `dars export` al daemon. None significa 'exportar en el proceso'"""
+    if os.environ.get('DARS_NO_DAEMON'):
+        return None
+    response = send_request({
+        'command': 'export',
+        'file': os.path.abspath(file_path),
+        'format': format_name,
+        'output': os.path.abspath(output_path),
+        'atomic': atomic,
+        'cwd': os.getcwd(),
+        'env': dict(os.environ),
+        'dars_path': DARS_PACKAGE_DIR,
+        'python': list(sys.version_info[:2]),
+    }, socket_path=socket_path)
+    if response is not None and response.get('fallback'):
+        return None
+    return response
+
+
+def _pythonpath_entries(env: Dict[str, str]) -> list:
+    return [os.path.abspath(entry) for entry in env.get('PYTHONPATH', '').split(os.pathsep) if entry]
+
+
+class BuildDaemon:
+    """Intérprete caliente con los módulos de Dars ya importados"""
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or get_socket_path()
+        self.started_at = time.time()
+        self.requests_served = 0
+        self.warmup_ms = 0.0
+        self._children = set()
+        self._running = False
+
+    def warm_up(self):
+        """Importa Dars, el exportador y bs4, y hace una exportación de calentamiento"""
+        import tempfile
+        started = time.perf_counter()
+        import dars.all  # noqa: F401
+        from dars.all import App, Container, Text
+        from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+        import dars.cli.main  # noqa: F401
+        app = App(title="warmup")
+        app.set_root(Container(children=[Text("warmup")]))
+        with tempfile.TemporaryDirectory() as tmp, redirect_stdout(io.StringIO()):
+            HTMLCSSJSExporter().export(app, tmp)
+        self.warmup_ms = (time.perf_counter() - started) * 1000
+
+    def _bind(self) -> socket.socket:
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            if send_request({'command': 'ping'}, socket_path=self.socket_path) is not None:
+                raise RuntimeError(f"A Dars daemon is already listening on {self.socket_path}")
+            os.unlink(self.socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        server.settimeout(1.0)
+        return server
+
+    def serve_forever(self):
+        server = self._bind()
+        self._running = True
+        try:
+            while self._running:
+                self._reap_children()
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+                try:
+                    self._handle(conn, server)
+                except Exception:
+                    traceback.print_exc()
+                finally:
+                    conn.close()
+        finally:
+            server.close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._reap_children(block=True)
+
+    def _reap_children(self, block: bool = False):
+        for pid in list(self._children):
+            try:
+                done, _ = os.waitpid(pid, 0 if block else os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done:
+                self._children.discard(pid)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'ok': True,
+            'version': PROTOCOL_VERSION,
+            'pid': os.getpid(),
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'requests_served': self.requests_served,
+            'warmup_ms': round(self.warmup_ms, 1),
+            'python': sys.version.split()[0],
+        }
+
+    def _handle(self, conn: socket.socket, server: socket.socket):
+        conn.settimeout(5.0)
+        request = _recv_message(conn)
+        if request is None:
+            return
+        if request.get('version') != PROTOCOL_VERSION:
+            _send_message(conn, {'ok': False, 'version': PROTOCOL_VERSION, 'error': 'protocol mismatch'})
+            return
+        command = request.get('command')
+        if command in ('ping', 'status'):
+            _send_message(conn, self.status())
+            return
+        if command == 'shutdown':
+            self._running = False
+            _send_message(conn, dict(self.status(), stopping=True))
+            return
+        if command != 'export':
+            _send_message(conn, {'ok': False, 'version': PROTOCOL_VERSION, 'error': f'unknown command {command!r}'})
+            return
+        mismatch = self._environment_mismatch(request)
+        if mismatch:
+            # Los módulos ya importados no son los del cliente: que exporte en su proceso
+            _send_message(conn, {'ok': False, 'version': PROTOCOL_VERSION, 'fallback': True, 'error': mismatch})
+            return
+
+        self.requests_served += 1
+        pid = os.fork()
+        if pid:
+            self._children.add(pid)
+            return
+        # Proceso hijo: estado aislado, el padre sigue limpio para la siguiente petición
+        status = 0
+        try:
+            server.close()
+            conn.settimeout(None)
+            _send_message(conn, self._run_export(request))
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    @staticmethod
+    def _environment_mismatch(request: Dict[str, Any]) -> Optional[str]:
+        """Motivo por el que el cliente no puede usar este intérprete, o None"""
+        if request.get('dars_path') != DARS_PACKAGE_DIR:
+            return f"client uses dars from {request.get('dars_path')}, daemon from {DARS_PACKAGE_DIR}"
+        if request.get('python') != list(sys.version_info[:2]):
+            return f"client runs Python {request.get('python')}, daemon {list(sys.version_info[:2])}"
+        return None
+
+    @staticmethod
+    def _adopt_environment(request: Dict[str, Any]):
+        """En el hijo: entorno, PYTHONPATH y cwd del cliente en lugar de los del daemon"""
+        env = request.get('env')
+        if env is not None:
+            own_entries = set(_pythonpath_entries(os.environ))
+            client_entries = _pythonpath_entries(env)
+            sys.path[:] = client_entries + [entry for entry in sys.path
+                                            if entry not in own_entries and entry not in client_entries]
+            os.environ.clear()
+            os.environ.update(env)
+        os.chdir(request.get('cwd') or os.getcwd())
+
+    def _run_export(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        output = io.StringIO()
+        response: Dict[str, Any] = {'ok': False, 'version': PROTOCOL_VERSION}
+        try:
+            self._adopt_environment(request)
+            file_dir = os.path.dirname(request['file'])
+            if file_dir not in sys.path:
+                sys.path.insert(0, file_dir)
+            with redirect_stdout(output), redirect_stderr(output):
+                from dars.cli.main import DarsExporter
+                exporter = DarsExporter()
+                app = exporter.load_app_from_file(request['file'])
+                if app is not None and exporter.validate_app(app):
+                    format_name = request.get('format', 'html')
+                    if format_name not in exporter.exporters:
+                        response['error'] = f"format '{format_name}' not supported"
+                    else:
+                        options = {'atomic': True} if request.get('atomic') else {}
+                        response['ok'] = bool(exporter.exporters[format_name].export(app, request['output'], **options))
+                        response['title'] = app.title
+                        response['stats'] = app.get_stats()
+        except Exception as e:
+            response['error'] = f"{e}\n{traceback.format_exc()}"
+        response['output'] = output.getvalue()
+        response['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return response
+
+
+def run_daemon(socket_path: Optional[str] = None) -> bool:
+    """Arranca el daemon en primer plano hasta Ctrl+C o `dars daemon stop`"""
+    daemon = BuildDaemon(socket_path)
+    daemon.warm_up()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return True
+
+
+if __name__ == "__main__":
+    if not daemon_supported():
+        print("The Dars daemon requires a platform with fork() and Unix sockets")
+        sys.exit(1)
+    run_daemon(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -31,3 +31,53 @@ class FileWatcher:
             except Exception:
                 pass
             time.sleep(self.poll_interval)
+
+
+class TreeWatcher:
+    """Polls every matching file under a directory and reports which ones changed.
+
+    Unlike FileWatcher it also notices helper modules imported by the app and
+    files that are created or deleted between polls.
+    """
+    def __init__(self, root, extensions=('.py',), ignore=(), poll_interval=0.5):
+        self.root = os.path.abspath(root)
+        self.extensions = tuple(extensions)
+        self.ignore = [os.path.abspath(path) for path in ignore]
+        self.poll_interval = poll_interval
+        self._mtimes = self._scan()
+
+    def _ignored(self, path):
+        return any(path == ignored or path.startswith(ignored + os.sep) for ignored in self.ignore)
+
+    def _scan(self):
+        mtimes = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith('.') and d != '__pycache__' and not self._ignored(os.path.join(dirpath, d))
+            ]
+            for filename in filenames:
+                if filename.endswith(self.extensions):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        mtimes[path] = os.stat(path).st_mtime_ns
+                    except OSError:
+                        pass
+        return mtimes
+
+    def poll(self):
+        """Returns the sorted list of paths created, modified or deleted since the last poll."""
+        current = self._scan()
+        changed = {path for path, mtime in current.items() if self._mtimes.get(path) != mtime}
+        changed.update(path for path in self._mtimes if path not in current)
+        self._mtimes = current
+        return sorted(changed)
+
+    def wait_for_changes(self, stop_event=None):
+        """Blocks until something changes (or stop_event is set) and returns the changed paths."""
+        while stop_event is None or not stop_event.is_set():
+            time.sleep(self.poll_interval)
+            changed = self.poll()
+            if changed:
+                return changed
+        return []
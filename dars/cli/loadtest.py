@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Dars Load Test - HTTP load generator for `dars serve` and other local servers
+
+Usage:
+    python -m dars.cli.loadtest http://127.0.0.1:8000/ --concurrency 50 --duration 10
+    python -m dars.cli.loadtest --serve ./dist --path / --path /styles.css
+"""
+
+import asyncio
+import json
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Optional
+
+
+class LoadTestResult:
+    """Resultados agregados de una ejecución de carga"""
+
+    def __init__(self, latencies: List[float], errors: int, elapsed: float, bytes_received: int,
+                 status_counts: Dict[int, int]):
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+        self.bytes_received = bytes_received
+        self.status_counts = status_counts
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Percentil de latencia en milisegundos"""
+        if not self.latencies:
+            return 0.0
+        index = min(len(self.latencies) - 1, int(round(q * (len(self.latencies) - 1))))
+        return self.latencies[index] * 1000
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'elapsed_seconds': round(self.elapsed, 3),
+            'requests_per_second': round(self.requests_per_second, 1),
+            'bytes_received': self.bytes_received,
+            'status_counts': {str(k): v for k, v in sorted(self.status_counts.items())},
+            'latency_ms': {
+                'p50': round(self.percentile(0.50), 3),
+                'p90': round(self.percentile(0.90), 3),
+                'p99': round(self.percentile(0.99), 3),
+                'max': round(self.latencies[-1] * 1000, 3) if self.latencies else 0.0,
+            },
+        }
+
+
+async def _read_response(reader: asyncio.StreamReader, head_only: bool):
+    head = await reader.readuntil(b'\r\n\r\n')
+    status_line, _, rest = head.decode('latin-1').partition('\r\n')
+    status = int(status_line.split(' ')[1])
+    length = 0
+    keep_alive = True
+    for line in rest.split('\r\n'):
+        name, _, value = line.partition(':')
+        name = name.strip().lower()
+        if name == 'content-length':
+            length = int(value.strip())
+        elif name == 'connection' and value.strip().lower() == 'close':
+            keep_alive = False
+    if length and not head_only:
+        await reader.readexactly(length)
+    return status, length, keep_alive
+
+
+async def _worker(host: str, port: int, requests: List[bytes], deadline: float, max_requests: Optional[int],
+                  counter: List[int], latencies: List[float], stats: Dict[str, object], head_only: bool):
+    reader = writer = None
+    index = 0
+    while time.perf_counter() < deadline:
+        if max_requests is not None:
+            if counter[0] >= max_requests:
+                break
+            counter[0] += 1
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            request = requests[index % len(requests)]
+            index += 1
+            started = time.perf_counter()
+            writer.write(request)
+            status, length, keep_alive = await _read_response(reader, head_only)
+            latencies.append(time.perf_counter() - started)
+            stats['bytes'] += length
+            stats['status'][status] = stats['status'].get(status, 0) + 1
+            if not keep_alive:
+                writer.close()
+                reader = writer = None
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+            stats['errors'] += 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load_test(url: str, paths: Optional[List[str]] = None, concurrency: int = 50,
+                        duration: float = 10.0, max_requests: Optional[int] = None,
+                        headers: Optional[Dict[str, str]] = None, method: str = 'GET') -> LoadTestResult:
+    """Lanza `concurrency` conexiones keep-alive contra `url` durante `duration` segundos"""
+    parts = urllib.parse.urlsplit(url)
+    host = parts.hostname or '127.0.0.1'
+    port = parts.port or 80
+    paths = paths or [parts.path or '/']
+    extra = ''.join(f'{k}: {v}\r\n' for k, v in (headers or {}).items())
+    requests = [
+        f'{method} {path} HTTP/1.1\r\nHost: {host}:{port}\r\n{extra}\r\n'.encode('latin-1')
+        for path in paths
+    ]
+    latencies: List[float] = []
+    stats: Dict[str, object] = {'bytes': 0, 'errors': 0, 'status': {}}
+    counter = [0]
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _worker(host, port, requests, deadline, max_requests, counter, latencies, stats, method == 'HEAD')
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+    return LoadTestResult(latencies, stats['errors'], elapsed, stats['bytes'], stats['status'])
+
+
+class LocalServeInstance:
+    """Levanta un `StaticServer` en un hilo con puerto efímero para medirlo"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.port = None
+        self._loop = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        from dars.cli.serve import StaticServer
+
+        async def main():
+            self._server = StaticServer(self.directory, port=0)
+            await self._server.start()
+            self.port = self._server.port
+            self._loop = asyncio.get_running_loop()
+            self._ready.set()
+            await self._server.serve_forever()
+
+        try:
+            asyncio.run(main())
+        except asyncio.CancelledError:
+            pass
+
+    def __enter__(self) -> 'LocalServeInstance':
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *exc):
+        def cancel_all():
+            for task in asyncio.all_tasks(self._loop):
+                task.cancel()
+        self._loop.call_soon_threadsafe(cancel_all)
+        self._thread.join(timeout=5)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.port}/'
+
+
+def print_result(result: LoadTestResult, title: str = "Load test"):
+    from rich.console import Console
+    from rich.table import Table
+
+    data = result.to_dict()
+    table = Table(title=title)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="white", justify="right")
+    table.add_row("Requests", str(data['requests']))
+    table.add_row("Errors", str(data['errors']))
+    table.add_row("Requests/sec", f"{data['requests_per_second']:.1f}")
+    for name in ('p50', 'p90', 'p99', 'max'):
+        table.add_row(f"Latency {name}", f"{data['latency_ms'][name]:.3f} ms")
+    table.add_row("Status codes", ", ".join(f"{k}: {v}" for k, v in data['status_counts'].items()))
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Dars Load Test - requests/sec and latency percentiles")
+    parser.add_argument("url", nargs="?", help="Base URL of a running server")
+    parser.add_argument("--serve", metavar="DIR", help="Start a local `dars serve` instance for DIR and test it")
+    parser.add_argument("--path", action="append", help="Path to request (repeatable, round-robin)")
+    parser.add_argument("--concurrency", "-c", type=int, default=50)
+    parser.add_argument("--duration", "-d", type=float, default=10.0)
+    parser.add_argument("--requests", "-n", type=int, default=None, help="Stop after N requests")
+    parser.add_argument("--header", "-H", action="append", default=[], help="Extra header 'Name: value'")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    if not args.url and not args.serve:
+        parser.error("a URL or --serve DIR is required")
+    extra_headers = dict(h.split(':', 1) for h in args.header)
+    extra_headers = {k.strip(): v.strip() for k, v in extra_headers.items()}
+
+    def execute(url):
+        return asyncio.run(run_load_test(url, args.path, args.concurrency, args.duration,
+                                         args.requests, extra_headers))
+
+    if args.serve:
+        with LocalServeInstance(args.serve) as instance:
+            result = execute(instance.url)
+    else:
+        result = execute(args.url)
+
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_result(result)
+    sys.exit(1 if result.errors else 0)
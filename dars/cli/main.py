@@ -1,37 +1,45 @@
 #!/usr/bin/env python3
 """
 Dars Exporter - Command line tool for exporting Dars applications
+
+Los imports pesados (rich, el exportador, los componentes, bs4) se hacen en el
+primer uso para que `dars --help` y el reenvío al daemon arranquen rápido.
 """
+from __future__ import annotations
+
 import shutil
-import subprocess
-import venv
-from rich.prompt import Confirm
-from rich.syntax import Syntax
 import argparse
 import os
 import sys
-import time
 import importlib.util
 from pathlib import Path
-from typing import Optional, Dict, Any
-
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich.markdown import Markdown
-from rich import print as rprint
-from importlib import resources
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 # Importar exportadores
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dars.core.app import App
-from dars.exporters.web.html_css_js import HTMLCSSJSExporter
 from dars.cli.translations import translator
 
-console = Console()
+if TYPE_CHECKING:
+    from dars.core.app import App
+
+
+class _LazyConsole:
+    """Proxy que crea la Console de Rich en el primer uso"""
+    _console = None
+
+    def resolve(self):
+        """Devuelve la Console real (para APIs de Rich que la usan como context manager)"""
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return _LazyConsole._console
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+
+console = _LazyConsole()
 
 class RichHelpFormatter(argparse.HelpFormatter):
     """Custom formatter for argparse help using Rich"""
@@ -58,6 +66,10 @@ class RichHelpFormatter(argparse.HelpFormatter):
     
     @classmethod
     def rich_print_help(cls, parser, console=console):
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+        from rich.table import Table
+        from rich.text import Text
         # Get the standard help text
         help_text = parser.format_help()
         
@@ -141,6 +153,7 @@ class RichHelpFormatter(argparse.HelpFormatter):
 
 def _print_arguments_table(content):
     """Prints a table of arguments from the text content"""
+    from rich.table import Table
     table = Table(show_header=False, box=None, padding=(0, 2, 0, 0), expand=True)
     table.add_column(translator.get('argument_column'), style="bold green", width=30, no_wrap=True)
     table.add_column(translator.get('description_column'), style="dim white", overflow="fold")
@@ -203,9 +216,17 @@ class DarsExporter:
     """Exportador principal de Dars"""
     
     def __init__(self):
-        self.exporters = {
-            'html': HTMLCSSJSExporter()
-        }
+        self._exporters = None
+
+    @property
+    def exporters(self) -> Dict[str, Any]:
+        """Exportadores disponibles, instanciados en el primer uso"""
+        if self._exporters is None:
+            from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+            self._exporters = {
+                'html': HTMLCSSJSExporter()
+            }
+        return self._exporters
         
     def load_app_from_file(self, file_path: str) -> Optional[App]:
         """Loads a Dars application from a Python file"""
@@ -230,6 +251,7 @@ class DarsExporter:
             spec.loader.exec_module(module)
             
             # Look for the 'app' variable in the module
+            from dars.core.app import App
             if hasattr(module, 'app') and isinstance(module.app, App):
                 return module.app
             else:
@@ -252,7 +274,9 @@ class DarsExporter:
             
         return True
         
-    def export_app(self, app: App, format_name: str, output_path: str, show_preview: bool = False) -> bool:
+    def export_app(self, app: App, format_name: str, output_path: str, show_preview: bool = False,
+                   profiler=None, partition=None, atomic: bool = False, precompress: bool = False,
+                   bundle=None) -> bool:
         """Exports an application to the specified format"""
         
         if format_name not in self.exporters:
@@ -261,41 +285,55 @@ class DarsExporter:
             return False
             
         exporter = self.exporters[format_name]
+        from contextlib import nullcontext
+        from dars.exporters.archive_writer import archive_format
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
         
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
-            console=console
+            console=console.resolve()
         ) as progress:
             
             # Validation task
-            task1 = progress.add_task(translator.get('validating_app'), total=100)
-            progress.update(task1, advance=30)
-            
-            if not self.validate_app(app):
-                progress.update(task1, completed=100)
+            task1 = progress.add_task(translator.get('validating_app'), total=1)
+            with profiler.phase('validate') if profiler else nullcontext():
+                valid = self.validate_app(app)
+            progress.update(task1, completed=1)
+            if not valid:
                 return False
-                
-            progress.update(task1, advance=70)
             
-            # Export task
-            task2 = progress.add_task(f"{translator.get('exporting_to')} {format_name}...", total=100)
-            progress.update(task2, advance=20)
+            # Export task: el exportador informa de cada paso real (compartidos, páginas, PWA)
+            task2 = progress.add_task(f"{translator.get('exporting_to')} {format_name}...", total=None)
+            def on_progress(completed, total, _description):
+                progress.update(task2, completed=completed, total=total)
             
             try:
-                success = exporter.export(app, output_path)
-                progress.update(task2, advance=80)
+                options = {'on_progress': on_progress}
+                if partition is not None:
+                    options['partition'] = partition
+                if atomic:
+                    options['atomic'] = True
+                if bundle is not None:
+                    options['bundle'] = bundle
+                with profiler.attach(exporter) if profiler else nullcontext():
+                    if archive_format(output_path) is not None:
+                        success = exporter.export_archive(app, output_path, precompress=precompress, bundle=bundle,
+                                                          on_progress=on_progress)
+                    else:
+                        success = exporter.export(app, output_path, **options)
                 
                 if success:
-                    progress.update(task1, completed=100)
-                    progress.update(task2, completed=100)
+                    progress.update(task2, completed=1, total=1)
                     
                     # Show success information
-                    self.show_export_success(app, format_name, output_path)
+                    self.show_export_success(app, format_name, output_path,
+                                             footer=self._write_stats_footer(success)
+                                             + self._bundle_footer(success))
                     
-                    if show_preview and format_name == 'html':
+                    if show_preview and format_name == 'html' and archive_format(output_path) is None:
                         self.show_preview_info(output_path)
                         
                     return True
@@ -306,9 +344,19 @@ class DarsExporter:
             except Exception as e:
                 console.print(f"[red]{translator.get('error_during_export_exception')}: {e}[/red]")
                 return False
+
+    def show_profile(self, profiler, json_path: str, trace_path: Optional[str] = None):
+        """Prints the export profile and saves it as JSON (and optionally as a Chrome trace)"""
+        profiler.print_report(console.resolve())
+        profiler.write_json(json_path)
+        console.print(f"[green]{translator.get('profile_saved')}: {json_path}[/green]")
+        if trace_path:
+            profiler.write_chrome_trace(trace_path)
+            console.print(f"[green]{translator.get('trace_saved')}: {trace_path}[/green]")
                 
     def show_supported_formats(self):
         """Shows supported formats"""
+        from rich.table import Table
         table = Table(title=translator.get('supported_export_formats'))
         table.add_column(translator.get('format_name'), style="cyan")
         table.add_column(translator.get('format_description'), style="white")
@@ -323,14 +371,47 @@ class DarsExporter:
             
         console.print(table)
         
-    def show_export_success(self, app: App, format_name: str, output_path: str):
+    def show_export_success(self, app: App, format_name: str, output_path: str, footer: str = ""):
         """Shows export success information"""
-        stats = app.get_stats()
-        
+        self.show_export_summary(app.title, app.get_stats(), format_name, output_path, footer=footer)
+
+    @staticmethod
+    def _write_stats_footer(result) -> str:
+        """Bytes written vs. skipped by the export's output writer, if the result has them"""
+        stats = getattr(result, 'write_stats', None)
+        if stats is None:
+            return ""
+        from dars.exporters.profiler import format_bytes
+        line = translator.get('output_write_stats', written=stats.files_written,
+                              written_size=format_bytes(stats.bytes_written),
+                              skipped=stats.files_skipped, skipped_size=format_bytes(stats.bytes_skipped))
+        return f"\n[dim]{line}[/dim]\n"
+
+    @staticmethod
+    def _bundle_footer(result) -> str:
+        """Page sizes of a --bundle export and the assets that were not inlined"""
+        report = getattr(result, 'bundle_report', None)
+        if report is None or not report.pages:
+            return ""
+        from dars.exporters.profiler import format_bytes
+        largest = report.largest
+        footer = translator.get('bundle_stats', pages=len(report.pages), total=format_bytes(report.total_bytes),
+                                largest=format_bytes(largest['bytes']), file=largest['file'])
+        footer = f"[dim]{footer}[/dim]\n"
+        external = sorted({asset for page in report.pages for asset in page['external']})
+        if external:
+            shown = ', '.join(external[:5]) + (', ...' if len(external) > 5 else '')
+            footer += f"[yellow]{translator.get('bundle_external', count=len(external), assets=shown)}[/yellow]\n"
+        return footer
+
+    def show_export_summary(self, title: str, stats: Dict[str, Any], format_name: str, output_path: str,
+                            footer: str = ""):
+        """Shows the export success panel from an app title and its stats"""
+        from rich.panel import Panel
         panel_content = f"""
 [green]✓[/green] {translator.get('export_completed_successfully')}
 
-[bold]{translator.get('application')}:[/bold] {app.title}
+[bold]{translator.get('application')}:[/bold] {title}
 [bold]{translator.get('format')}:[/bold] {format_name}
 [bold]{translator.get('output_directory')}:[/bold] {output_path}
 
@@ -339,10 +420,85 @@ class DarsExporter:
 • {translator.get('max_depth')}: {stats['max_depth']}
 • {translator.get('scripts')}: {stats['scripts_count']}
 • {translator.get('global_styles')}: {stats['global_styles_count']}
-"""
+{footer}"""
         
         console.print(Panel(panel_content, title=translator.get('export_successful'), border_style="green"))
+
+    def export_via_daemon(self, file_path: str, format_name: str, output_path: str, show_preview: bool = False,
+                          atomic: bool = False) -> Optional[bool]:
+        """Forwards the export to a running `dars daemon`. Returns None if no daemon answered."""
+        from dars.cli.daemon import forward_export
+        result = forward_export(file_path, format_name, output_path, atomic=atomic)
+        if result is None:
+            return None
+        print_banner()
+        if result.get('output'):
+            console.out(result['output'], end="", highlight=False)
+        if result.get('error'):
+            console.print(f"[red]{translator.get('error_during_export_exception')}: {result['error']}[/red]")
+        if not result.get('ok'):
+            return False
+        footer = f"\n[dim]{translator.get('daemon_export_time', ms=result.get('elapsed_ms', 0))}[/dim]\n"
+        self.show_export_summary(result['title'], result['stats'], format_name, output_path, footer=footer)
+        if show_preview and format_name == 'html':
+            self.show_preview_info(output_path)
+        return True
         
+    def watch_export(self, file_path: str, format_name: str, output_path: str) -> bool:
+        """Exports once and then rebuilds incrementally on every change until Ctrl+C"""
+        if format_name not in self.exporters:
+            console.print(f"[red]{translator.get('error_format_not_supported')} '{format_name}'[/red]")
+            self.show_supported_formats()
+            return False
+        from dars.cli.hot_reload import TreeWatcher
+        from dars.exporters.incremental import IncrementalBuilder
+
+        builder = IncrementalBuilder(self.exporters[format_name], output_path)
+        app_dir = os.path.dirname(os.path.abspath(file_path))
+        watcher = TreeWatcher(app_dir, ignore=[output_path])
+
+        app = self._watch_rebuild(builder, file_path, app_dir)
+        if app is not None:
+            self.show_export_success(app, format_name, output_path)
+        console.print(f"[cyan]{translator.get('watching_for_changes', path=app_dir)}[/cyan]")
+        try:
+            while True:
+                changed = watcher.wait_for_changes()
+                names = ", ".join(os.path.relpath(path, app_dir) for path in changed)
+                console.print(f"[yellow]{translator.get('watch_change_detected')}: {names}[/yellow]")
+                self._watch_rebuild(builder, file_path, app_dir)
+        except KeyboardInterrupt:
+            console.print(f"\n[cyan]{translator.get('watch_stopped')}[/cyan]")
+        return True
+
+    def _watch_rebuild(self, builder, file_path: str, app_dir: str) -> Optional[App]:
+        """Reloads the app (and its local modules) and rebuilds only what changed"""
+        # Olvidar los módulos locales del usuario para que sus cambios también se recarguen
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, '__file__', None) or ''
+            if module_file.startswith(app_dir + os.sep) and not name.startswith('dars.'):
+                del sys.modules[name]
+        app = self.load_app_from_file(file_path)
+        if app is None or not self.validate_app(app):
+            console.print(f"[red]{translator.get('watch_rebuild_failed')}[/red]")
+            return None
+        try:
+            report = builder.build(app)
+        except Exception as e:
+            console.print(f"[red]{translator.get('error_during_export_exception')}: {e}[/red]")
+            console.print(f"[red]{translator.get('watch_rebuild_failed')}[/red]")
+            return None
+        console.print(translator.get(
+            'watch_rebuild_summary',
+            ms=f"{report.elapsed_ms:.1f}",
+            rendered=report.pages_rendered,
+            skipped=report.pages_skipped,
+            written=report.files_written,
+            unchanged=report.files_unchanged,
+            removed=report.files_removed,
+        ))
+        return app
+
     def show_preview_info(self, output_path: str):
         """Shows information about how to preview the application"""
         index_path = os.path.join(output_path, "index.html")
@@ -357,6 +513,7 @@ class DarsExporter:
         stats = app.get_stats()
         
         # Basic information
+        from rich.table import Table
         info_table = Table(title=f"{translator.get('app_information')}: {app.title}")
         info_table.add_column(translator.get('property_column'), style="cyan")
         info_table.add_column(translator.get('value_column'), style="white")
@@ -426,6 +583,7 @@ app.set_root(container)
 app.add_script(script)
 """
         """Initializes a base Dars project, optionally using a template"""
+        from rich.syntax import Syntax
         if os.path.exists(name):
             console.print(f"[red]❌ {translator.get('directory_exists').format(name=name)}[/red]")
             return
@@ -456,6 +614,33 @@ app.add_script(script)
         console.print(Syntax(f"dars preview build", "bash")) 
     
 
+def parse_partition(value: str):
+    """Convierte 'K/N' (parte K de N, empezando en 0) en la tupla (K, N)"""
+    try:
+        k, n = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(translator.get('partition_invalid').format(value=value))
+    if not 0 <= k < n:
+        raise argparse.ArgumentTypeError(translator.get('partition_invalid').format(value=value))
+    return k, n
+
+
+def parse_size(value: str) -> int:
+    """Convierte '150000', '150k' o '2m' en bytes"""
+    text = value.strip().lower()
+    multiplier = 1
+    if text[-1:] in ('k', 'm'):
+        multiplier = 1024 if text[-1] == 'k' else 1024 * 1024
+        text = text[:-1]
+    try:
+        size = int(float(text) * multiplier)
+    except ValueError:
+        raise argparse.ArgumentTypeError(translator.get('size_invalid').format(value=value))
+    if size < 0:
+        raise argparse.ArgumentTypeError(translator.get('size_invalid').format(value=value))
+    return size
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Creates the command line argument parser"""
     parser = argparse.ArgumentParser(
@@ -480,6 +665,42 @@ def create_parser() -> argparse.ArgumentParser:
                               help=translator.get('output_help'))
     export_parser.add_argument('--preview', '-p', action='store_true',
                               help=translator.get('preview_help'))
+    export_parser.add_argument('--no-daemon', action='store_true',
+                              help=translator.get('no_daemon_help'))
+    export_parser.add_argument('--watch', '-w', action='store_true',
+                              help=translator.get('watch_help'))
+    export_parser.add_argument('--profile', action='store_true',
+                              help=translator.get('profile_help'))
+    export_parser.add_argument('--profile-output', default='dars-profile.json', metavar='PATH',
+                              help=translator.get('profile_output_help'))
+    export_parser.add_argument('--trace', metavar='PATH',
+                              help=translator.get('trace_help'))
+    export_parser.add_argument('--memory-report', action='store_true',
+                              help=translator.get('memory_report_help'))
+    export_parser.add_argument('--release-pages', action='store_true',
+                              help=translator.get('release_pages_help'))
+    export_parser.add_argument('--partition', type=parse_partition, metavar='K/N',
+                              help=translator.get('partition_help'))
+    export_parser.add_argument('--atomic', action='store_true',
+                              help=translator.get('atomic_help'))
+    export_parser.add_argument('--precompress', action='store_true',
+                              help=translator.get('archive_precompress_help'))
+    export_parser.add_argument('--bundle', action='store_true',
+                              help=translator.get('bundle_help'))
+    export_parser.add_argument('--max-page-size', type=parse_size, metavar='SIZE',
+                              help=translator.get('max_page_size_help'))
+    export_parser.add_argument('--inline-limit', type=parse_size, default=8192, metavar='SIZE',
+                              help=translator.get('inline_limit_help'))
+    export_parser.add_argument('--critical-css', type=int, nargs='?', const=3, metavar='N',
+                              help=translator.get('critical_css_help'))
+    export_parser.add_argument('--no-resource-hints', action='store_true',
+                              help=translator.get('no_resource_hints_help'))
+    export_parser.add_argument('--no-defer', action='store_true',
+                              help=translator.get('no_defer_help'))
+    export_parser.add_argument('--client-router', action='store_true',
+                              help=translator.get('client_router_help'))
+    export_parser.add_argument('--islands', action='store_true',
+                              help=translator.get('islands_help'))
     
     # Info command
     info_parser = subparsers.add_parser('info', help=translator.get('info_help'))
@@ -492,6 +713,20 @@ def create_parser() -> argparse.ArgumentParser:
     preview_parser = subparsers.add_parser('preview', help=translator.get('preview_cmd_help'))
     preview_parser.add_argument('path', help=translator.get('path_help'))
 
+    # Serve command (servidor estático de producción)
+    serve_parser = subparsers.add_parser('serve', help=translator.get('serve_help'))
+    serve_parser.add_argument('path', help=translator.get('path_help'))
+    serve_parser.add_argument('--host', default='127.0.0.1', help=translator.get('host_help'))
+    serve_parser.add_argument('--port', '-p', type=int, default=8000, help=translator.get('port_help'))
+    serve_parser.add_argument('--precompress', action='store_true', help=translator.get('precompress_help'))
+    serve_parser.add_argument('--access-log', action='store_true', help=translator.get('access_log_help'))
+
+    # Daemon command (intérprete caliente para exportaciones rápidas)
+    daemon_parser = subparsers.add_parser('daemon', help=translator.get('daemon_help'))
+    daemon_parser.add_argument('action', nargs='?', choices=['start', 'stop', 'status'], default='start',
+                              help=translator.get('daemon_action_help'))
+    daemon_parser.add_argument('--socket', help=translator.get('daemon_socket_help'))
+
     # Init command
     init_parser = subparsers.add_parser('init', help=translator.get('init_help'))
     init_parser.add_argument('name', help=translator.get('name_help'))
@@ -502,7 +737,7 @@ def create_parser() -> argparse.ArgumentParser:
         help=translator.get('template_help')
     )
     # Add language option to all subparsers
-    for subparser in [export_parser, info_parser, formats_parser, preview_parser, init_parser]:
+    for subparser in [export_parser, info_parser, formats_parser, preview_parser, serve_parser, daemon_parser, init_parser]:
         subparser.add_argument('--lang', '-l', choices=['en', 'es'], default='en',
                               help=translator.get('lang_help'))
     
@@ -512,6 +747,7 @@ def list_templates() -> Dict[str, Path]:
         Busca carpetas dentro de dars/templates/examples y devuelve un dict
         { "basic/hello_world.py": Path(...), ... }
         """
+        from importlib import resources
         tmpl_root = Path(resources.files("dars.templates") / "examples")
         templates = {}
         for category in tmpl_root.iterdir():
@@ -520,6 +756,17 @@ def list_templates() -> Dict[str, Path]:
                     key = f"{category.name}/{py.stem}"
                     templates[key] = py
         return templates
+def print_banner(subtitle_key: str = 'cli_subtitle'):
+    """Prints the CLI header (rich.panel is imported here, not at startup)"""
+    from rich.panel import Panel
+    from rich.text import Text
+    console.print(Panel(
+        Text("Dars Exporter", style="bold cyan", justify="center"),
+        subtitle=translator.get(subtitle_key),
+        border_style="cyan"
+    ))
+
+
 def main():
     """Main CLI function"""
     # Check for language parameter before parsing arguments
@@ -536,11 +783,7 @@ def main():
         parser = create_parser()
         
         # Show banner
-        console.print(Panel(
-            Text("Dars Exporter", style="bold cyan", justify="center"),
-            subtitle=translator.get('main_description'),
-            border_style="cyan"
-        ))
+        print_banner('main_description')
         
         # If it's general help
         if len(sys.argv) == 1 or (len(sys.argv) == 2 and (sys.argv[1] == '-h' or sys.argv[1] == '--help')):
@@ -567,26 +810,99 @@ def main():
     # This is already handled in the pre-parsing step above, so we don't need to do it again
     # The translator will already have the correct language set
     
-    # Show banner for normal commands
-    console.print(Panel(
-        Text("Dars Exporter", style="bold cyan", justify="center"),
-        subtitle=translator.get('cli_subtitle'),
-        border_style="cyan"
-    ))
-    
     exporter = DarsExporter()
     
     if args.command == 'export':
+        from dars.exporters.archive_writer import archive_format
+        to_archive = archive_format(args.output) is not None
+        # Daemon caliente si está disponible; si no, exportación en el proceso
+        # (el perfilado siempre se hace en este proceso, y las opciones que el daemon no recibe también)
+        in_process_only = (args.release_pages or args.partition is not None or to_archive or args.bundle
+                           or args.critical_css or args.no_resource_hints or args.no_defer or args.client_router
+                           or args.islands)
+        profiling = args.profile or args.trace or args.memory_report
+        may_forward = not (args.no_daemon or args.watch or profiling or in_process_only)
+        # Si se puede reenviar, la cabecera se imprime cuando responde el daemon (o al ver
+        # que no hay): así rich no se importa antes de reenviar
+        if not may_forward:
+            print_banner()
+        if args.atomic and args.partition is not None:
+            console.print(f"[red]{translator.get('atomic_partition')}[/red]")
+            sys.exit(1)
+        if to_archive and (args.partition is not None or args.watch or args.atomic):
+            console.print(f"[red]{translator.get('archive_unsupported')}[/red]")
+            sys.exit(1)
+        if args.bundle and args.watch:
+            console.print(f"[red]{translator.get('bundle_watch')}[/red]")
+            sys.exit(1)
+        if args.bundle and args.critical_css:
+            console.print(f"[red]{translator.get('critical_css_bundle')}[/red]")
+            sys.exit(1)
+        if args.bundle and args.client_router:
+            console.print(f"[red]{translator.get('client_router_bundle')}[/red]")
+            sys.exit(1)
+        if args.islands and (args.bundle or args.client_router):
+            console.print(f"[red]{translator.get('islands_unsupported')}[/red]")
+            sys.exit(1)
+        if args.format in exporter.exporters:
+            html_exporter = exporter.exporters[args.format]
+            if args.critical_css:
+                html_exporter.critical_css = args.critical_css
+            if args.no_resource_hints:
+                html_exporter.resource_hints = False
+            if args.no_defer:
+                html_exporter.defer_scripts = False
+            if args.client_router:
+                html_exporter.client_router = True
+            if args.islands:
+                html_exporter.islands = True
+        bundle = None
+        if args.bundle:
+            from dars.exporters.web.bundle import BundleOptions
+            # Las imágenes se buscan junto al archivo de la app
+            bundle = BundleOptions(inline_limit=args.inline_limit, max_bytes=args.max_page_size,
+                                   asset_root=os.path.dirname(os.path.abspath(args.file)))
+
+        # Modo watch: la app se queda cargada en este proceso
+        if args.watch:
+            success = exporter.watch_export(args.file, args.format, args.output)
+            sys.exit(0 if success else 1)
+
+        profiler = None
+        if profiling:
+            from dars.exporters.profiler import ExportProfiler
+            profiler = ExportProfiler(memory_report=args.memory_report)
+        elif may_forward:
+            forwarded = exporter.export_via_daemon(args.file, args.format, args.output, args.preview,
+                                                   atomic=args.atomic)
+            if forwarded is not None:
+                sys.exit(0 if forwarded else 1)
+            print_banner()
+
         # Load application
-        app = exporter.load_app_from_file(args.file)
+        from contextlib import nullcontext
+        with profiler.phase('load') if profiler else nullcontext():
+            app = exporter.load_app_from_file(args.file)
         if app is None:
             sys.exit(1)
             
         # Export
-        success = exporter.export_app(app, args.format, args.output, args.preview)
+        if args.release_pages and args.format in exporter.exporters:
+            exporter.exporters[args.format].release_page_trees = True
+        if args.partition is not None and args.format != 'html':
+            console.print(f"[red]{translator.get('partition_html_only')}[/red]")
+            sys.exit(1)
+        success = exporter.export_app(app, args.format, args.output, args.preview, profiler=profiler,
+                                      partition=args.partition, atomic=args.atomic, precompress=args.precompress,
+                                      bundle=bundle)
+        if success and profiler is not None:
+            exporter.show_profile(profiler, args.profile_output, args.trace)
         sys.exit(0 if success else 1)
         
-    elif args.command == 'info':
+    else:
+        print_banner()
+
+    if args.command == 'info':
         # Show information
         app = exporter.load_app_from_file(args.file)
         if app is None:
@@ -627,6 +943,57 @@ def main():
         else:
             console.print(f"[red]{translator.get('index_not_found')} {args.path}[/red]")
 
+    elif args.command == 'daemon':
+        from dars.cli.daemon import daemon_supported, get_socket_path, send_request, run_daemon
+        if not daemon_supported():
+            console.print(f"[red]{translator.get('daemon_unsupported')}[/red]")
+            sys.exit(1)
+        socket_path = args.socket or get_socket_path()
+        if args.action == 'start':
+            from rich.panel import Panel
+            console.print(Panel(
+                f"[bold]Socket:[/bold] {socket_path}\n\n[yellow]{translator.get('press_ctrl_c')}[/yellow]",
+                title=translator.get('daemon_started'), border_style="green"
+            ))
+            try:
+                run_daemon(socket_path)
+            except RuntimeError as e:
+                console.print(f"[red]{e}[/red]")
+                sys.exit(1)
+            console.print(f"[green]{translator.get('daemon_stopped')}[/green]")
+        else:
+            command = 'shutdown' if args.action == 'stop' else 'status'
+            status = send_request({'command': command}, socket_path=socket_path)
+            if status is None:
+                console.print(f"[yellow]{translator.get('daemon_not_running')}[/yellow]")
+                sys.exit(1)
+            from rich.table import Table
+            table = Table(title=f"Dars daemon ({socket_path})")
+            table.add_column(translator.get('property'), style="cyan")
+            table.add_column(translator.get('value'), style="white")
+            for key in ('pid', 'uptime_seconds', 'requests_served', 'warmup_ms', 'python'):
+                table.add_row(key, str(status.get(key)))
+            console.print(table)
+            if args.action == 'stop':
+                console.print(f"[green]{translator.get('daemon_stopped')}[/green]")
+
+    elif args.command == 'serve':
+        from dars.cli.serve import serve_directory, precompress_directory
+        if not os.path.isdir(args.path):
+            console.print(f"[red]{translator.get('directory_not_exists', directory=args.path)}[/red]")
+            sys.exit(1)
+        if args.precompress:
+            count = precompress_directory(args.path)
+            console.print(f"[green]{translator.get('precompressed_files', count=count)}[/green]")
+        from rich.panel import Panel
+        console.print(Panel(
+            f"[bold]URL:[/bold] http://{args.host}:{args.port}\n"
+            f"[bold]{translator.get('directory')}:[/bold] {os.path.abspath(args.path)}\n\n"
+            f"[yellow]{translator.get('press_ctrl_c')}[/yellow]",
+            title="Dars Serve", border_style="green"
+        ))
+        serve_directory(args.path, host=args.host, port=args.port, access_log=args.access_log)
+        console.print(f"[green]{translator.get('server_stopped')}[/green]")
             
     else:
         # Usar nuestro formateador personalizado en lugar del estándar
@@ -4,13 +4,20 @@ Dars Preview - Preview system for exported applications
 """
 
 import os
+import io
 import sys
+import json
+import hashlib
+import functools
 import webbrowser
 import http.server
-import socketserver
 import threading
 import time
+import urllib.parse
+from collections import deque
+from http import HTTPStatus
 from pathlib import Path
+from typing import Any, Dict
 
 from rich.console import Console
 from rich.panel import Panel
@@ -22,56 +29,268 @@ from dars.cli.translations import translator
 
 console = Console()
 
+class PreviewStats:
+    """Thread-safe connection and latency counters for the preview server"""
+
+    def __init__(self, window: int = 1024):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.started_at = time.time()
+        self.connections_total = 0
+        self.connections_active = 0
+        self.requests_total = 0
+        self.not_modified = 0
+        self.sendfile_responses = 0
+        self.bytes_sent = 0
+        self.status_counts: Dict[int, int] = {}
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections_total += 1
+            self.connections_active += 1
+
+    def connection_closed(self):
+        with self._lock:
+            self.connections_active -= 1
+
+    def record_request(self, status: int, latency: float):
+        with self._lock:
+            self.requests_total += 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            if status == 304:
+                self.not_modified += 1
+            self._latencies.append(latency)
+
+    def record_body(self, size: int, sendfile: bool = False):
+        with self._lock:
+            self.bytes_sent += size
+            if sendfile:
+                self.sendfile_responses += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the counters as a JSON-serializable dict (latencies in ms)"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            data = {
+                'uptime_seconds': round(time.time() - self.started_at, 3),
+                'connections_total': self.connections_total,
+                'connections_active': self.connections_active,
+                'requests_total': self.requests_total,
+                'not_modified': self.not_modified,
+                'sendfile_responses': self.sendfile_responses,
+                'bytes_sent': self.bytes_sent,
+                'status_counts': {str(k): v for k, v in sorted(self.status_counts.items())},
+            }
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            index = min(len(latencies) - 1, int(round(q * (len(latencies) - 1))))
+            return round(latencies[index] * 1000, 3)
+
+        data['latency_ms'] = {
+            'samples': len(latencies),
+            'avg': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'max': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        }
+        return data
+
+
 class PreviewServer:
     """Preview server for Dars applications"""
-    
+
+    # Archivos a partir de este tamaño se envían con sendfile (zero-copy)
+    SENDFILE_THRESHOLD = 64 * 1024
+    STATS_PATH = '/__dars/stats'
+
+    class DarsHTTPServer(http.server.ThreadingHTTPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+        def __init__(self, server_address, handler_class):
+            super().__init__(server_address, handler_class)
+            self.stats = PreviewStats()
+            self._etag_lock = threading.Lock()
+            self._etag_cache: Dict[str, tuple] = {}
+
+        def etag_for(self, path: str, fs: os.stat_result) -> str:
+            """Strong ETag derived from the file content, cached by (mtime, size)"""
+            key = (fs.st_mtime_ns, fs.st_size)
+            with self._etag_lock:
+                cached = self._etag_cache.get(path)
+            if cached and cached[0] == key:
+                return cached[1]
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            etag = f'"{digest.hexdigest()}"'
+            with self._etag_lock:
+                self._etag_cache[path] = (key, etag)
+            return etag
+
     class DarsRequestHandler(http.server.SimpleHTTPRequestHandler):
+        # HTTP/1.1 habilita keep-alive: todas las respuestas llevan Content-Length
+        protocol_version = "HTTP/1.1"
+        # Cierra conexiones keep-alive inactivas para no retener hilos
+        timeout = 30
+
+        def setup(self):
+            super().setup()
+            self._request_started = None
+            self._response_status = None
+            self.server.stats.connection_opened()
+
+        def finish(self):
+            try:
+                super().finish()
+            finally:
+                self.server.stats.connection_closed()
+
+        def handle_one_request(self):
+            self._request_started = None
+            super().handle_one_request()
+            if self._request_started is not None and self._response_status is not None:
+                latency = time.perf_counter() - self._request_started
+                self.server.stats.record_request(self._response_status, latency)
+
+        def parse_request(self):
+            self._request_started = time.perf_counter()
+            self._response_status = None
+            return super().parse_request()
+
+        def send_response(self, code, message=None):
+            self._response_status = int(code)
+            super().send_response(code, message)
+
         def end_headers(self):
             # CORS para desarrollo PWA si es necesario
             self.send_header('Access-Control-Allow-Origin', '*')
             super().end_headers()
+
         def guess_type(self, path):
             if path.endswith('sw.js'):
                 return 'application/javascript'
             return super().guess_type(path)
-    
+
+        def send_head(self):
+            if urllib.parse.urlsplit(self.path).path == PreviewServer.STATS_PATH:
+                return self._send_stats()
+            path = self.translate_path(self.path)
+            if os.path.isdir(path) and self.path.split('?', 1)[0].endswith('/'):
+                for index in ("index.html", "index.htm"):
+                    index_path = os.path.join(path, index)
+                    if os.path.isfile(index_path):
+                        path = index_path
+                        break
+            if not os.path.isfile(path) or path.endswith('/'):
+                # Directorios, redirecciones y 404 siguen el comportamiento estándar
+                return super().send_head()
+            try:
+                f = open(path, 'rb')
+            except OSError:
+                self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+                return None
+            try:
+                fs = os.fstat(f.fileno())
+                etag = self.server.etag_for(path, fs)
+                if self._etag_matches(etag):
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.send_header("ETag", etag)
+                    self.send_header("Cache-Control", "no-cache")
+                    self.end_headers()
+                    f.close()
+                    return None
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-type", self.guess_type(path))
+                self.send_header("Content-Length", str(fs.st_size))
+                self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+                self.send_header("ETag", etag)
+                # Preview de desarrollo: el navegador siempre revalida con If-None-Match
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                return f
+            except:
+                f.close()
+                raise
+
+        def _etag_matches(self, etag: str) -> bool:
+            header = self.headers.get("If-None-Match")
+            if not header:
+                return False
+            if header.strip() == "*":
+                return True
+            # If-None-Match usa comparación débil (RFC 9110 13.1.2)
+            candidates = [c.strip() for c in header.split(",")]
+            return any(c[2:] == etag if c.startswith("W/") else c == etag for c in candidates)
+
+        def _send_stats(self):
+            body = json.dumps(self.server.stats.snapshot(), indent=2).encode('utf-8')
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            return io.BytesIO(body)
+
+        def copyfile(self, source, outputfile):
+            size = None
+            if hasattr(source, 'fileno'):
+                try:
+                    size = os.fstat(source.fileno()).st_size
+                except (OSError, io.UnsupportedOperation):
+                    size = None
+            if size is not None and size >= PreviewServer.SENDFILE_THRESHOLD:
+                # socket.sendfile usa os.sendfile (zero-copy) y recurre a send() si no existe
+                outputfile.flush()
+                sent = self.connection.sendfile(source)
+                self.server.stats.record_body(sent, sendfile=True)
+                return
+            data = source.read()
+            outputfile.write(data)
+            self.server.stats.record_body(len(data))
+
     def __init__(self, directory: str, port: int = 8000):
         self.directory = os.path.abspath(directory)
         self.port = port
         self.server = None
         self.server_thread = None
-        
+
     def start(self):
         """Starts the preview server"""
         try:
-            # Change to the application directory
-            os.chdir(self.directory)
-            
-            # Create the server
-            handler = self.DarsRequestHandler
-            self.server = socketserver.TCPServer(("", self.port), handler)
-            
+            # El handler sirve desde el directorio de la app sin cambiar el cwd del proceso
+            handler = functools.partial(self.DarsRequestHandler, directory=self.directory)
+            self.server = self.DarsHTTPServer(("", self.port), handler)
+
             # Start in a separate thread
             self.server_thread = threading.Thread(target=self.server.serve_forever)
             self.server_thread.daemon = True
             self.server_thread.start()
-            
+
             return True
-            
+
         except Exception as e:
             console.print(f"[red]{translator.get('server_start_error')}: {e}[/red]")
             return False
-            
+
     def stop(self):
         """Stops the preview server"""
         if self.server:
             self.server.shutdown()
             self.server.server_close()
-            
+
     def get_url(self) -> str:
         """Gets the server URL"""
         return f"http://localhost:{self.port}"
 
+    def get_stats_url(self) -> str:
+        """Gets the URL of the connection/latency counters endpoint"""
+        return f"{self.get_url()}{self.STATS_PATH}"
+
 def preview_html_app(directory: str, auto_open: bool = True, port: int = 8000):
     """Previews an exported HTML application"""
     
@@ -94,6 +313,7 @@ def preview_html_app(directory: str, auto_open: bool = True, port: int = 8000):
 [green]✓[/green] {translator.get('preview_server_started')}
 
 [bold]URL:[/bold] {url}
+[bold]{translator.get('stats_endpoint')}:[/bold] {server.get_stats_url()}
 [bold]{translator.get('directory')}:[/bold] {directory}
 [bold]{translator.get('port')}:[/bold] {port}
 
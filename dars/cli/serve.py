@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+Dars Serve - Production static server for exported applications
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import email.utils
+import gzip
+import mimetypes
+import os
+import re
+import struct
+import sys
+import time
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+# Assets con hash de contenido en el nombre (app.3f2a9c1b.js, logo-9f8e7d6c.png)
+HASHED_ASSET_RE = re.compile(r'[.-][0-9a-fA-F]{8,}\.[A-Za-z0-9]+$')
+# Hermanos precomprimidos por orden de preferencia
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg', '.txt', '.xml', '.map', '.webmanifest')
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+DEFAULT_CACHE_CONTROL = 'no-cache'
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_CACHE_ENTRIES = 50000
+
+_RESPONSE_REASONS = {
+    200: 'OK', 206: 'Partial Content', 301: 'Moved Permanently', 304: 'Not Modified',
+    400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed',
+    412: 'Precondition Failed', 416: 'Range Not Satisfiable', 431: 'Request Header Fields Too Large',
+    500: 'Internal Server Error',
+}
+
+
+class FileMeta:
+    """Metadatos cacheados de un archivo servible"""
+    __slots__ = ('path', 'size', 'mtime', 'etag', 'content_type', 'last_modified',
+                 'cache_control', 'encodings', 'is_dir', 'checked_at')
+
+    def __init__(self, path: str, st: os.stat_result, is_dir: bool = False):
+        self.path = path
+        self.is_dir = is_dir
+        self.size = st.st_size
+        self.mtime = st.st_mtime
+        self.checked_at = time.monotonic()
+        self.encodings: Dict[str, Tuple[str, int]] = {}
+        if is_dir:
+            self.etag = self.content_type = self.last_modified = self.cache_control = None
+            return
+        self.etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        self.content_type = guess_content_type(path)
+        self.last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+        if HASHED_ASSET_RE.search(os.path.basename(path)):
+            self.cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            self.cache_control = DEFAULT_CACHE_CONTROL
+        for encoding, suffix in PRECOMPRESSED:
+            try:
+                sibling = os.stat(path + suffix)
+            except OSError:
+                continue
+            # Un hermano más antiguo que el original está desactualizado
+            if sibling.st_mtime_ns >= st.st_mtime_ns:
+                self.encodings[encoding] = (path + suffix, sibling.st_size)
+
+
+def guess_content_type(path: str) -> str:
+    if path.endswith('.js'):
+        return 'application/javascript; charset=utf-8'
+    content_type, _ = mimetypes.guess_type(path)
+    if content_type is None:
+        return 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in ('application/json', 'image/svg+xml'):
+        return f'{content_type}; charset=utf-8'
+    return content_type
+
+
+class MetadataCache:
+    """Cache en memoria de metadatos de archivos.
+
+    Con inotify las entradas viven hasta que llega un evento de cambio; sin él
+    se revalidan con stat() cuando superan `ttl` segundos.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, ttl: float = 1.0):
+        self.ttl = ttl
+        self.watched = False
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, object] = {}
+
+    def lookup(self, path: str) -> Optional[FileMeta]:
+        entry = self._entries.get(path)
+        if entry is not None:
+            fresh = self.watched
+            if not fresh and entry is not self._MISSING:
+                fresh = time.monotonic() - entry.checked_at < self.ttl
+            if fresh:
+                self.hits += 1
+                return None if entry is self._MISSING else entry
+        self.misses += 1
+        if len(self._entries) >= MAX_CACHE_ENTRIES:
+            self._entries.clear()
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Los 404 también se cachean (solo con inotify) para evitar ráfagas de stat()
+            if self.watched:
+                self._entries[path] = self._MISSING
+            return None
+        meta = FileMeta(path, st, is_dir=os.path.isdir(path))
+        self._entries[path] = meta
+        return meta
+
+    def invalidate(self, path: str):
+        self._entries.pop(path, None)
+        for _, suffix in PRECOMPRESSED:
+            if path.endswith(suffix):
+                self._entries.pop(path[:-len(suffix)], None)
+        # index.html y rutas sin extensión dependen del directorio padre
+        self._entries.pop(os.path.dirname(path), None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class InotifyWatcher:
+    """Invalida el MetadataCache con eventos inotify (solo Linux, vía ctypes)"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    PARENT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, root: str, cache: MetadataCache):
+        self.root = root
+        self.cache = cache
+        self.fd = -1
+        self._libc = None
+        self._watches: Dict[int, str] = {}
+        self._parent_wd = -1
+        self._loop = None
+
+    @classmethod
+    def available(cls) -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            return False
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            return hasattr(libc, 'inotify_init1')
+        except OSError:
+            return False
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> bool:
+        if not self.available():
+            return False
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            return False
+        self._loop = loop
+        self.cache.watched = True
+        self._watch_tree(self.root)
+        # El padre permite detectar swaps atómicos (rename/symlink) del directorio raíz
+        parent = os.path.dirname(self.root.rstrip(os.sep))
+        self._parent_wd = self._add_watch(parent or os.sep, self.PARENT_MASK)
+        loop.add_reader(self.fd, self._read_events)
+        return self.cache.watched
+
+    def stop(self):
+        if self.fd >= 0:
+            if self._loop is not None:
+                self._loop.remove_reader(self.fd)
+            os.close(self.fd)
+            self.fd = -1
+        self.cache.watched = False
+
+    def _add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd >= 0:
+            self._watches[wd] = path
+        return wd
+
+    def _watch_tree(self, top: str):
+        for dirpath, dirnames, _ in os.walk(top, followlinks=True):
+            if self._add_watch(dirpath, self.WATCH_MASK) < 0:
+                # Sin watches disponibles (max_user_watches) no es seguro cachear indefinidamente
+                self.cache.watched = False
+                return
+
+    def _rewatch(self):
+        for wd in list(self._watches):
+            if wd != self._parent_wd:
+                self._libc.inotify_rm_watch(self.fd, wd)
+                self._watches.pop(wd, None)
+        self.cache.clear()
+        self.cache.watched = True
+        if os.path.isdir(self.root):
+            self._watch_tree(self.root)
+
+    def _read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        root_name = os.path.basename(self.root.rstrip(os.sep))
+        while offset + self._EVENT.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='surrogateescape')
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                self.cache.clear()
+                continue
+            if wd == self._parent_wd:
+                if name == root_name:
+                    self._rewatch()
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name) if name else directory
+            self.cache.invalidate(path)
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._watch_tree(path)
+
+
+class StaticServer:
+    """Servidor HTTP/1.1 estático sobre asyncio streams"""
+
+    def __init__(self, directory: str, host: str = '127.0.0.1', port: int = 8000,
+                 keepalive_timeout: float = 15.0, access_log: bool = False):
+        # Sin realpath: si la raíz es un symlink, cada stat() sigue el destino actual
+        self.root = os.path.abspath(directory)
+        self.host = host
+        self.port = port
+        self.keepalive_timeout = keepalive_timeout
+        self.access_log = access_log
+        self.cache = MetadataCache()
+        self.watcher = InotifyWatcher(self.root, self.cache)
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> asyncio.AbstractServer:
+        loop = asyncio.get_running_loop()
+        self.watcher.start(loop)
+        self.server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES, reuse_address=True)
+        if self.port == 0:
+            self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.watcher.stop()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.watcher.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.keepalive_timeout)
+                except asyncio.LimitOverrunError:
+                    await self._send_simple(writer, 431, keep_alive=False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                request = self._parse_head(head)
+                if request is None:
+                    await self._send_simple(writer, 400, keep_alive=False)
+                    break
+                started = time.perf_counter()
+                keep_alive, status = await self._respond(request, writer)
+                if self.access_log:
+                    method, target, _, _ = request
+                    elapsed = (time.perf_counter() - started) * 1000
+                    print(f'{method} {target} {status} {elapsed:.2f}ms', flush=True)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    @staticmethod
+    def _parse_head(head: bytes):
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            return None
+        if not version.startswith('HTTP/1.'):
+            return None
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, sep, value = line.partition(':')
+            if not sep:
+                return None
+            headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    def _wants_keep_alive(self, version: str, headers: Dict[str, str]) -> bool:
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    def _resolve(self, url_path: str) -> Tuple[Optional[FileMeta], Optional[str]]:
+        """Devuelve (meta, redirect) para una ruta URL ya decodificada"""
+        relative = url_path.lstrip('/')
+        fs_path = os.path.normpath(os.path.join(self.root, relative))
+        if fs_path != self.root and not fs_path.startswith(self.root + os.sep):
+            return None, None
+        meta = self.cache.lookup(fs_path)
+        if meta is not None and meta.is_dir:
+            if not url_path.endswith('/'):
+                return None, url_path + '/'
+            index = self.cache.lookup(os.path.join(fs_path, 'index.html'))
+            return index, None
+        if meta is None and not os.path.splitext(fs_path)[1]:
+            # URLs limpias para multipágina: /about -> about.html
+            return self.cache.lookup(fs_path + '.html'), None
+        return meta, None
+
+    async def _respond(self, request, writer: asyncio.StreamWriter) -> Tuple[bool, int]:
+        method, target, version, headers = request
+        keep_alive = self._wants_keep_alive(version, headers)
+        if 'content-length' in headers or 'transfer-encoding' in headers:
+            # Un servidor estático no acepta cuerpos; cerrar evita desincronizar el stream
+            keep_alive = False
+        if method not in ('GET', 'HEAD'):
+            await self._send_simple(writer, 405, keep_alive=False, extra={'Allow': 'GET, HEAD'})
+            return False, 405
+        url = urllib.parse.urlsplit(target)
+        url_path = urllib.parse.unquote(url.path)
+        if '\x00' in url_path:
+            await self._send_simple(writer, 400, keep_alive=False)
+            return False, 400
+
+        meta, redirect = self._resolve(url_path)
+        if redirect is not None:
+            location = urllib.parse.quote(redirect)
+            if url.query:
+                location += '?' + url.query
+            await self._send_simple(writer, 301, keep_alive, extra={'Location': location})
+            return keep_alive, 301
+        if meta is None:
+            not_found = self.cache.lookup(os.path.join(self.root, '404.html'))
+            if not_found is not None and not not_found.is_dir:
+                await self._send_file(writer, method, 404, not_found, not_found.path, not_found.size,
+                                      0, not_found.size, {}, keep_alive)
+            else:
+                await self._send_simple(writer, 404, keep_alive)
+            return keep_alive, 404
+
+        encoding = None
+        range_header = headers.get('range')
+        if range_header and headers.get('if-range', meta.etag) != meta.etag:
+            range_header = None
+        if not range_header and meta.encodings:
+            accepted = _parse_accept_encoding(headers.get('accept-encoding', ''))
+            for candidate, _ in PRECOMPRESSED:
+                if candidate in meta.encodings and accepted.get(candidate, 0) > 0:
+                    encoding = candidate
+                    break
+        etag = meta.etag if encoding is None else f'{meta.etag[:-1]}-{encoding}"'
+
+        extra = {
+            'ETag': etag,
+            'Last-Modified': meta.last_modified,
+            'Cache-Control': meta.cache_control,
+            'Accept-Ranges': 'bytes',
+        }
+        if meta.encodings:
+            extra['Vary'] = 'Accept-Encoding'
+
+        if _etag_matches(headers.get('if-none-match'), etag):
+            await self._send_simple(writer, 304, keep_alive, extra=extra, body=False)
+            return keep_alive, 304
+
+        if encoding is not None:
+            path, size = meta.encodings[encoding]
+            extra['Content-Encoding'] = encoding
+            await self._send_file(writer, method, 200, meta, path, size, 0, size, extra, keep_alive)
+            return keep_alive, 200
+
+        if range_header:
+            byte_range = _parse_range(range_header, meta.size)
+            if byte_range is None:
+                extra['Content-Range'] = f'bytes */{meta.size}'
+                await self._send_simple(writer, 416, keep_alive, extra=extra)
+                return keep_alive, 416
+            if byte_range is not _FULL_RANGE:
+                start, end = byte_range
+                extra['Content-Range'] = f'bytes {start}-{end}/{meta.size}'
+                await self._send_file(writer, method, 206, meta, meta.path, meta.size,
+                                      start, end - start + 1, extra, keep_alive)
+                return keep_alive, 206
+
+        await self._send_file(writer, method, 200, meta, meta.path, meta.size, 0, meta.size, extra, keep_alive)
+        return keep_alive, 200
+
+    def _status_line(self, status: int, headers: Dict[str, str], keep_alive: bool) -> bytes:
+        lines = [f'HTTP/1.1 {status} {_RESPONSE_REASONS.get(status, "")}',
+                 f'Date: {email.utils.formatdate(usegmt=True)}',
+                 'Server: Dars',
+                 'X-Content-Type-Options: nosniff']
+        lines.extend(f'{name}: {value}' for name, value in headers.items() if value is not None)
+        lines.append('Connection: keep-alive' if keep_alive else 'Connection: close')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    async def _send_simple(self, writer, status: int, keep_alive: bool,
+                           extra: Optional[Dict[str, str]] = None, body: bool = True):
+        headers = dict(extra or {})
+        payload = b''
+        if body and status >= 400:
+            payload = f'{status} {_RESPONSE_REASONS.get(status, "")}\n'.encode()
+            headers['Content-Type'] = 'text/plain; charset=utf-8'
+        if status != 304:
+            headers['Content-Length'] = str(len(payload))
+        writer.write(self._status_line(status, headers, keep_alive) + payload)
+        await writer.drain()
+
+    async def _send_file(self, writer, method: str, status: int, meta: FileMeta, path: str,
+                         total_size: int, offset: int, count: int, extra: Dict[str, str], keep_alive: bool):
+        headers = {'Content-Type': meta.content_type, 'Content-Length': str(count)}
+        headers.update(extra)
+        writer.write(self._status_line(status, headers, keep_alive))
+        if method == 'HEAD' or count == 0:
+            await writer.drain()
+            return
+        await writer.drain()
+        loop = asyncio.get_running_loop()
+        with open(path, 'rb') as f:
+            # loop.sendfile usa os.sendfile cuando el transporte lo permite
+            await loop.sendfile(writer.transport, f, offset, count)
+
+
+_FULL_RANGE = object()
+
+
+def _parse_range(header: str, size: int):
+    """Parsea un único rango `bytes=`; devuelve (start, end), _FULL_RANGE o None (416)"""
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        # Multirango no soportado: se sirve el recurso completo (RFC 9110 permite ignorar Range)
+        return _FULL_RANGE
+    start_s, sep, end_s = spec.strip().partition('-')
+    if not sep:
+        return _FULL_RANGE
+    try:
+        if start_s == '':
+            suffix = int(end_s)
+            if suffix <= 0 or size == 0:
+                return None
+            return max(0, size - suffix), size - 1
+        start = int(start_s)
+        end = int(end_s) if end_s else size - 1
+    except ValueError:
+        return _FULL_RANGE
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    accepted = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def precompress_directory(directory: str, min_size: int = 1024) -> int:
+    """Genera hermanos .gz (y .br si `brotli` está instalado) para los assets de texto"""
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    written = 0
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            if st.st_size < min_size:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            targets = [('.gz', lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                targets.append(('.br', lambda d: brotli.compress(d)))
+            for suffix, compress in targets:
+                sibling = path + suffix
+                try:
+                    if os.stat(sibling).st_mtime_ns >= st.st_mtime_ns:
+                        continue
+                except OSError:
+                    pass
+                with open(sibling, 'wb') as f:
+                    f.write(compress(data))
+                written += 1
+    return written
+
+
+def serve_directory(directory: str, host: str = '127.0.0.1', port: int = 8000, access_log: bool = False):
+    """Sirve un directorio exportado hasta Ctrl+C"""
+    server = StaticServer(directory, host=host, port=port, access_log=access_log)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Dars Serve - production static server")
+    parser.add_argument("directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", "-p", type=int, default=8000)
+    parser.add_argument("--precompress", action="store_true")
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args()
+    if args.precompress:
+        precompress_directory(args.directory)
+    serve_directory(args.directory, args.host, args.port, args.access_log)
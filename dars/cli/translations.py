@@ -19,12 +19,63 @@ translations = {
         'preview_help': "Preview information",
         'preview_cmd_help': "Preview exported application",
         'init_help': "Create a Dars project",
+        'serve_help': "Serve an exported application (production static server)",
+        'daemon_help': "Warm build daemon that speeds up repeated exports",
         
         # Export command
         'file_help': "Python file with Dars application",
         'format_help': "Export format",
-        'output_help': "Output directory",
+        'output_help': "Output directory, or an archive (.zip, .tar, .tar.gz, .tar.bz2, .tar.xz) to export into directly",
         'preview_arg_help': "Show preview information (HTML only)",
+        'validating_app': "Validating application...",
+        'validation_errors': "Validation errors:",
+        'exporting_to': "Exporting to",
+        'profile_help': "Measure time and memory per export phase and render time per component class",
+        'profile_output_help': "Where to save the JSON profile (default: dars-profile.json)",
+        'trace_help': "Also write a Chrome trace-event file (open it in ui.perfetto.dev or chrome://tracing)",
+        'memory_report_help': "Track memory with tracemalloc: peak per export phase and top allocation sites",
+        'release_pages_help': "Free each page's component tree as soon as it is written (lower memory for very large apps)",
+        'partition_help': "Export only part K of N of the pages (0-based), e.g. 0/4; shared files are written by part 0",
+        'partition_invalid': "Invalid partition '{value}': expected K/N with 0 <= K < N",
+        'partition_html_only': "--partition is only supported by the html format",
+        'atomic_help': "Build into a staging directory and swap it into place when done, so servers never see a half-written build",
+        'atomic_partition': "--atomic cannot be combined with --partition",
+        'archive_precompress_help': "With an archive output, add .gz/.br entries for text assets",
+        'archive_unsupported': "Archive output cannot be combined with --partition, --watch or --atomic (archives are always written atomically)",
+        'bundle_help': "Write each page as a single self-contained HTML file with only the CSS and runtime it uses and small images inlined",
+        'max_page_size_help': "With --bundle, fail if any page is larger than SIZE (bytes, or with a k/m suffix, e.g. 150k)",
+        'inline_limit_help': "With --bundle, inline local images up to SIZE as data: URIs (default 8k, 0 to disable)",
+        'size_invalid': "Invalid size '{value}': expected bytes or a number with a k/m suffix",
+        'bundle_watch': "--bundle cannot be combined with --watch",
+        'bundle_stats': "Bundle: {pages} page(s), {total} in total, largest {largest} ({file})",
+        'bundle_external': "{count} asset(s) still loaded as separate requests: {assets}",
+        'critical_css_help': "Inline the CSS used by the first N top-level components of each page (default 3) and load styles.css without blocking rendering",
+        'critical_css_bundle': "--critical-css cannot be combined with --bundle (bundles already inline each page's CSS)",
+        'no_resource_hints_help': "Do not add preload/prefetch hints (stylesheet, fonts, above-the-fold images, linked pages) to each page",
+        'no_defer_help': "Load the runtime and page scripts as blocking scripts instead of with defer",
+        'client_router_help': "Navigate between pages without full reloads: the runtime swaps page content using a route manifest (routes.json) and prefetches linked pages on hover or when visible",
+        'client_router_bundle': "--client-router cannot be combined with --bundle (bundled pages do not share a runtime)",
+        'islands_help': "Ship JavaScript only for interactive components (Tabs, Accordion, Modal, Slider): a small inline loader hydrates each one when visible or idle, and pages without them or page scripts load no JavaScript",
+        'islands_unsupported': "--islands cannot be combined with --bundle or --client-router",
+        'profile_saved': "Profile saved to",
+        'trace_saved': "Trace saved to",
+        'watch_help': "Keep running and rebuild only the changed pages when the app files change",
+        'watching_for_changes': "Watching {path} for changes (Ctrl+C to stop)...",
+        'watch_change_detected': "Change detected",
+        'watch_rebuild_summary': "Rebuilt in {ms} ms: {rendered} page(s) rendered, {skipped} unchanged; {written} file(s) written, {unchanged} unchanged, {removed} removed",
+        'watch_rebuild_failed': "Rebuild failed, keeping the previous output",
+        'watch_stopped': "Stopped watching.",
+        'no_daemon_help': "Export in this process even if a Dars daemon is running",
+        
+        # Daemon command
+        'daemon_action_help': "start (foreground), stop or status",
+        'daemon_socket_help': "Unix socket path (default ~/.dars/daemon.sock or $DARS_DAEMON_SOCKET)",
+        'daemon_started': "Dars daemon listening",
+        'daemon_stopped': "Dars daemon stopped",
+        'daemon_not_running': "No Dars daemon is running",
+        'daemon_unsupported': "The Dars daemon requires fork() and Unix sockets (not available on this platform)",
+        'daemon_export_time': "Exported by the Dars daemon in {ms} ms",
+        'output_write_stats': "Output: {written} files written ({written_size}), {skipped} unchanged ({skipped_size})",
         
         # Init command
         'name_help': "Project name",
@@ -38,6 +89,12 @@ translations = {
         'port_help': "Port for the server (HTML only)",
         'lang_help': "Language for the preview (en or es)",
         
+        # Serve command
+        'host_help': "Interface to bind (default 127.0.0.1)",
+        'precompress_help': "Generate .gz/.br siblings for text assets before serving",
+        'access_log_help': "Print one line per request with status and latency",
+        'precompressed_files': "{count} precompressed files written",
+        
         # Preview server messages
         'server_start_error': "Error starting server: {error}",
         'preview_server_started': "Preview server started",
@@ -49,6 +106,7 @@ translations = {
         'open_manually': "Open manually: {url}",
         'stopping_server': "Stopping server...",
         'server_stopped': "Server stopped",
+        'stats_endpoint': "Stats",
         
         # Preview HTML app
         'html_preview': "HTML Preview",
@@ -118,6 +176,7 @@ translations = {
         dars export app.py --format html --output ./dist
         dars info app.py
         dars preview ./dist
+        dars serve ./dist --port 8080
         dars init my_new_project
         dars init my_new_project -t demo/complete_app
         """,
@@ -167,12 +226,63 @@ translations = {
         'preview_help': "Información de preview",
         'preview_cmd_help': "Previsualizar aplicación exportada",
         'init_help': "Crea un proyecto Dars",
+        'serve_help': "Servir una aplicación exportada (servidor estático de producción)",
+        'daemon_help': "Daemon de compilación caliente que acelera exportaciones repetidas",
         
         # Export command
         'file_help': "Archivo Python con la aplicación Dars",
         'format_help': "Formato de exportación",
-        'output_help': "Directorio de salida",
+        'output_help': "Directorio de salida, o un archivo comprimido (.zip, .tar, .tar.gz, .tar.bz2, .tar.xz) donde exportar directamente",
         'preview_arg_help': "Mostrar información de preview (solo para HTML)",
+        'validating_app': "Validando aplicación...",
+        'validation_errors': "Errores de validación:",
+        'exporting_to': "Exportando a",
+        'profile_help': "Medir tiempo y memoria por fase de exportación y tiempo de render por clase de componente",
+        'profile_output_help': "Dónde guardar el perfil JSON (por defecto: dars-profile.json)",
+        'trace_help': "Escribir también un archivo Chrome trace-event (ábrelo en ui.perfetto.dev o chrome://tracing)",
+        'memory_report_help': "Medir memoria con tracemalloc: pico por fase de exportación y sitios que más memoria asignan",
+        'release_pages_help': "Liberar el árbol de componentes de cada página en cuanto se escribe (menos memoria en apps muy grandes)",
+        'partition_help': "Exportar solo la parte K de N de las páginas (desde 0), p. ej. 0/4; la parte 0 escribe los archivos compartidos",
+        'partition_invalid': "Partición inválida '{value}': se esperaba K/N con 0 <= K < N",
+        'partition_html_only': "--partition solo está soportado por el formato html",
+        'atomic_help': "Construir en un directorio aparte y cambiarlo por la salida al terminar, así los servidores nunca ven un build a medias",
+        'atomic_partition': "--atomic no se puede combinar con --partition",
+        'archive_precompress_help': "Con salida a archivo comprimido, añadir entradas .gz/.br de los assets de texto",
+        'archive_unsupported': "La salida a archivo comprimido no se puede combinar con --partition, --watch ni --atomic (el archivo siempre se escribe de forma atómica)",
+        'bundle_help': "Escribir cada página como un único HTML autocontenido, con solo el CSS y el runtime que usa y las imágenes pequeñas en línea",
+        'max_page_size_help': "Con --bundle, fallar si alguna página ocupa más de SIZE (bytes, o con sufijo k/m, p. ej. 150k)",
+        'inline_limit_help': "Con --bundle, incrustar como data: URI las imágenes locales de hasta SIZE (por defecto 8k, 0 para ninguna)",
+        'size_invalid': "Tamaño inválido '{value}': se esperaban bytes o un número con sufijo k/m",
+        'bundle_watch': "--bundle no se puede combinar con --watch",
+        'bundle_stats': "Bundle: {pages} página(s), {total} en total, la mayor {largest} ({file})",
+        'bundle_external': "{count} asset(s) se siguen cargando como peticiones aparte: {assets}",
+        'critical_css_help': "Incrustar el CSS de los N primeros componentes de primer nivel de cada página (por defecto 3) y cargar styles.css sin bloquear el render",
+        'critical_css_bundle': "--critical-css no se puede combinar con --bundle (el bundle ya lleva en línea el CSS de cada página)",
+        'no_resource_hints_help': "No añadir hints de preload/prefetch (hoja de estilos, fuentes, imágenes visibles al cargar, páginas enlazadas) a cada página",
+        'no_defer_help': "Cargar el runtime y los scripts de página como scripts bloqueantes en vez de con defer",
+        'client_router_help': "Navegar entre páginas sin recargas completas: el runtime cambia el contenido con un manifiesto de rutas (routes.json) y precarga las páginas enlazadas al pasar el ratón o al verse",
+        'client_router_bundle': "--client-router no se puede combinar con --bundle (las páginas del bundle no comparten runtime)",
+        'islands_help': "Enviar JavaScript solo para los componentes interactivos (Tabs, Accordion, Modal, Slider): un cargador pequeño en línea hidrata cada uno al verse o en tiempo ocioso, y las páginas sin ellos ni scripts propios no cargan JavaScript",
+        'islands_unsupported': "--islands no se puede combinar con --bundle ni con --client-router",
+        'profile_saved': "Perfil guardado en",
+        'trace_saved': "Traza guardada en",
+        'watch_help': "Seguir ejecutándose y reconstruir solo las páginas modificadas cuando cambien los archivos de la app",
+        'watching_for_changes': "Observando cambios en {path} (Ctrl+C para detener)...",
+        'watch_change_detected': "Cambio detectado",
+        'watch_rebuild_summary': "Reconstruido en {ms} ms: {rendered} página(s) renderizada(s), {skipped} sin cambios; {written} archivo(s) escrito(s), {unchanged} sin cambios, {removed} eliminado(s)",
+        'watch_rebuild_failed': "La reconstrucción falló, se mantiene la salida anterior",
+        'watch_stopped': "Observación detenida.",
+        'no_daemon_help': "Exportar en este proceso aunque haya un daemon de Dars corriendo",
+        
+        # Daemon command
+        'daemon_action_help': "start (primer plano), stop o status",
+        'daemon_socket_help': "Ruta del socket Unix (por defecto ~/.dars/daemon.sock o $DARS_DAEMON_SOCKET)",
+        'daemon_started': "Daemon de Dars escuchando",
+        'daemon_stopped': "Daemon de Dars detenido",
+        'daemon_not_running': "No hay ningún daemon de Dars corriendo",
+        'daemon_unsupported': "El daemon de Dars requiere fork() y sockets Unix (no disponibles en esta plataforma)",
+        'daemon_export_time': "Exportado por el daemon de Dars en {ms} ms",
+        'output_write_stats': "Salida: {written} archivos escritos ({written_size}), {skipped} sin cambios ({skipped_size})",
         
         # Init command
         'name_help': "Nombre del proyecto",
@@ -186,6 +296,12 @@ translations = {
         'port_help': "Puerto para el servidor (solo HTML)",
         'lang_help': "Idioma para la preview (en o es)",
         
+        # Serve command
+        'host_help': "Interfaz de escucha (por defecto 127.0.0.1)",
+        'precompress_help': "Generar hermanos .gz/.br de los assets de texto antes de servir",
+        'access_log_help': "Imprimir una línea por petición con estado y latencia",
+        'precompressed_files': "{count} archivos precomprimidos escritos",
+        
         # Preview server messages
         'server_start_error': "Error al iniciar el servidor: {error}",
         'preview_server_started': "Servidor de preview iniciado",
@@ -197,6 +313,7 @@ translations = {
         'open_manually': "Abrir manualmente: {url}",
         'stopping_server': "Deteniendo servidor...",
         'server_stopped': "Servidor detenido",
+        'stats_endpoint': "Estadísticas",
         
         # Preview HTML app
         'html_preview': "Preview HTML",
@@ -266,6 +383,7 @@ translations = {
         dars export app.py --format html --output ./dist
         dars info app.py
         dars preview ./dist
+        dars serve ./dist --port 8080
         dars init mi_nuevo_proyecto
         dars init mi_nuevo_proyecto -t demo/complete_app
         """,
@@ -1,8 +1,26 @@
-from .card import Card
-from .modal import Modal
-from .navbar import Navbar
-from .table import Table
-from .tabs import Tabs
-from .accordion import Accordion
+# Nombres resueltos en el primer acceso (PEP 562), igual que dars.components.basic
+import importlib
+
+_LAZY_ATTRS = {
+    'Card': '.card',
+    'Modal': '.modal',
+    'Navbar': '.navbar',
+    'Table': '.table',
+    'Tabs': '.tabs',
+    'Accordion': '.accordion',
+}
 
 __all__ = ['Card', 'Modal', 'Navbar', 'Table', 'Tabs', 'Accordion']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -6,11 +6,13 @@ class Accordion(Component):
     Componente Accordion para mostrar secciones colapsables.
     sections: Lista de tuplas (título, contenido)
     open_indices: Lista de índices abiertos (opcional)
+    lazy: Si es True, las secciones cerradas se exportan en un <template> y se crean al abrirlas
     """
-    def __init__(self, sections: List[tuple], open_indices: Optional[List[int]]=None, **props):
+    def __init__(self, sections: List[tuple], open_indices: Optional[List[int]]=None, lazy: bool=False, **props):
         super().__init__(**props)
         self.sections = sections
         self.open_indices = open_indices or []
+        self.lazy = lazy
 
     def render(self) -> str:
         html = '<div class="dars-accordion">'
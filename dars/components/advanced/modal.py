@@ -2,12 +2,15 @@ from dars.core.component import Component
 from typing import Optional, Dict, Any, List
 
 class Modal(Component):
-    """Componente para mostrar contenido en un modal."""
+    """Componente para mostrar contenido en un modal.
+    lazy: Si es True y el modal empieza cerrado, su contenido se exporta en un <template>
+    y se crea la primera vez que se abre."""
     def __init__(
         self,
         children: Optional[List[Component]] = None,
         title: Optional[str] = None,
         is_open: bool = False,
+        lazy: bool = False,
         class_name: Optional[str] = None,
         style: Optional[Dict[str, Any]] = None,
         **kwargs
@@ -15,6 +18,7 @@ class Modal(Component):
         super().__init__(children=children, class_name=class_name, style=style, **kwargs)
         self.title = title
         self.is_open = is_open
+        self.lazy = lazy
 
     def render(self) -> str:
         title_html = f'<h2>{self.title}</h2>' if self.title else ''
@@ -7,12 +7,14 @@ class Tabs(Component):
     tabs: Lista de títulos de pestañas
     panels: Lista de componentes o strings (contenido de cada pestaña)
     selected: Índice de la pestaña activa (opcional)
+    lazy: Si es True, los paneles no activos se exportan en un <template> y se crean al abrirlos
     """
-    def __init__(self, tabs: List[str], panels: List[Component], selected: Optional[int]=0, **props):
+    def __init__(self, tabs: List[str], panels: List[Component], selected: Optional[int]=0, lazy: bool=False, **props):
         super().__init__(**props)
         self.tabs = tabs
         self.panels = panels
         self.selected = selected or 0
+        self.lazy = lazy
 
     def render(self) -> str:
         tab_headers = ''.join(
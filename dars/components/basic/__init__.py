@@ -1,20 +1,29 @@
-from .text import Text
-from .button import Button
-from .input import Input
-from .container import Container
-from .page import Page
-from .image import Image
-from .link import Link
-from .textarea import Textarea
-from .checkbox import Checkbox
-from .radiobutton import RadioButton
-from .select import Select, SelectOption
-from .slider import Slider
-from .datepicker import DatePicker
+# Importar un componente (p. ej. dars.components.basic.text) no debe cargar todos
+# los demás: los nombres del paquete se resuelven en el primer acceso (PEP 562).
+import importlib
 
-from .progressbar import ProgressBar
-from .spinner import Spinner
-from .tooltip import Tooltip
+_LAZY_ATTRS = {
+    'Text': '.text',
+    'Button': '.button',
+    'Input': '.input',
+    'Container': '.container',
+    'Page': '.page',
+    'Image': '.image',
+    'Link': '.link',
+    'Textarea': '.textarea',
+    'Checkbox': '.checkbox',
+    'RadioButton': '.radiobutton',
+    'Select': '.select',
+    'SelectOption': '.select',
+    'Slider': '.slider',
+    'DatePicker': '.datepicker',
+
+    'ProgressBar': '.progressbar',
+    'Spinner': '.spinner',
+    'Tooltip': '.tooltip',
+    'Cached': '.cached',
+    'cache': '.cached',
+}
 
 __all__ = [
     'Text',
@@ -32,3 +41,16 @@ __all__ = [
     'Slider',
     'DatePicker'
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,81 @@
+from dars.core.component import Component
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+import functools
+
+
+class Cached(Component):
+    """
+    Cached: el exportador HTML guarda el render de su contenido en la caché de fragmentos
+    (dars.exporters.web.fragment_cache) y lo reutiliza en otras páginas y peticiones.
+    child: componente a cachear, o una función sin argumentos que lo construye (solo se
+           llama si el fragmento no está en caché)
+    key: clave del fragmento; sin clave se usa el fingerprint de `child` (solo con componente)
+    ttl: segundos que vale el fragmento (None: hasta que el almacén lo desaloje)
+    store: almacén propio (por defecto, el del exportador o el del proceso)
+    No añade ningún elemento al HTML: el fragmento sale tal cual.
+    """
+    def __init__(self, child: Union[Component, Callable[[], Component]], key: Optional[str] = None,
+                 ttl: Optional[float] = None, store: Any = None,
+                 args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None, **props):
+        super().__init__(**props)
+        if isinstance(child, Component):
+            self.child = child
+            self.build = None
+            # En children para que el exportador detecte Tabs/Accordion dentro del fragmento
+            self.add_child(child)
+        elif callable(child):
+            self.child = None
+            self.build = child
+        else:
+            raise TypeError("Cached necesita un componente o una función que lo construya")
+        if key is None and self.child is None:
+            raise ValueError("Cached con una función necesita `key`")
+        self.key = key
+        self.ttl = ttl
+        self.fragment_store = store
+        # Argumentos de `build`: forman parte del fingerprint de la página
+        self.args = args
+        self.kwargs = kwargs or {}
+
+    def cache_key(self) -> str:
+        if self.key is not None:
+            return f'key:{self.key}'
+        from dars.core.fingerprint import fingerprint
+        return f'fp:{fingerprint(self.child)}'
+
+    def resolve(self) -> Component:
+        """El componente a renderizar (construyéndolo si hace falta)"""
+        if self.child is None:
+            return self.build(*self.args, **self.kwargs)
+        return self.child
+
+    def render(self, exporter: Any) -> str:
+        # El método render será implementado por cada exportador
+        raise NotImplementedError("El método render debe ser implementado por el exportador")
+
+
+def cache(key: Union[str, Callable[..., str], None] = None, ttl: Optional[float] = None, store: Any = None):
+    """
+    Decorador para funciones que construyen un componente caro:
+
+        @cache(key=lambda region: f"sales-{region}", ttl=300)
+        def sales_table(region):
+            return Table(data=slow_query(region))
+
+    sales_table('eu') devuelve un Cached: la función solo se ejecuta si el fragmento no
+    está en caché. `key` es una cadena, una función de los mismos argumentos, o None
+    (nombre de la función más sus argumentos).
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> Cached:
+            if callable(key):
+                fragment_key = key(*args, **kwargs)
+            elif key is not None:
+                fragment_key = key
+            else:
+                from dars.core.fingerprint import fingerprint
+                fragment_key = f'{function.__module__}.{function.__qualname__}:{fingerprint([args, kwargs])}'
+            return Cached(function, key=fragment_key, ttl=ttl, store=store, args=args, kwargs=kwargs)
+        return wrapper
+    return decorator
@@ -1,4 +1,5 @@
-from typing import Optional, List, Dict, Any
+import itertools
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from .component import Component
 from .events import EventManager
 
@@ -11,6 +12,50 @@ class Page:
         self.meta = meta or {}
         self.index = index  # ¿Es la página principal?
 
+class PageSource:
+    """
+    Fuente perezosa de páginas registrada con App.add_page_source().
+
+    `source` puede ser:
+      - un iterable (p. ej. un generador): se consume una sola vez;
+      - una factory sin argumentos que devuelve un iterable nuevo en cada exportación;
+      - con ranged=True, una factory source(start, stop) que solo construye las páginas
+        de ese rango (necesita `count`); así cada partición construye solo sus páginas.
+
+    Cada elemento es un Page, una tupla (name, root[, title[, meta]]) o un dict con los
+    argumentos de add_page. `count` es una pista para el progreso y el particionado.
+    """
+    def __init__(self, source, count: Optional[int] = None, ranged: bool = False):
+        if ranged and (not callable(source) or count is None):
+            raise ValueError("ranged=True requiere una factory source(start, stop) y count")
+        if count is None and not callable(source) and hasattr(source, '__len__'):
+            count = len(source)
+        self.source = source
+        self.count = count
+        self.ranged = ranged
+
+    def iter_pages(self, start: int = 0, stop: Optional[int] = None):
+        """Construye y devuelve las páginas [start, stop) una a una"""
+        if self.ranged:
+            items = self.source(start, self.count if stop is None else min(stop, self.count))
+        else:
+            items = self.source() if callable(self.source) else self.source
+            if start or stop is not None:
+                items = itertools.islice(items, start, stop)
+        for item in items:
+            yield self._as_page(item)
+
+    @staticmethod
+    def _as_page(item) -> Page:
+        if isinstance(item, Page):
+            return item
+        if isinstance(item, dict):
+            return Page(**item)
+        if isinstance(item, tuple):
+            return Page(*item)
+        raise TypeError(f"Una fuente de páginas debe producir Page, tuplas o dicts, no {type(item).__name__}")
+
+
 class App:
     """Clase principal que representa una aplicación Dars"""
 
@@ -61,24 +106,23 @@ class App:
             print("Could not import PreviewServer")
             return
         
-        import shutil
+        import inspect
         import traceback
+        from dars.exporters.atomic_output import remove_output
+
+        def export_preview(app):
+            # Salida atómica: el servidor nunca sirve un build a medias, ni durante el
+            # hot reload, y el build anterior no hay que borrarlo antes (sus archivos
+            # iguales se reutilizan)
+            if 'atomic' in inspect.signature(exporter.export).parameters:
+                return exporter.export(app, preview_dir, atomic=True)
+            return exporter.export(app, preview_dir)
 
         try:
             import os
             preview_dir = os.path.abspath("./dars_preview")
             cwd_original = os.getcwd()
-            if os.path.exists(preview_dir):
-                import shutil
-                try:
-                    shutil.rmtree(preview_dir)
-                except Exception as e:
-                    if console:
-                        console.print(f"[yellow]Warning: Could not clean previous preview directory: {e}[/yellow]")
-                    else:
-                        print(f"Warning: Could not clean previous preview directory: {e}")
-            os.makedirs(preview_dir, exist_ok=True)
-            exporter.export(self, preview_dir)
+            export_preview(self)
             url = f"http://localhost:{port}"
             app_title = getattr(self, 'title', 'Dars App')
             if console:
@@ -101,7 +145,6 @@ class App:
                     return
                 try:
                     # --- HOT RELOAD ---
-                    import inspect
                     import importlib.util
                     from dars.cli.hot_reload import FileWatcher
 
@@ -138,7 +181,7 @@ class App:
                                     print("[Dars] No App instance found after reload.")
                                 return
                             # Exportar de nuevo
-                            exporter.export(new_app, preview_dir)
+                            export_preview(new_app)
                             if console:
                                 console.print("[green]App reloaded and re-exported successfully.[/green]")
                             else:
@@ -169,7 +212,7 @@ class App:
             finally:
                 os.chdir(cwd_original)
                 try:
-                    shutil.rmtree(preview_dir)
+                    remove_output(preview_dir)
                     if console:
                         console.print("[yellow]Preview files deleted.[/yellow]")
                     else:
@@ -309,9 +352,11 @@ class App:
         # Propiedades del framework
         self.root: Optional[Component] = None  # Single-page mode
         self._pages: Dict[str, Page] = {}      # Multipage mode
+        self._page_sources: List[PageSource] = []  # Páginas perezosas (add_page_source)
         self._index_page: str = None           # Nombre de la página principal (si existe)
         self.scripts: List['Script'] = []
         self.global_styles: Dict[str, Any] = {}
+        self.fonts: List[Dict[str, str]] = []  # Fuentes declaradas (add_font)
         self.event_manager = EventManager()
         self.config = config
         
@@ -343,6 +388,83 @@ class App:
             self._index_page = name
 
 
+    def add_page_source(self, source, count: Optional[int] = None, ranged: bool = False) -> PageSource:
+        """
+        Registra páginas que se construyen bajo demanda durante la exportación: cada árbol
+        se construye, se renderiza, se escribe y se descarta, en vez de vivir en App._pages.
+        Ver PageSource para los tipos de `source` admitidos. Usa una factory (no un generador)
+        si la app se va a exportar más de una vez.
+        Las páginas de fuentes no pasan por App.validate(). La index es la página marcada con
+        add_page(..., index=True) o, si no hay páginas registradas con add_page, la primera
+        página de la primera fuente.
+        """
+        page_source = PageSource(source, count=count, ranged=ranged)
+        self._page_sources.append(page_source)
+        return page_source
+
+    def page_count(self) -> Optional[int]:
+        """Número total de páginas (registradas + fuentes) o None si alguna fuente no da count"""
+        total = len(self._pages)
+        for page_source in self._page_sources:
+            if page_source.count is None:
+                return None
+            total += page_source.count
+        return total
+
+    def iter_pages(self, partition: Optional[Tuple[int, int]] = None) -> Iterator['Page']:
+        """
+        Itera todas las páginas: primero las de add_page y luego las de las fuentes, construidas
+        una a una. partition=(k, n) devuelve solo la parte k de n: un rango contiguo si se conoce
+        page_count(), o una de cada n páginas si no.
+        """
+        if partition is not None:
+            k, n = partition
+            if not 0 <= k < n:
+                raise ValueError(f"Partición inválida {k}/{n}")
+        total = self.page_count()
+        if partition is not None and total is not None:
+            start, stop = total * k // n, total * (k + 1) // n
+        else:
+            start, stop = 0, None
+
+        seen = set(self._pages)
+        position = 0
+        for page in self._pages.values():
+            if self._in_partition(position, start, stop, partition, total):
+                yield page
+            position += 1
+        for page_source in self._page_sources:
+            if stop is not None and page_source.count is not None:
+                # Rango contiguo: pedir a la fuente solo su trozo
+                local_start = max(0, start - position)
+                local_stop = max(0, min(page_source.count, stop - position))
+                offset = position
+                position += page_source.count
+                if local_start >= local_stop:
+                    continue
+                pages = enumerate(page_source.iter_pages(local_start, local_stop), start=offset + local_start)
+            else:
+                pages = enumerate(page_source.iter_pages(), start=position)
+            for page_position, page in pages:
+                if page.name in seen:
+                    raise ValueError(f"Ya existe una página con el nombre '{page.name}'")
+                seen.add(page.name)
+                if stop is None:
+                    position = page_position + 1
+                # Sin páginas de add_page, la index es la primera de la primera fuente
+                page.index = not self._pages and page_position == 0
+                if self._in_partition(page_position, start, stop, partition, total):
+                    yield page
+
+    @staticmethod
+    def _in_partition(position: int, start: int, stop: Optional[int], partition, total) -> bool:
+        if partition is None:
+            return True
+        if total is not None:
+            return start <= position < stop
+        k, n = partition
+        return position % n == k
+
     def get_page(self, name: str) -> 'Page':
         """Obtiene una página registrada por su nombre."""
         return self._pages.get(name)
@@ -369,8 +491,8 @@ class App:
         return self._pages
 
     def is_multipage(self) -> bool:
-        """Indica si la app está en modo multipágina (True si hay páginas registradas)."""
-        return bool(self._pages)
+        """Indica si la app está en modo multipágina (True si hay páginas registradas o fuentes)."""
+        return bool(self._pages or self._page_sources)
         
     def add_script(self, script: 'Script'):
         """Agrega un script a la aplicación"""
@@ -380,6 +502,11 @@ class App:
         """Agrega estilos globales a la aplicación"""
         self.global_styles[selector] = styles
         
+    def add_font(self, url: str, family: str = None, weight: str = "normal", style: str = "normal"):
+        """Declara una fuente web: se precarga en cada página y, con `family`, se genera
+        su @font-face (si no, se espera que los estilos globales ya la definan)"""
+        self.fonts.append({'url': url, 'family': family, 'weight': weight, 'style': style})
+
     def set_theme(self, theme: str):
         """Establece el tema de la aplicación"""
         self.config['theme'] = theme
@@ -526,7 +653,8 @@ class App:
         """Valida la aplicación y retorna una lista de errores"""
         errors = []
         
-        if not self.root:
+        # En multipágina cada página aporta su propia raíz
+        if not self.root and not self.is_multipage():
             errors.append("No se ha establecido un componente raíz")
             
         if not self.title:
@@ -535,6 +663,11 @@ class App:
         # Validar componentes recursivamente
         if self.root:
             errors.extend(self._validate_component(self.root))
+        for name, page in self._pages.items():
+            if not page.root:
+                errors.append(f"La página '{name}' no tiene componente raíz")
+            elif isinstance(page.root, Component):
+                errors.extend(self._validate_component(page.root, f"pages['{name}']"))
             
         return errors
         
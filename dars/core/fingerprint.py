@@ -0,0 +1,150 @@
+"""
+Fingerprints deterministas de árboles de componentes.
+
+Un fingerprint es un hash de todo lo que influye en el HTML de un subárbol:
+clase, props, estilos, eventos y, recursivamente, hijos, paneles de Tabs,
+secciones de Accordion, hijos de Tooltip, celdas de GridLayout, etc. Se usa
+para saber qué páginas hay que volver a renderizar en `dars export --watch`.
+"""
+
+import hashlib
+import types
+from typing import Any, Iterable, Optional
+
+from dars.core.component import Component
+
+# Atributos que no forman parte del contenido (referencias hacia arriba / estado del exportador)
+_SKIPPED_ATTRIBUTES = frozenset({'parent', 'fragment_store'})
+
+_SCALAR_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+_SCALAR_BASES = (bool, int, float, str, bytes)
+
+# Atributos de App que no son configuración compartida (cada página tiene su fingerprint)
+_APP_CONTENT_ATTRIBUTES = frozenset({'_pages', '_page_sources', 'root', 'event_manager'})
+
+
+def _feed(hasher, value: Any, seen: set, digests: Optional[dict] = None):
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES or isinstance(value, _SCALAR_BASES):
+        # repr distingue tipos entre sí ('1', "'1'", 'True', '1.0'), basta con él
+        hasher.update(repr(value).encode('utf-8', 'surrogatepass'))
+        return
+    if isinstance(value, (list, tuple)):
+        hasher.update(b'[' if isinstance(value, list) else b'(')
+        if all(type(item) in _SCALAR_TYPES for item in value):
+            # Camino rápido: listas de escalares (datos de Table, opciones de Select...)
+            hasher.update(repr(value).encode('utf-8', 'surrogatepass'))
+        else:
+            for item in value:
+                _feed(hasher, item, seen, digests)
+        hasher.update(b']')
+        return
+    if isinstance(value, (set, frozenset)):
+        hasher.update(b'{set')
+        for digest in sorted(fingerprint(item) for item in value):
+            hasher.update(digest.encode())
+        hasher.update(b'}')
+        return
+    if isinstance(value, dict):
+        # En orden de inserción: el orden de un dict de estilos cambia el CSS generado
+        hasher.update(b'{')
+        if all(type(item) in _SCALAR_TYPES for item in value.values()):
+            hasher.update(repr(value).encode('utf-8', 'surrogatepass'))
+        else:
+            for key, item in value.items():
+                _feed(hasher, key, seen, digests)
+                _feed(hasher, item, seen, digests)
+        hasher.update(b'}')
+        return
+    if isinstance(value, (types.FunctionType, types.MethodType)):
+        # Handlers: identidad por nombre y bytecode, no por dirección en memoria
+        function = getattr(value, '__func__', value)
+        code = getattr(function, '__code__', None)
+        hasher.update(f'fn:{function.__module__}.{function.__qualname__}'.encode())
+        if code is not None:
+            hasher.update(code.co_code)
+            _feed(hasher, [c for c in code.co_consts if not isinstance(c, types.CodeType)], seen, digests)
+        return
+
+    if digests is not None and isinstance(value, Component):
+        # Cada subárbol se hashea una sola vez: los hijos aparecen en `children` y también
+        # en `props`, y sin memo el coste crecería con 2^profundidad
+        digest = digests.get(id(value))
+        if digest is None:
+            if id(value) in seen:
+                hasher.update(b'<cycle>')
+                return
+            component_hasher = hashlib.blake2b(digest_size=16)
+            _feed_object(component_hasher, value, seen, digests)
+            digest = digests[id(value)] = component_hasher.hexdigest()
+        hasher.update(b'<c>' + digest.encode())
+        return
+    _feed_object(hasher, value, seen, digests)
+
+
+def _feed_object(hasher, value: Any, seen: set, digests: Optional[dict]):
+    marker = id(value)
+    if marker in seen:
+        hasher.update(b'<cycle>')
+        return
+    seen.add(marker)
+    try:
+        hasher.update(f'<{type(value).__module__}.{type(value).__qualname__}>'.encode())
+        get_code = getattr(value, 'get_code', None)
+        if callable(get_code) and not isinstance(value, Component):
+            # Scripts: FileScript lee el archivo, así los cambios en disco también cuentan
+            try:
+                _feed(hasher, get_code(), seen, digests)
+            except Exception:
+                pass
+        attributes = getattr(value, '__dict__', None)
+        if attributes is not None:
+            for name in sorted(attributes):
+                if name in _SKIPPED_ATTRIBUTES:
+                    continue
+                hasher.update(name.encode())
+                _feed(hasher, attributes[name], seen, digests)
+        else:
+            hasher.update(type(value).__name__.encode())
+    finally:
+        seen.discard(marker)
+
+
+def fingerprint(value: Any, digests: Optional[dict] = None) -> str:
+    """Hash estable (entre procesos) de un componente o árbol de componentes.
+    `digests` (id(componente) -> fingerprint) recoge el de cada subárbol visitado"""
+    hasher = hashlib.blake2b(digest_size=16)
+    _feed(hasher, value, set(), {} if digests is None else digests)
+    return hasher.hexdigest()
+
+
+def subtree_fingerprints(root: Any) -> dict:
+    """Fingerprint de cada componente del árbol en una sola pasada: {id(componente): hash}"""
+    digests: dict = {}
+    fingerprint(root, digests)
+    return digests
+
+
+def combine(parts: Iterable[Optional[str]]) -> str:
+    """Combina varios fingerprints en uno"""
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update((part or '-').encode())
+        hasher.update(b'|')
+    return hasher.hexdigest()
+
+
+def app_settings_fingerprint(app: Any) -> str:
+    """Fingerprint de la configuración de la App que afecta a todas las páginas
+    (título, meta, PWA, estilos globales, scripts...), sin incluir el contenido de las páginas"""
+    settings = {
+        name: value for name, value in vars(app).items()
+        if name not in _APP_CONTENT_ATTRIBUTES
+    }
+    return fingerprint(settings)
+
+
+def page_fingerprint(page: Any, digests: Optional[dict] = None) -> str:
+    """Fingerprint de una página registrada (raíz, título, meta, index y registro de plantilla)"""
+    return fingerprint([page.root, page.title, page.meta, getattr(page, 'index', False),
+                        getattr(page, 'record', None)], digests)
@@ -0,0 +1,249 @@
+"""
+Exportación directa a un archivo comprimido (zip o tar), sin directorio temporal.
+
+    exporter.export_archive(app, 'site.zip')
+    exporter.export_archive(app, 'site.tar.gz', precompress=True)
+    exporter.export_archive(app, sys.stdout.buffer, format='tar.gz')
+
+ArchiveWriter tiene la misma interfaz que OutputWriter (write_files, write, copy, flush,
+close, stats), así export() y export_archive() comparten todo el recorrido. El destino
+puede ser una ruta, cualquier stream binario con write() (no hace falta que admita seek),
+o un zipfile.ZipFile / tarfile.TarFile ya abierto (que no se cierra).
+
+El resultado es reproducible byte a byte: las entradas van en el orden de exportación,
+todas con la misma fecha (SOURCE_DATE_EPOCH si está definido; si no, 1980-01-01, la
+mínima de zip), permisos 0644 y sin usuario ni grupo. El gzip del tar.gz lleva esa
+misma fecha y ningún nombre. Con `precompress=True` cada asset de texto de más de 1 KB lleva además su
+`.gz` (y `.br` si `brotli` está instalado), como `dars serve --precompress`.
+
+Si el destino es una ruta, se escribe en un temporal junto a ella y se renombra al
+terminar: si la exportación falla, no queda un archivo a medias.
+"""
+
+import gzip
+import hashlib
+import io
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import Dict, Optional, Union
+
+from dars.exporters.output_writer import WriteStats
+
+# Sufijo -> formato (los más largos primero)
+ARCHIVE_SUFFIXES = (
+    ('.tar.gz', 'tar.gz'), ('.tgz', 'tar.gz'), ('.tar.bz2', 'tar.bz2'), ('.tar.xz', 'tar.xz'),
+    ('.tar', 'tar'), ('.zip', 'zip'),
+)
+ARCHIVE_FORMATS = ('zip', 'tar', 'tar.gz', 'tar.bz2', 'tar.xz')
+# Los mismos que precomprime dars serve
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg', '.txt', '.xml', '.map', '.webmanifest')
+PRECOMPRESS_MIN_SIZE = 1024
+# En zip se guardan sin comprimir: ya están comprimidos
+STORED_EXTENSIONS = ('.gz', '.br', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.woff', '.woff2', '.zip')
+
+# 1980-01-01T00:00:00Z, la fecha más antigua que admite zip
+_ZIP_EPOCH = 315532800
+
+
+def archive_format(path: str) -> Optional[str]:
+    """Formato de archivo según la extensión de `path`, o None si no es un archivo comprimido"""
+    lowered = str(path).lower()
+    for suffix, name in ARCHIVE_SUFFIXES:
+        if lowered.endswith(suffix):
+            return name
+    return None
+
+
+def source_date_epoch() -> int:
+    """Fecha de todas las entradas (https://reproducible-builds.org/specs/source-date-epoch/)"""
+    value = os.environ.get('SOURCE_DATE_EPOCH')
+    if value:
+        try:
+            return max(_ZIP_EPOCH, int(value))
+        except ValueError:
+            pass
+    return _ZIP_EPOCH
+
+
+def _precompressors():
+    compressors = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    try:
+        import brotli
+    except ImportError:
+        return compressors
+    compressors.append(('.br', brotli.compress))
+    return compressors
+
+
+class ArchiveWriter:
+    """Escribe los archivos de una exportación como entradas de un zip o un tar"""
+
+    def __init__(self, target: Union[str, os.PathLike, io.RawIOBase, zipfile.ZipFile, tarfile.TarFile],
+                 format: Optional[str] = None, precompress: bool = False,
+                 compresslevel: Optional[int] = None):
+        self.stats = WriteStats()
+        self.mtime = source_date_epoch()
+        self.compresslevel = compresslevel
+        self._precompressors = _precompressors() if precompress else []
+        # Nombre -> hash: una entrada repetida igual se salta; distinta es un error
+        self._entries: Dict[str, bytes] = {}
+        self._stream = None          # stream que abrimos nosotros (se cierra al final)
+        self._gzip = None            # capa gzip de tar.gz
+        self._path: Optional[str] = None
+        self._temp_path: Optional[str] = None
+        self._owns_archive = True
+
+        if isinstance(target, zipfile.ZipFile):
+            self.format, self._zip, self._tar, self._owns_archive = 'zip', target, None, False
+            return
+        if isinstance(target, tarfile.TarFile):
+            self.format, self._zip, self._tar, self._owns_archive = 'tar', None, target, False
+            return
+
+        if isinstance(target, (str, os.PathLike)):
+            self._path = os.path.abspath(os.fspath(target))
+            format = format or archive_format(self._path)
+            if format is None:
+                raise ValueError(f"No se reconoce el formato de archivo de {self._path} (usa {', '.join(ARCHIVE_FORMATS)})")
+        format = format or 'zip'
+        if format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Formato de archivo desconocido: {format!r} (usa {', '.join(ARCHIVE_FORMATS)})")
+        self.format = format
+
+        if self._path is not None:
+            directory = os.path.dirname(self._path)
+            os.makedirs(directory, exist_ok=True)
+            fd, self._temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(self._path) + '.',
+                                                   suffix='.tmp')
+            stream = self._stream = os.fdopen(fd, 'wb')
+        else:
+            stream = target
+
+        self._zip = self._tar = None
+        if format == 'zip':
+            self._zip = zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+        elif format == 'tar.gz':
+            self._gzip = gzip.GzipFile(filename='', mode='wb', fileobj=stream, mtime=self.mtime,
+                                       compresslevel=9 if compresslevel is None else compresslevel)
+            self._tar = tarfile.open(fileobj=self._gzip, mode='w|', format=tarfile.PAX_FORMAT)
+        else:
+            mode = {'tar': 'w|', 'tar.bz2': 'w|bz2', 'tar.xz': 'w|xz'}[format]
+            self._tar = tarfile.open(fileobj=stream, mode=mode, format=tarfile.PAX_FORMAT)
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.shutdown()
+
+    # --- API (la de OutputWriter) ---
+
+    def write_files(self, files: Dict[str, Union[str, bytes]]):
+        for relative_path, content in files.items():
+            self.write(relative_path, content)
+
+    def write(self, relative_path: str, content: Union[str, bytes]):
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        name = relative_path.replace(os.sep, '/')
+        if not self._add_entry(name, data):
+            return
+        if self._precompressors and name.endswith(COMPRESSIBLE_EXTENSIONS) and len(data) >= PRECOMPRESS_MIN_SIZE:
+            for suffix, compress in self._precompressors:
+                compressed = compress(data)
+                if len(compressed) < len(data):
+                    self._add_entry(name + suffix, compressed)
+
+    def write_now(self, relative_path: str, content: Union[str, bytes]):
+        self.write(relative_path, content)
+
+    def copy(self, source_path: str, relative_path: str):
+        with open(source_path, 'rb') as f:
+            self.write(relative_path, f.read())
+
+    def ensure_directories(self, relative_paths):
+        """Sin directorios en el archivo: los crea quien lo extrae"""
+
+    def flush(self):
+        """Las entradas se escriben al momento; no hay nada pendiente"""
+
+    def close(self):
+        """Termina el archivo (y lo pone en su ruta, si se dio una)"""
+        try:
+            self._close_layers()
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+                # mkstemp crea el archivo solo para su dueño
+                os.chmod(self._temp_path, 0o644)
+                os.replace(self._temp_path, self._path)
+                self._temp_path = None
+        finally:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Descarta el archivo a medio escribir si la exportación no terminó (un stream
+        ajeno se queda con un archivo válido pero incompleto)"""
+        try:
+            self._close_layers()
+        except Exception:
+            pass  # ya se está tratando otro error
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._temp_path is not None:
+            try:
+                os.unlink(self._temp_path)
+            except FileNotFoundError:
+                pass
+            self._temp_path = None
+
+    def _close_layers(self):
+        """Cierra zip/tar y gzip (una vez), salvo si el ZipFile/TarFile es del llamador"""
+        if not self._owns_archive:
+            return
+        archive, self._zip, self._tar = self._zip or self._tar, None, None
+        if archive is not None:
+            archive.close()
+        if self._gzip is not None:
+            gzip_file, self._gzip = self._gzip, None
+            gzip_file.close()
+
+    # --- implementación ---
+
+    def _add_entry(self, name: str, data: bytes) -> bool:
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        known = self._entries.get(name)
+        if known is not None:
+            if known != digest:
+                raise ValueError(f"{name} se escribe dos veces con contenido distinto")
+            self.stats.files_skipped += 1
+            self.stats.bytes_skipped += len(data)
+            return False
+        self._entries[name] = digest
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=_zip_date_time(self.mtime))
+            info.external_attr = 0o100644 << 16
+            info.create_system = 3  # Unix, en cualquier plataforma: así los bytes no cambian
+            compress_type = zipfile.ZIP_STORED if name.endswith(STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data, compress_type=compress_type, compresslevel=self.compresslevel)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self.mtime
+            info.mode = 0o644
+            info.uid = info.gid = 0
+            info.uname = info.gname = ''
+            self._tar.addfile(info, io.BytesIO(data))
+        self.stats.files_written += 1
+        self.stats.bytes_written += len(data)
+        return True
+
+
+def _zip_date_time(timestamp: int):
+    return time.gmtime(timestamp)[:6]
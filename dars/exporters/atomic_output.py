@@ -0,0 +1,227 @@
+"""
+Salida atómica: el build se hace en un directorio aparte y después sustituye al de
+salida de una vez, así un servidor o una preview nunca ven un build a medias.
+
+    swap = AtomicOutput('dist')
+    build_dir = swap.begin()
+    ...exportar en build_dir (reutilizando archivos de swap.current_path)...
+    swap.commit()           # o swap.abort() si falla
+
+Dos formas de hacer el cambio:
+
+  - 'symlink': `dist` es un enlace simbólico a `.dist-builds/<build>`. Cada build se hace
+    en un directorio nuevo y el enlace se sustituye con os.replace, que es atómico: cada
+    lectura ve el build anterior o el nuevo completo. Se conservan los `keep` builds
+    anteriores para las lecturas que aún estén en curso.
+  - 'rename': `dist` es un directorio normal. El build se hace en `.dist.staging-*` y se
+    intercambia con `dist` de una vez (renameat2 con RENAME_EXCHANGE, Linux); el anterior
+    se borra después. Sin RENAME_EXCHANGE se hacen dos renombrados, y entre ellos hay un
+    instante en que `dist` no existe.
+
+'auto' usa 'symlink' si el sistema permite crear enlaces simbólicos y la salida ya es un
+enlace, no existe todavía, o es un directorio normal que se puede intercambiar por el
+enlace con RENAME_EXCHANGE (la primera vez pasa a ser un build más, sin ningún instante
+sin salida). Si no, usa 'rename', y avisa (RuntimeWarning) si el cambio no será atómico.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from typing import Optional
+
+MODES = ('auto', 'symlink', 'rename')
+
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+def _symlinks_supported(directory: str) -> bool:
+    """En Windows crear enlaces simbólicos puede requerir permisos: se prueba una vez"""
+    if os.name != 'nt':
+        return True
+    probe = os.path.join(directory, f'.dars-symlink-probe-{os.getpid()}')
+    try:
+        os.symlink('.', probe, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        return False
+    os.unlink(probe)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _renameat2():
+    """renameat2 de la libc (Linux, glibc >= 2.28), o None"""
+    if not sys.platform.startswith('linux'):
+        return None
+    libc_name = ctypes.util.find_library('c')
+    if not libc_name:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+    except OSError:
+        return None
+    return getattr(libc, 'renameat2', None)
+
+
+def exchange_paths(a: str, b: str):
+    """Intercambia `a` y `b` de una vez (renameat2 con RENAME_EXCHANGE): ninguna de las dos
+    rutas deja de existir en ningún momento. OSError si el sistema o el disco no lo permiten"""
+    renameat2 = _renameat2()
+    if renameat2 is None:
+        raise OSError(errno.ENOSYS, "renameat2 no disponible", a, None, b)
+    if renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) != 0:
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code), a, None, b)
+
+
+def _exchange_supported(directory: str) -> bool:
+    """RENAME_EXCHANGE depende también del sistema de archivos: se prueba en `directory`"""
+    if _renameat2() is None:
+        return False
+    first = tempfile.mkdtemp(prefix='.dars-exchange-probe-', dir=directory)
+    second = tempfile.mkdtemp(prefix='.dars-exchange-probe-', dir=directory)
+    try:
+        exchange_paths(first, second)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.rmdir(first)
+        os.rmdir(second)
+
+
+class AtomicOutput:
+    """Un build atómico de `output_path` (ver el docstring del módulo)"""
+
+    def __init__(self, output_path: str, mode: str = 'auto', keep: int = 1):
+        if mode not in MODES:
+            raise ValueError(f"Modo de salida atómica desconocido: {mode!r} (usa {', '.join(MODES)})")
+        # abspath y no realpath: si la salida es un enlace, se sustituye el enlace
+        self.output_path = os.path.abspath(output_path).rstrip(os.sep)
+        self.parent, self.name = os.path.split(self.output_path)
+        self.builds_path = os.path.join(self.parent, f'.{self.name}-builds')
+        self.keep = max(0, keep)
+        os.makedirs(self.parent, exist_ok=True)
+        if mode == 'auto':
+            if os.path.islink(self.output_path) or not os.path.exists(self.output_path):
+                mode = 'symlink' if _symlinks_supported(self.parent) else 'rename'
+            elif _exchange_supported(self.parent):
+                # Un directorio normal se cambia por el enlace (o por el build) de una vez
+                mode = 'symlink' if _symlinks_supported(self.parent) else 'rename'
+            else:
+                warnings.warn(
+                    f"{self.output_path} es un directorio y este sistema no puede sustituirlo de una vez "
+                    f"(RENAME_EXCHANGE): se usa el modo 'rename', con un instante en que la salida no existe. "
+                    f"Bórralo una vez para pasar al modo 'symlink'", RuntimeWarning, stacklevel=2)
+                mode = 'rename'
+        self.mode = mode
+        self.staging_path: Optional[str] = None
+
+    @property
+    def current_path(self) -> Optional[str]:
+        """Directorio del build publicado ahora (del que se enlazan los archivos iguales)"""
+        if os.path.isdir(self.output_path):
+            return os.path.realpath(self.output_path)
+        return None
+
+    def begin(self) -> str:
+        """Crea el directorio donde se construye el build nuevo y lo devuelve"""
+        if self.mode == 'symlink':
+            os.makedirs(self.builds_path, exist_ok=True)
+            path = tempfile.mkdtemp(prefix=time.strftime('%Y%m%d-%H%M%S-'), dir=self.builds_path)
+        else:
+            path = tempfile.mkdtemp(prefix=f'.{self.name}.staging-', dir=self.parent)
+        # mkdtemp crea el directorio solo para su dueño; el servidor web tiene que poder leerlo
+        os.chmod(path, 0o755)
+        self.staging_path = path
+        return path
+
+    def commit(self):
+        """Publica el build nuevo en output_path"""
+        if self.staging_path is None:
+            raise RuntimeError("AtomicOutput.commit() sin begin()")
+        if self.mode == 'symlink':
+            self._flip_symlink()
+        else:
+            self._swap_rename()
+        self.staging_path = None
+
+    def abort(self):
+        """Descarta el build nuevo; la salida publicada no cambia"""
+        if self.staging_path is not None:
+            shutil.rmtree(self.staging_path, ignore_errors=True)
+            self.staging_path = None
+
+    # --- implementación ---
+
+    def _flip_symlink(self):
+        previous = os.path.realpath(self.output_path) if os.path.islink(self.output_path) else None
+        link = os.path.join(self.parent, f'.{self.name}.link-{os.getpid()}')
+        if os.path.lexists(link):
+            os.unlink(link)
+        os.symlink(os.path.relpath(self.staging_path, self.parent), link, target_is_directory=True)
+        if os.path.isdir(self.output_path) and previous is None:
+            # Primera vez con una salida que era un directorio normal: pasa a ser un build más
+            previous = tempfile.mkdtemp(prefix='previous-', dir=self.builds_path)
+            os.rmdir(previous)
+            try:
+                # El enlace y el directorio se intercambian de una vez; el directorio queda en `link`
+                exchange_paths(link, self.output_path)
+                os.rename(link, previous)
+            except OSError:
+                # Sin RENAME_EXCHANGE (modo 'symlink' explícito): hay un instante sin salida
+                os.rename(self.output_path, previous)
+                os.replace(link, self.output_path)
+        else:
+            os.replace(link, self.output_path)
+        self._prune_builds(os.path.realpath(self.staging_path), previous)
+
+    def _prune_builds(self, current: str, previous: Optional[str]):
+        """Borra los builds viejos, salvo el publicado y los `keep` anteriores más recientes"""
+        keep_paths = {current, previous} if self.keep else {current}
+        builds = []
+        for entry in os.scandir(self.builds_path):
+            path = os.path.realpath(entry.path)
+            if path in keep_paths or not entry.is_dir(follow_symlinks=False):
+                continue
+            builds.append((entry.stat(follow_symlinks=False).st_mtime, path))
+        builds.sort(reverse=True)
+        # El anterior publicado ya cuenta como uno de los `keep`
+        for _mtime, path in builds[max(0, self.keep - 1):]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _swap_rename(self):
+        if not os.path.lexists(self.output_path):
+            os.rename(self.staging_path, self.output_path)
+            return
+        try:
+            # El build nuevo y el publicado se intercambian de una vez; el anterior queda en staging
+            exchange_paths(self.staging_path, self.output_path)
+            old = self.staging_path
+        except OSError:
+            old = tempfile.mkdtemp(prefix=f'.{self.name}.old-', dir=self.parent)
+            os.rmdir(old)
+            os.rename(self.output_path, old)
+            os.rename(self.staging_path, self.output_path)
+        if os.path.islink(old):
+            os.unlink(old)
+        else:
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def remove_output(output_path: str):
+    """Borra una salida, sea un directorio normal o un enlace con sus builds"""
+    output_path = os.path.abspath(output_path).rstrip(os.sep)
+    if os.path.islink(output_path):
+        parent, name = os.path.split(output_path)
+        os.unlink(output_path)
+        shutil.rmtree(os.path.join(parent, f'.{name}-builds'), ignore_errors=True)
+    elif os.path.isdir(output_path):
+        shutil.rmtree(output_path)
@@ -1,7 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 import os
 
+# on_progress(completados, total, descripción) de una exportación, para barras de progreso;
+# total es None si el número de pasos no se conoce. Se pasa a cada export(), no al exportador
+ProgressCallback = Callable[[int, Optional[int], str], None]
+
+
+class ExportResult:
+    """Resultado de una exportación. Es verdadero si terminó bien (así `if exporter.export(...)`
+    sigue funcionando) y lleva los datos de esa exportación, no del exportador: una misma
+    instancia puede exportar varias apps a la vez desde hilos distintos.
+
+    write_stats: WriteStats del escritor (archivos y bytes escritos / sin cambios)
+    bundle_report: BundleReport en modo bundle, si no None
+    error: la excepción si falló"""
+
+    __slots__ = ('ok', 'write_stats', 'bundle_report', 'error')
+
+    def __init__(self, ok: bool = True, write_stats=None, bundle_report=None,
+                 error: Optional[BaseException] = None):
+        self.ok = ok
+        self.write_stats = write_stats
+        self.bundle_report = bundle_report
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        return f"ExportResult(ok={self.ok!r}, error={self.error!r})"
+
+
 class Exporter(ABC):
     """Clase base para todos los exportadores"""
     
@@ -10,7 +40,8 @@ class Exporter(ABC):
         
     @abstractmethod
     def export(self, app: 'App', output_path: str) -> bool:
-        """Exporta la aplicación al formato específico"""
+        """Exporta la aplicación al formato específico. Puede devolver un ExportResult,
+        que es verdadero si la exportación terminó bien"""
         pass
         
     @abstractmethod
@@ -0,0 +1,143 @@
+"""
+Exportación incremental: re-renderiza solo las páginas cuyo fingerprint cambió
+y escribe solo los archivos cuyo contenido es distinto del que ya hay en disco.
+
+Lo usa `dars export --watch`; funciona con cualquier exportador que implemente
+`render_shared_files`, `iter_page_targets` y `render_page_files`.
+"""
+
+import hashlib
+import os
+import time
+from typing import Dict, Optional, Set
+
+from dars.core.fingerprint import app_settings_fingerprint, combine, page_fingerprint, fingerprint
+
+
+class BuildReport:
+    """Resumen de una (re)construcción incremental"""
+
+    def __init__(self):
+        self.elapsed_ms = 0.0
+        self.pages_rendered = 0
+        self.pages_skipped = 0
+        self.files_written = 0
+        self.files_unchanged = 0
+        self.files_removed = 0
+        self.bytes_written = 0
+        self.rendered_pages = []
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'elapsed_ms': round(self.elapsed_ms, 2),
+            'pages_rendered': self.pages_rendered,
+            'pages_skipped': self.pages_skipped,
+            'files_written': self.files_written,
+            'files_unchanged': self.files_unchanged,
+            'files_removed': self.files_removed,
+            'bytes_written': self.bytes_written,
+            'rendered_pages': list(self.rendered_pages),
+        }
+
+
+class IncrementalBuilder:
+    """Mantiene el estado entre builds: fingerprint por página y hash por archivo escrito"""
+
+    def __init__(self, exporter, output_path: str):
+        self.exporter = exporter
+        self.output_path = os.path.abspath(output_path)
+        self._settings_key: Optional[str] = None
+        self._page_keys: Dict[str, str] = {}
+        self._page_files: Dict[str, Set[str]] = {}
+        self._shared_files: Set[str] = set()
+        self._digests: Dict[str, str] = {}
+        if getattr(exporter, 'plan_cache', False) is None:
+            # Entre rebuilds, los subárboles que no cambian se renderizan con su plan precompilado
+            from dars.exporters.web.render_plan import PlanCache
+            exporter.plan_cache = PlanCache()
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _write_if_changed(self, relative_path: str, content: str, report: BuildReport):
+        path = os.path.join(self.output_path, relative_path)
+        data = content.encode('utf-8')
+        digest = self._digest(data)
+        known = self._digests.get(relative_path)
+        if known is None and os.path.isfile(path) and os.path.getsize(path) == len(data):
+            # Primer build sobre un directorio existente: comparar con lo que hay en disco
+            with open(path, 'rb') as f:
+                known = self._digest(f.read())
+        if known == digest and os.path.isfile(path):
+            self._digests[relative_path] = digest
+            report.files_unchanged += 1
+            return
+        self.exporter.write_file(path, content)
+        self._digests[relative_path] = digest
+        report.files_written += 1
+        report.bytes_written += len(data)
+
+    def _remove(self, relative_path: str, report: BuildReport):
+        self._digests.pop(relative_path, None)
+        path = os.path.join(self.output_path, relative_path)
+        if os.path.isfile(path):
+            os.remove(path)
+            report.files_removed += 1
+
+    def _render_page_files(self, app, slug, page, is_index: bool, subtree_keys: Dict[int, str]):
+        """render_page_files pasando al exportador los fingerprints de subárbol ya calculados"""
+        if getattr(self.exporter, 'plan_cache', None) is None:
+            return self.exporter.render_page_files(app, slug, page, is_index)
+        return self.exporter.render_page_files(app, slug, page, is_index, subtree_keys=subtree_keys)
+
+    def build(self, app) -> BuildReport:
+        """Construye (o reconstruye) la app en output_path y devuelve el informe"""
+        report = BuildReport()
+        started = time.perf_counter()
+        self.exporter.create_output_directory(self.output_path)
+
+        settings_key = app_settings_fingerprint(app)
+        settings_changed = settings_key != self._settings_key
+        previous_files = set(self._shared_files).union(*self._page_files.values()) if self._page_files else set(self._shared_files)
+
+        page_keys: Dict[str, str] = {}
+        page_files: Dict[str, Set[str]] = {}
+        for slug, page, is_index in self.exporter.iter_page_targets(app):
+            name = slug if slug is not None else 'index'
+            subtree_keys: Dict[int, str] = {}
+            content_key = page_fingerprint(page, subtree_keys) if page is not None else fingerprint(app.root, subtree_keys)
+            key = combine([settings_key, content_key, str(is_index)])
+            page_keys[name] = key
+            if self._page_keys.get(name) == key and name in self._page_files:
+                page_files[name] = self._page_files[name]
+                report.pages_skipped += 1
+                continue
+            files = self._render_page_files(app, slug, page, is_index, subtree_keys)
+            for relative_path, content in files.items():
+                self._write_if_changed(relative_path, content, report)
+            page_files[name] = set(files)
+            report.pages_rendered += 1
+            report.rendered_pages.append(name)
+
+        # Los archivos compartidos que una página también genera (styles.css, script.js de la
+        # index) pertenecen a la página: así no se pisan cuando esa página no se re-renderiza
+        claimed = set().union(*page_files.values())
+        shared = self.exporter.render_shared_files(app)
+        for relative_path, content in shared.items():
+            if relative_path not in claimed:
+                self._write_if_changed(relative_path, content, report)
+        self._shared_files = set(shared)
+
+        current_files = set(self._shared_files).union(*page_files.values())
+        for relative_path in sorted(previous_files - current_files):
+            self._remove(relative_path, report)
+        self._page_keys = page_keys
+        self._page_files = page_files
+
+        if settings_changed and getattr(app, 'pwa_enabled', False) and hasattr(self.exporter, '_generate_pwa_files'):
+            self.exporter._generate_pwa_files(app, self.output_path)
+        self._settings_key = settings_key
+
+        report.elapsed_ms = (time.perf_counter() - started) * 1000
+        return report
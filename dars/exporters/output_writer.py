@@ -0,0 +1,241 @@
+"""
+Escritura de los archivos de una exportación.
+
+    with OutputWriter('dist') as writer:
+        writer.write_files({'index.html': html, 'styles.css': css})
+        writer.copy('icon.png', 'icons/icon.png')
+    print(writer.stats.to_dict())
+
+  - Los directorios se crean por lotes: una vez por directorio y exportación, antes de
+    encolar los archivos del lote, y no un os.makedirs por archivo.
+  - Los archivos se escriben en un pool de hilos (`workers`). Como mucho hay `max_pending`
+    archivos en cola: si el disco va por detrás, quien encola espera y la memoria no crece.
+  - Si ya existe un archivo con el mismo tamaño y el mismo hash, no se reescribe (no
+    cambia su mtime y no se hace ninguna escritura, lo que en sistemas de archivos de red
+    es lo que más tarda).
+  - Con `link_from` (el build publicado, ver atomic_output.py), un archivo que no existe
+    en la salida pero es igual al de `link_from` se enlaza (hardlink) en vez de escribirse.
+    Un archivo con más de un enlace nunca se modifica en su sitio: se borra y se crea de
+    nuevo, así un build no puede cambiar los archivos de otro.
+
+El primer error de escritura se relanza en la siguiente llamada o al cerrar.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Union
+
+
+class WriteStats:
+    """Resumen de lo escrito: archivos y bytes escritos frente a los que ya estaban iguales"""
+
+    def __init__(self):
+        self.files_written = 0
+        self.files_skipped = 0
+        # De los saltados, los enlazados desde `link_from`
+        self.files_linked = 0
+        self.bytes_written = 0
+        self.bytes_skipped = 0
+        # Directorios preparados (un os.makedirs por directorio y exportación)
+        self.directories = 0
+        # Tiempo que quien encola pasó esperando al pool (cola llena o cierre)
+        self.wait_ms = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'files_written': self.files_written,
+            'files_skipped': self.files_skipped,
+            'files_linked': self.files_linked,
+            'bytes_written': self.bytes_written,
+            'bytes_skipped': self.bytes_skipped,
+            'directories': self.directories,
+            'wait_ms': round(self.wait_ms, 2),
+        }
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class OutputWriter:
+    """Escritor en segundo plano para un directorio de salida (ver el docstring del módulo)"""
+
+    def __init__(self, output_path: str, workers: int = 4, max_pending: int = 64,
+                 link_from: Optional[str] = None):
+        self.output_path = output_path
+        self.link_from = link_from
+        self.workers = max(1, workers)
+        self.stats = WriteStats()
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._lock = threading.Lock()
+        self._directories = set()
+        self._pool = None
+        self._pending = 0
+        self._idle = threading.Condition(self._lock)
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> 'OutputWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Ya hay un error: esperar a los hilos sin taparlo con otro
+            self.shutdown()
+
+    # --- API ---
+
+    def write_files(self, files: Dict[str, Union[str, bytes]]):
+        """Encola un lote {ruta relativa: contenido}"""
+        self._raise_error()
+        self.ensure_directories(files)
+        for relative_path, content in files.items():
+            self._submit(self._write, relative_path, content)
+
+    def write(self, relative_path: str, content: Union[str, bytes]):
+        self.write_files({relative_path: content})
+
+    def copy(self, source_path: str, relative_path: str):
+        """Encola la copia de un archivo (se lee en el hilo que lo escribe)"""
+        self._raise_error()
+        self.ensure_directories((relative_path,))
+        self._submit(self._copy, source_path, relative_path)
+
+    def write_now(self, relative_path: str, content: Union[str, bytes]):
+        """Escribe en el hilo actual (para quien ya tiene su propio pool)"""
+        self.ensure_directories((relative_path,))
+        self._write(relative_path, content)
+
+    def ensure_directories(self, relative_paths: Iterable[str]):
+        """Crea de una vez los directorios que faltan para estas rutas"""
+        missing = set()
+        with self._lock:
+            for relative_path in relative_paths:
+                directory = os.path.dirname(os.path.join(self.output_path, relative_path))
+                if directory not in self._directories:
+                    missing.add(directory)
+        # Ordenados, los padres van antes que los hijos
+        for directory in sorted(missing):
+            os.makedirs(directory, exist_ok=True)
+            with self._lock:
+                self._directories.add(directory)
+                self.stats.directories += 1
+
+    def flush(self):
+        """Espera a que se escriba todo lo encolado"""
+        started = time.perf_counter()
+        with self._idle:
+            while self._pending:
+                self._idle.wait()
+        self.stats.wait_ms += (time.perf_counter() - started) * 1000
+        self._raise_error()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = True):
+        """Para el pool sin relanzar errores (close() además espera y los relanza)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    # --- implementación ---
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _submit(self, function, *args):
+        if not self._slots.acquire(blocking=False):
+            started = time.perf_counter()
+            self._slots.acquire()
+            self.stats.wait_ms += (time.perf_counter() - started) * 1000
+        with self._lock:
+            if self._pool is None:
+                # concurrent.futures solo se importa si de verdad se escribe algo
+                from concurrent.futures import ThreadPoolExecutor
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='dars-output')
+            self._pending += 1
+        try:
+            self._pool.submit(self._run, function, args)
+        except BaseException:
+            self._done()
+            raise
+
+    def _run(self, function, args):
+        try:
+            if self._error is None:
+                function(*args)
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+        finally:
+            self._done()
+
+    def _done(self):
+        self._slots.release()
+        with self._idle:
+            self._pending -= 1
+            if not self._pending:
+                self._idle.notify_all()
+
+    def _copy(self, source_path: str, relative_path: str):
+        with open(source_path, 'rb') as f:
+            data = f.read()
+        self._write(relative_path, data)
+
+    def _write(self, relative_path: str, content: Union[str, bytes]):
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        path = os.path.join(self.output_path, relative_path)
+        existing = _stat(path)
+        if _same_content(path, existing, data):
+            self._skipped(data)
+            return
+        if existing is None and self.link_from is not None:
+            source = os.path.join(self.link_from, relative_path)
+            if _same_content(source, _stat(source), data):
+                try:
+                    os.link(source, path)
+                    self._skipped(data, linked=True)
+                    return
+                except OSError:
+                    pass  # otro sistema de archivos o sin soporte de hardlinks: se escribe
+        if existing is not None and existing.st_nlink > 1:
+            os.unlink(path)
+        with open(path, 'wb') as f:
+            f.write(data)
+        with self._lock:
+            self.stats.files_written += 1
+            self.stats.bytes_written += len(data)
+
+    def _skipped(self, data: bytes, linked: bool = False):
+        with self._lock:
+            self.stats.files_skipped += 1
+            self.stats.bytes_skipped += len(data)
+            if linked:
+                self.stats.files_linked += 1
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _same_content(path: str, stat: Optional[os.stat_result], data: bytes) -> bool:
+    """Mismo tamaño y mismo hash que el archivo que ya hay en disco"""
+    if stat is None or stat.st_size != len(data):
+        return False
+    try:
+        with open(path, 'rb') as f:
+            return _digest(f.read()) == _digest(data)
+    except OSError:
+        return False
@@ -0,0 +1,421 @@
+"""
+Export profiler - tiempo y memoria por fase y tiempo de render por clase de componente
+
+Uso:
+    profiler = ExportProfiler()
+    with profiler.phase('load'):
+        app = ...
+    with profiler.attach(exporter):
+        exporter.export(app, 'dist')
+    profiler.print_report()
+    profiler.write_json('dars-profile.json')
+    profiler.write_chrome_trace('dars-trace.json')   # chrome://tracing o ui.perfetto.dev
+
+Con memory_report=True además se mide el pico de memoria de cada fase
+(tracemalloc.reset_peak) y se guardan los sitios que más memoria ocupan al
+terminar la página más pesada. Esa captura no cuenta en el tiempo ni en el pico
+de ninguna fase.
+
+La escritura se mide en el escritor de cada exportación (OutputWriter): `write` es el
+tiempo de sus hilos escribiendo archivos (sumado entre hilos, en paralelo con el
+render) y `write_wait` el que el render espera en flush()/close() a que terminen.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+# Métodos del exportador que se miden como fase: (método, fase)
+PROFILED_METHODS = (
+    ('render_shared_files', 'shared'),
+    ('generate_css', 'css'),
+    ('generate_javascript', 'js'),
+    ('render_page_files', 'page'),
+    ('generate_html', 'html'),
+    ('prettify_html', 'prettify'),
+    ('_generate_pwa_files', 'pwa'),
+)
+
+
+class PhaseStats:
+    """Acumulado de una fase: llamadas, tiempo total, tiempo propio y memoria neta asignada"""
+
+    __slots__ = ('calls', 'wall', 'self_time', 'allocated', 'peak')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.self_time = 0.0
+        self.allocated = 0
+        self.peak = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'wall_ms': round(self.wall * 1000, 3),
+            'self_ms': round(self.self_time * 1000, 3),
+            'allocated_bytes': self.allocated,
+            'peak_bytes': self.peak,
+        }
+
+
+class ComponentStats:
+    """Tiempo de render por clase: inclusivo (con hijos) y exclusivo (solo el componente)"""
+
+    __slots__ = ('calls', 'inclusive', 'exclusive')
+
+    def __init__(self):
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'inclusive_ms': round(self.inclusive * 1000, 3),
+            'exclusive_ms': round(self.exclusive * 1000, 3),
+        }
+
+
+class ExportProfiler:
+    """Recoge fases anidadas, render por componente y eventos para Chrome trace"""
+
+    def __init__(self, track_allocations: bool = True, memory_report: bool = False, top_sites: int = 10):
+        self.memory_report = memory_report
+        self.track_allocations = track_allocations or memory_report
+        self.top_sites = top_sites
+        self.allocation_sites: List[Dict[str, Any]] = []
+        self.heaviest_page: Optional[str] = None
+        self._heaviest_page_peak = -1
+        self.phases: Dict[str, PhaseStats] = {}
+        self.pages: Dict[str, float] = {}
+        self.components: Dict[str, ComponentStats] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.peak_bytes = 0
+        # Hits/misses/evictions de las cachés del exportador durante la exportación
+        self.caches: Dict[str, Dict[str, int]] = {}
+        # Archivos y bytes escritos frente a los que no cambiaron (OutputWriter)
+        self.output: Optional[Dict[str, Any]] = None
+        self._origin = time.perf_counter()
+        self._phase_stack: List[List[float]] = []
+        self._component_stack: List[float] = []
+        self._started_tracemalloc = False
+        # Tiempo del propio profiler (captura de sitios) que se descuenta de las fases abiertas
+        self._paused = 0.0
+        # Los hilos del escritor acumulan en la fase 'write' a la vez
+        self._lock = threading.Lock()
+
+    # --- Medición ---
+
+    def _memory(self) -> int:
+        if not self.track_allocations:
+            return 0
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return tracemalloc.get_traced_memory()[0]
+
+    @contextmanager
+    def phase(self, name: str, **args):
+        """Mide una fase; las fases pueden anidarse (page > html > prettify)"""
+        memory_before = self._memory()
+        if self.memory_report:
+            # El pico acumulado hasta aquí pertenece a la fase padre; luego se reinicia para medir esta
+            self._fold_peak()
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        paused = self._paused
+        frame = [0.0, memory_before]  # tiempo de fases hijas, memoria máxima vista dentro de la fase
+        self._phase_stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started - (self._paused - paused)
+            self._phase_stack.pop()
+            if self._phase_stack:
+                self._phase_stack[-1][0] += elapsed
+            stats = self.phases.setdefault(name, PhaseStats())
+            stats.calls += 1
+            stats.wall += elapsed
+            stats.self_time += elapsed - frame[0]
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                stats.allocated += current - memory_before
+                self.peak_bytes = max(self.peak_bytes, peak)
+                if self.memory_report:
+                    phase_peak = max(frame[1], peak)
+                    stats.peak = max(stats.peak, phase_peak - memory_before)
+                    if self._phase_stack:
+                        self._phase_stack[-1][1] = max(self._phase_stack[-1][1], phase_peak)
+                    if name == 'page' and phase_peak - memory_before > self._heaviest_page_peak:
+                        self._heaviest_page_peak = phase_peak - memory_before
+                        self.heaviest_page = args.get('page')
+                        self._capture_allocation_sites()
+            event = {
+                'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                'ts': round((started - self._origin) * 1e6, 3), 'dur': round(elapsed * 1e6, 3),
+            }
+            if args:
+                event['args'] = args
+            self.events.append(event)
+
+    def _fold_peak(self):
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peak_bytes = max(self.peak_bytes, peak)
+        if self._phase_stack:
+            self._phase_stack[-1][1] = max(self._phase_stack[-1][1], peak)
+
+    def _capture_allocation_sites(self):
+        """Sitios (archivo:línea) con más memoria viva en este momento, sin contar tracemalloc.
+        Queda fuera de las mediciones: su tiempo se descuenta de las fases abiertas y el pico
+        se reinicia después, para que la memoria del snapshot no cuente"""
+        self._fold_peak()
+        started = time.perf_counter()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        self.allocation_sites = [
+            {
+                'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                'size_bytes': stat.size,
+                'count': stat.count,
+            }
+            for stat in snapshot.statistics('lineno')[:self.top_sites]
+        ]
+        snapshot = None
+        tracemalloc.reset_peak()
+        self._paused += time.perf_counter() - started
+
+    def _wrap_phase(self, method, name: str):
+        profiler = self
+
+        if name == 'page':
+            def wrapper(app, slug, page, is_index, *args, **kwargs):
+                label = slug or 'index'
+                started = time.perf_counter()
+                paused = profiler._paused
+                with profiler.phase(name, page=label):
+                    result = method(app, slug, page, is_index, *args, **kwargs)
+                elapsed = time.perf_counter() - started - (profiler._paused - paused)
+                profiler.pages[label] = profiler.pages.get(label, 0.0) + elapsed
+                return result
+            return wrapper
+
+        def wrapper(*args, **kwargs):
+            with profiler.phase(name):
+                return method(*args, **kwargs)
+        return wrapper
+
+    def _wrap_render_component(self, method):
+        profiler = self
+
+        def render_component(component, context=None):
+            started = time.perf_counter()
+            profiler._component_stack.append(0.0)
+            try:
+                return method(component, context)
+            finally:
+                elapsed = time.perf_counter() - started
+                children = profiler._component_stack.pop()
+                if profiler._component_stack:
+                    profiler._component_stack[-1] += elapsed
+                stats = profiler.components.get(type(component).__name__)
+                if stats is None:
+                    stats = profiler.components[type(component).__name__] = ComponentStats()
+                stats.calls += 1
+                stats.inclusive += elapsed
+                stats.exclusive += elapsed - children
+        return render_component
+
+    @contextmanager
+    def attach(self, exporter):
+        """Instrumenta un exportador (solo esta instancia) mientras dure el bloque"""
+        patched = []
+        for method_name, phase_name in PROFILED_METHODS:
+            method = getattr(exporter, method_name, None)
+            if method is not None:
+                patched.append(method_name)
+                setattr(exporter, method_name, self._wrap_phase(method, phase_name))
+        patched.append('render_component')
+        exporter.render_component = self._wrap_render_component(exporter.render_component)
+        # El escritor es de cada exportación: se instrumenta el que recibe _write_export, y
+        # de él sale también el resumen de escritura
+        writers = []
+        write_export = getattr(exporter, '_write_export', None)
+        if write_export is not None:
+            patched.append('_write_export')
+
+            def _write_export(app, writer, *args, **kwargs):
+                writers.append(writer)
+                self._instrument_writer(writer)
+                return write_export(app, writer, *args, **kwargs)
+            exporter._write_export = _write_export
+        cache_stats = getattr(exporter, 'cache_stats', None)
+        before = cache_stats() if cache_stats is not None else {}
+        try:
+            with self.phase('export'):
+                yield exporter
+        finally:
+            if cache_stats is not None:
+                self.caches = _cache_deltas(before, cache_stats())
+            write_stats = getattr(writers[-1], 'stats', None) if writers else None
+            if write_stats is not None:
+                self.output = write_stats.to_dict()
+            for method_name in patched:
+                # Quitar el atributo de instancia deja visible otra vez el método de la clase
+                exporter.__dict__.pop(method_name, None)
+            self.stop()
+
+    def _instrument_writer(self, writer):
+        """Mide la escritura de un escritor (solo esta instancia; vive lo que él)"""
+        if not hasattr(writer, '_write'):
+            # ArchiveWriter escribe en el hilo del render: una fase más
+            writer.write = self._wrap_phase(writer.write, 'write')
+            writer.close = self._wrap_phase(writer.close, 'write')
+            return
+        profiler = self
+        write = writer._write
+
+        def _write(relative_path, content):
+            # En los hilos del escritor: no entra en la pila de fases del render
+            started = time.perf_counter()
+            try:
+                return write(relative_path, content)
+            finally:
+                elapsed = time.perf_counter() - started
+                with profiler._lock:
+                    stats = profiler.phases.setdefault('write', PhaseStats())
+                    stats.calls += 1
+                    stats.wall += elapsed
+                    stats.self_time += elapsed
+                profiler.events.append({
+                    'name': 'write', 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                    'ts': round((started - profiler._origin) * 1e6, 3), 'dur': round(elapsed * 1e6, 3),
+                    'args': {'file': relative_path},
+                })
+        writer._write = _write
+        # close() espera con flush(), que así también cuenta
+        writer.flush = self._wrap_phase(writer.flush, 'write_wait')
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # --- Resultados ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        components = sorted(self.components.items(), key=lambda item: item[1].exclusive, reverse=True)
+        return {
+            'phases': {name: stats.to_dict() for name, stats in self.phases.items()},
+            'pages': {name: round(seconds * 1000, 3) for name, seconds in self.pages.items()},
+            'components': {name: stats.to_dict() for name, stats in components},
+            'peak_traced_bytes': self.peak_bytes if self.track_allocations else None,
+            'heaviest_page': self.heaviest_page,
+            'top_allocation_sites': self.allocation_sites,
+            'caches': self.caches,
+            'output': self.output,
+        }
+
+    def write_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def write_chrome_trace(self, path: str):
+        """Formato Trace Event (https://ui.perfetto.dev / chrome://tracing)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+
+    def print_report(self, console=None, top_components: int = 15):
+        from rich.console import Console
+        from rich.table import Table
+
+        console = console or Console()
+        data = self.to_dict()
+
+        phases = Table(title="Export profile: phases")
+        phases.add_column("Phase", style="cyan")
+        phases.add_column("Calls", justify="right")
+        phases.add_column("Wall ms", justify="right")
+        phases.add_column("Self ms", justify="right")
+        phases.add_column("Allocated", justify="right")
+        if self.memory_report:
+            phases.add_column("Peak", justify="right")
+        for name, stats in sorted(data['phases'].items(), key=lambda item: item[1]['wall_ms'], reverse=True):
+            allocated = format_bytes(stats['allocated_bytes']) if self.track_allocations else "-"
+            row = [name, str(stats['calls']), f"{stats['wall_ms']:.2f}", f"{stats['self_ms']:.2f}", allocated]
+            if self.memory_report:
+                row.append(format_bytes(stats['peak_bytes']))
+            phases.add_row(*row)
+        console.print(phases)
+
+        if data['components']:
+            components = Table(title="Render time by component class")
+            components.add_column("Component", style="cyan")
+            components.add_column("Calls", justify="right")
+            components.add_column("Exclusive ms", justify="right")
+            components.add_column("Inclusive ms", justify="right")
+            for name, stats in list(data['components'].items())[:top_components]:
+                components.add_row(name, str(stats['calls']), f"{stats['exclusive_ms']:.2f}",
+                                   f"{stats['inclusive_ms']:.2f}")
+            console.print(components)
+
+        for name, stats in data['caches'].items():
+            if stats.get('hits') or stats.get('misses'):
+                console.print(f"{name.capitalize()} cache: {stats['hits']} hits, {stats['misses']} misses, "
+                              f"{stats.get('evictions', 0)} evictions, {stats['entries']} entries")
+        if data['output']:
+            output = data['output']
+            console.print(f"Output: {output['files_written']} files written ({format_bytes(output['bytes_written'])}), "
+                          f"{output['files_skipped']} unchanged ({format_bytes(output['bytes_skipped'])}), "
+                          f"{output['wait_ms']:.2f} ms waiting for writes")
+        if len(data['pages']) > 1:
+            slowest = sorted(data['pages'].items(), key=lambda item: item[1], reverse=True)[:5]
+            console.print("Slowest pages: " + ", ".join(f"{name} ({ms:.2f} ms)" for name, ms in slowest))
+        if self.memory_report and data['top_allocation_sites']:
+            sites = Table(title=f"Top allocation sites (end of heaviest page: {data['heaviest_page']})")
+            sites.add_column("Site", style="cyan")
+            sites.add_column("Size", justify="right")
+            sites.add_column("Blocks", justify="right")
+            for site in data['top_allocation_sites']:
+                sites.add_row(_short_path(site['site']), format_bytes(site['size_bytes']), str(site['count']))
+            console.print(sites)
+        if self.track_allocations:
+            console.print(f"Peak traced memory: {format_bytes(self.peak_bytes)}")
+
+
+def _cache_deltas(before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """Contadores de `after` menos los de `before` (entries y bytes se dejan absolutos)"""
+    deltas = {}
+    for name, stats in after.items():
+        previous = before.get(name, {})
+        deltas[name] = {
+            key: value if key in ('entries', 'bytes') else value - previous.get(key, 0)
+            for key, value in stats.items()
+        }
+    return deltas
+
+
+def _short_path(site: str) -> str:
+    """Ruta relativa al directorio actual si queda más corta"""
+    try:
+        relative = os.path.relpath(site)
+    except ValueError:
+        return site
+    return relative if len(relative) < len(site) else site
+
+
+def format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    if abs(size) < 1024:
+        return f"{size} B"
+    if abs(size) < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
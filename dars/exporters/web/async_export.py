@@ -0,0 +1,214 @@
+"""
+Exportación asíncrona para servicios asyncio.
+
+    job = exporter.export_async(app, "dist")
+    async for progress in job:          # opcional: una entrada por paso terminado
+        print(progress.completed, progress.total, progress.name)
+    result = await job                  # ExportResult; relanza el error si la exportación falla
+
+El render (HTMLCSSJSExporter.iter_export_steps) se hace en un hilo propio, en orden de
+páginas; el resto del event loop sigue libre mientras tanto.
+Los archivos de cada paso pasan por una cola acotada (`max_pending` pasos) a `writers`
+tareas que los escriben en un pool de hilos con un OutputWriter (que no reescribe los
+archivos que no cambiaron); si la escritura va por detrás, el hilo de
+render espera, y la memoria no crece con el número de páginas. Un paso se reporta
+cuando todos sus archivos están en disco. Como en export(), los archivos compartidos se
+escriben al final y sin los que genera una página (styles.css y script.js de la index),
+así que el paso "shared" es el último que se reporta.
+
+Fuera de un event loop: asyncio.run(exporter.export_async(app, "dist").run()).
+
+Los archivos escritos y sin cambios están en job.write_stats (y en result.write_stats).
+
+Cancelar (job.cancel() o cancelar la tarea que hace el await) detiene el render entre
+páginas y las escrituras pendientes; lo que ya se escribió se queda en el directorio.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import AsyncIterator, Dict, NamedTuple, Optional, Tuple
+
+from dars.exporters.base import ExportResult
+from dars.exporters.output_writer import OutputWriter
+
+# Cada cuánto (segundos) comprueba el hilo de render si se canceló mientras espera sitio en la cola
+_PUT_POLL_INTERVAL = 0.1
+_DONE = object()
+
+
+class ExportProgress(NamedTuple):
+    """Un paso terminado: `completed` de `total` (None si se desconoce) y su nombre"""
+    completed: int
+    total: Optional[int]
+    name: str
+    files: int
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class AsyncExport:
+    """Exportación en curso: se puede esperar (await), iterar (progreso) y cancelar"""
+
+    def __init__(self, exporter, app, output_path: str, partition: Optional[Tuple[int, int]] = None,
+                 writers: int = 4, max_pending: int = 8, on_progress=None):
+        self.exporter = exporter
+        # Callback de esta exportación, como el on_progress de export()
+        self.on_progress = on_progress
+        self.app = app
+        self.output_path = output_path
+        self.partition = partition
+        self.writers = max(1, writers)
+        self.max_pending = max(1, max_pending)
+        self.completed = 0
+        self.total: Optional[int] = None
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task] = None
+        # Archivos compartidos pendientes (ver _render)
+        self._shared: Dict[str, str] = {}
+        self._progress: Optional[asyncio.Queue] = None
+        self._output = OutputWriter(output_path, workers=self.writers)
+        # Resumen de escritura de esta exportación (output_writer.WriteStats)
+        self.write_stats = self._output.stats
+
+    # --- API ---
+
+    def start(self) -> asyncio.Task:
+        """Lanza la exportación en el event loop actual (await y async for lo hacen solos)"""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def run(self) -> ExportResult:
+        """La exportación como corrutina, para asyncio.run(job.run()): AsyncExport se
+        puede esperar, pero no es una corrutina"""
+        return await self.start()
+
+    def cancel(self):
+        self._cancelled.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    def done(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    async def __aiter__(self) -> AsyncIterator[ExportProgress]:
+        # La cola de progreso solo existe si alguien itera (si no, no se acumula nada);
+        # los pasos terminados antes de empezar a iterar no se reportan
+        if self._progress is None:
+            self._progress = asyncio.Queue()
+        task = self.start()
+        while True:
+            item = await self._progress.get()
+            if item is _DONE:
+                break
+            yield item
+        # Propaga el error o la cancelación al que itera
+        await task
+
+    # --- implementación ---
+
+    async def _run(self) -> ExportResult:
+        loop = asyncio.get_running_loop()
+        exporter = self.exporter
+        page_count = exporter.count_page_targets(self.app, self.partition)
+        writes_shared = self.partition is None or self.partition[0] == 0
+        pwa_enabled = writes_shared and getattr(self.app, 'pwa_enabled', False)
+        self.total = None if page_count is None else 1 + page_count + (1 if pwa_enabled else 0)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending)
+        render_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='dars-render')
+        write_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.writers, thread_name_prefix='dars-write')
+        writer_tasks = [asyncio.ensure_future(self._writer(queue, write_pool)) for _ in range(self.writers)]
+        try:
+            await loop.run_in_executor(render_pool, self._render, loop, queue)
+            await queue.join()
+            if self._error is not None:
+                raise self._error
+            # Los archivos compartidos van al final, sin los que ya escribió una página
+            # (como en export(): el styles.css y script.js de la index tienen prioridad)
+            if not self._cancelled.is_set():
+                shared, self._shared = self._shared, {}
+                if shared:
+                    await loop.run_in_executor(write_pool, self._write_files, shared)
+                self._step_done('shared', len(shared))
+            if pwa_enabled and not self._cancelled.is_set():
+                await loop.run_in_executor(render_pool, exporter._generate_pwa_files,
+                                           self.app, self.output_path, self._output)
+                await loop.run_in_executor(render_pool, self._output.flush)
+                self._step_done('pwa', 0)
+            return ExportResult(write_stats=self.write_stats)
+        except _Cancelled:
+            if self._error is not None:
+                raise self._error
+            raise asyncio.CancelledError() from None
+        finally:
+            self._cancelled.set()
+            for task in writer_tasks:
+                task.cancel()
+            await asyncio.gather(*writer_tasks, return_exceptions=True)
+            render_pool.shutdown(wait=False)
+            write_pool.shutdown(wait=False)
+            self._output.shutdown(wait=False)
+            if self._progress is not None:
+                self._progress.put_nowait(_DONE)
+
+    def _render(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        """Hilo de render: produce (nombre, archivos) por paso y los encola. El paso
+        compartido se guarda en self._shared, que _run escribe al terminar las páginas"""
+        self.exporter.create_output_directory(self.output_path)
+        steps = self.exporter.iter_export_steps(self.app, self.partition)
+        _name, self._shared = next(steps)
+        for name, files in steps:
+            if self._cancelled.is_set():
+                raise _Cancelled()
+            for filename in files:
+                self._shared.pop(filename, None)
+            future = asyncio.run_coroutine_threadsafe(queue.put((name, files)), loop)
+            files = None
+            while True:
+                try:
+                    future.result(_PUT_POLL_INTERVAL)
+                    break
+                except concurrent.futures.TimeoutError:
+                    if self._cancelled.is_set():
+                        future.cancel()
+                        raise _Cancelled()
+
+    async def _writer(self, queue: asyncio.Queue, pool: concurrent.futures.Executor):
+        loop = asyncio.get_running_loop()
+        while True:
+            name, files = await queue.get()
+            try:
+                if self._error is None and not self._cancelled.is_set():
+                    await loop.run_in_executor(pool, self._write_files, files)
+                    self._step_done(name, len(files))
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                # El primer error detiene el render y el resto de escrituras
+                if self._error is None:
+                    self._error = e
+                self._cancelled.set()
+            finally:
+                files = None
+                queue.task_done()
+
+    def _write_files(self, files: Dict[str, str]):
+        self._output.ensure_directories(files)
+        for filename, content in files.items():
+            self._output.write_now(filename, content)
+
+    def _step_done(self, name: str, files: int):
+        self.completed += 1
+        progress = ExportProgress(self.completed, self.total, name, files)
+        if self._progress is not None:
+            self._progress.put_nowait(progress)
+        if self.on_progress is not None:
+            self.on_progress(progress.completed, progress.total, name)
@@ -0,0 +1,180 @@
+"""
+Modo bundle: cada página se exporta como un único HTML autocontenido, una sola petición.
+
+    result = exporter.export(app, 'dist', bundle=BundleOptions(inline_limit=8192, max_bytes=150_000))
+    print(result.bundle_report.to_dict())
+
+Sobre el HTML terminado de cada página (el mismo que escribe export(), así cuentan
+también las PageTemplate y los fragmentos de Cached):
+
+  - La hoja de estilos se sustituye por un <style> con solo las reglas que pueden
+    aplicarse a las clases de la página (ver css_subset.py).
+  - runtime_dars.js y el script de la página se sustituyen por <script> en línea. El
+    runtime lleva solo las funciones (tabs, accordion) de los componentes de la página.
+  - Las imágenes locales (<img src> y el favicon) de hasta `inline_limit` bytes van como
+    data: URI en base64 (un favicon vacío pasa a ser `data:,`, sin petición). Se buscan en `asset_root` (por defecto el directorio actual);
+    las que no existen o son más grandes se quedan como referencia externa y el informe
+    las lista.
+
+Cada página se mide al terminar: con `max_bytes`, una página más grande es un error
+(ValueError) y la exportación falla, para que el límite se pueda usar en CI.
+"""
+
+import base64
+import html
+import mimetypes
+import os
+import re
+from typing import Dict, List, Optional, Set
+
+from dars.exporters.web.css_subset import feature_classes, subset_css, used_classes
+
+_ATTRIBUTE = re.compile(r'''([\w-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+_LINK_TAG = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+_SCRIPT_TAG = re.compile(r'<script\b([^>]*)>\s*</script>', re.IGNORECASE)
+_IMG_TAG = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+_ICON_HREF = re.compile(r'''\bhref\s*=\s*(["'])\1''', re.IGNORECASE)
+
+
+class BundleOptions:
+    """Opciones del modo bundle (ver el docstring del módulo)"""
+
+    def __init__(self, inline_limit: int = 8192, max_bytes: Optional[int] = None,
+                 asset_root: Optional[str] = None, subset_css: bool = True):
+        # Tamaño máximo de una imagen para ir en línea como data: URI (0 = ninguna)
+        self.inline_limit = inline_limit
+        # Tamaño máximo de cada página; None = sin límite
+        self.max_bytes = max_bytes
+        # Directorio desde el que se resuelven las rutas de las imágenes
+        self.asset_root = asset_root
+        # False incluye la hoja de estilos entera
+        self.subset_css = subset_css
+
+
+class BundleReport:
+    """Tamaño de cada página del bundle y lo que se quedó fuera como referencia externa"""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.pages: List[Dict[str, object]] = []
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(page['bytes'] for page in self.pages)
+
+    @property
+    def largest(self) -> Optional[Dict[str, object]]:
+        return max(self.pages, key=lambda page: page['bytes'], default=None)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'pages': [dict(page) for page in self.pages],
+            'total_bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+def _attributes(tag: str) -> Dict[str, str]:
+    return {name.lower(): html.unescape(double or single) for name, double, single in _ATTRIBUTE.findall(tag)}
+
+
+def _inline_style(css: str) -> str:
+    return '<style>\n' + re.sub(r'</(style)', r'<\\/\1', css, flags=re.IGNORECASE) + '</style>'
+
+
+def _inline_script(js: str) -> str:
+    # Un </script> o <!-- dentro del código cerraría o confundiría el elemento
+    js = re.sub(r'</(script)', r'<\\/\1', js, flags=re.IGNORECASE).replace('<!--', '<\\!--')
+    return '<script>\n' + js + '</script>'
+
+
+class PageBundler:
+    """Convierte los documentos de una exportación en páginas autocontenidas"""
+
+    def __init__(self, options: Optional[BundleOptions] = None):
+        self.options = options or BundleOptions()
+        self.asset_root = os.path.abspath(self.options.asset_root or os.getcwd())
+        self.report = BundleReport(self.options.max_bytes)
+        # Ruta -> data: URI (o None si no se puede incrustar); una imagen se lee una vez
+        self._data_uris: Dict[str, Optional[str]] = {}
+
+    def bundle(self, name: str, document: str, stylesheets: Dict[str, str],
+               scripts: Dict[str, str], classes: Optional[Set[str]] = None) -> str:
+        """
+        Incrusta en `document` las hojas de estilo y los scripts ({href/src: contenido}) y
+        las imágenes pequeñas. Devuelve el documento y lo añade al informe.
+        classes: used_classes(document), si el llamador ya las tiene
+        """
+        classes = feature_classes(used_classes(document) if classes is None else classes)
+        inlined: List[str] = []
+        external: List[str] = []
+
+        def replace_link(match):
+            tag = match.group(0)
+            attributes = _attributes(tag)
+            rel = attributes.get('rel', '').lower().split()
+            href = attributes.get('href', '')
+            if 'stylesheet' in rel and href in stylesheets:
+                css = stylesheets[href]
+                return _inline_style(subset_css(css, classes) if self.options.subset_css else css)
+            if 'icon' in rel:
+                if not href:
+                    # href="" pide la propia página; data:, evita también el /favicon.ico implícito
+                    return _ICON_HREF.sub('href="data:,"', tag, count=1)
+                return self._inline_asset(tag, 'href', href, inlined, external)
+            if 'preload' in rel and (href in stylesheets or self._data_uri(href) is not None):
+                # Lo que va en línea no se pide: su preload sobra
+                return ''
+            return tag
+
+        def replace_script(match):
+            src = _attributes(match.group(1)).get('src')
+            if src in scripts:
+                return _inline_script(scripts[src])
+            return match.group(0)
+
+        def replace_img(match):
+            tag = match.group(0)
+            src = _attributes(tag).get('src')
+            return self._inline_asset(tag, 'src', src, inlined, external) if src else tag
+
+        document = _LINK_TAG.sub(replace_link, document)
+        document = _SCRIPT_TAG.sub(replace_script, document)
+        document = _IMG_TAG.sub(replace_img, document)
+
+        size = len(document.encode('utf-8'))
+        self.report.pages.append({'file': name, 'bytes': size, 'inlined': inlined, 'external': external})
+        max_bytes = self.options.max_bytes
+        if max_bytes is not None and size > max_bytes:
+            raise ValueError(f"{name} ocupa {size} bytes en modo bundle, más que el límite de {max_bytes}")
+        return document
+
+    def _inline_asset(self, tag: str, attribute: str, url: str, inlined: List[str], external: List[str]) -> str:
+        """El tag con `attribute` como data: URI, si la imagen es local y pequeña"""
+        data_uri = self._data_uri(url)
+        if data_uri is None:
+            if not url.startswith('data:'):
+                external.append(url)
+            return tag
+        inlined.append(url)
+        pattern = re.compile(rf'''(\b{attribute}\s*=\s*)(["'])[^"']*\2''', re.IGNORECASE)
+        return pattern.sub(lambda m: f'{m.group(1)}"{data_uri}"', tag, count=1)
+
+    def _data_uri(self, url: str) -> Optional[str]:
+        # Solo rutas locales: ni esquemas (http:, data:) ni URLs sin esquema (//cdn...)
+        if not url or url.startswith('//') or re.match(r'^[a-zA-Z][\w+.-]*:', url):
+            return None
+        path = os.path.normpath(os.path.join(self.asset_root, url.split('#')[0].split('?')[0].lstrip('/')))
+        if path in self._data_uris:
+            return self._data_uris[path]
+        data_uri = None
+        try:
+            if 0 < self.options.inline_limit and os.path.getsize(path) <= self.options.inline_limit:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                mime_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+                data_uri = f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+        except OSError:
+            pass  # no existe: se queda como referencia externa
+        self._data_uris[path] = data_uri
+        return data_uri
@@ -0,0 +1,225 @@
+"""
+Navegación en el cliente para apps multipágina (opcional: HTMLCSSJSExporter(client_router=True)).
+
+Sin router, cada enlace entre páginas es una carga completa: el navegador vuelve a
+parsear styles.css y a ejecutar runtime_dars.js. Con router, el runtime:
+
+  - intercepta los clics en enlaces del mismo origen a páginas del manifiesto
+    (routes.json), salvo con modificadores, target distinto de _self o download;
+  - pide la página con fetch, añade a <head> lo que trae de nuevo (su hoja de estilos,
+    el CSS crítico, meta) y quita lo de la página anterior, esperando a que carguen las
+    hojas nuevas; después sustituye el contenido de <body> y el <title> y actualiza el
+    historial. El runtime sigue vivo y se vuelve a llamar a initializeEvents() para el
+    DOM nuevo;
+  - ejecuta el script de la página (según el manifiesto) solo la primera vez que se
+    visita en la sesión: volver a ejecutarlo duplicaría sus listeners y fallaría con
+    declaraciones let/const/class de primer nivel. Los scripts globales de la App van en
+    el runtime (no en el de cada página) y se ejecutan una sola vez;
+  - precarga las páginas al pasar el ratón (o el foco, o un toque) por un enlace y
+    cuando el enlace entra en pantalla (IntersectionObserver, en tiempo ocioso);
+  - emite `dars:navigate` en document tras cada cambio, para que los scripts de página
+    vuelvan a enlazar sus eventos al DOM nuevo cuando se vuelve a una página (ni
+    DOMContentLoaded ni el script se repiten).
+
+Si algo falla (fetch, manifiesto, página desconocida) se hace la navegación normal.
+
+El manifiesto lo escribe el exportador con los archivos compartidos:
+
+    {"version": 1, "runtime": "runtime_dars.js",
+     "pages": {"index.html": {"script": "script.js"}, "about.html": {"script": "script_about.js"}}}
+"""
+
+import json
+from typing import Iterable, Tuple
+
+MANIFEST_FILE = 'routes.json'
+MANIFEST_VERSION = 1
+
+ROUTER_JS = r"""
+// Router de Dars: navegación sin recargar entre páginas del manifiesto
+(function() {
+    if (!window.fetch || !window.history || !history.pushState || !window.DOMParser) return;
+    var manifest = null;
+    var pages = {};
+    // Scripts de página ya ejecutados en esta sesión
+    var ran = {};
+    var current = location.pathname + location.search;
+    // Navegación en curso: si empieza otra antes de terminar, la anterior se descarta
+    var navigation = 0;
+
+    function pageOf(url) {
+        if (!manifest || url.origin !== location.origin) return null;
+        var name = url.pathname.split('/').pop() || 'index.html';
+        return manifest.pages[name] ? name : null;
+    }
+
+    function linkUrl(link) {
+        if (!link || (link.target && link.target !== '_self') || link.hasAttribute('download')) return null;
+        var url = new URL(link.href, location.href);
+        return pageOf(url) ? url : null;
+    }
+
+    function fetchPage(url) {
+        var key = url.href.split('#')[0];
+        if (!pages[key]) {
+            pages[key] = fetch(key, {credentials: 'same-origin'}).then(function(response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.text();
+            });
+            pages[key].catch(function() { delete pages[key]; });
+        }
+        return pages[key];
+    }
+
+    function runPageScript(name) {
+        var entry = manifest.pages[name];
+        if (!entry || !entry.script || ran[entry.script]) return;
+        ran[entry.script] = true;
+        var script = document.createElement('script');
+        script.src = entry.script;
+        script.async = false;
+        document.body.appendChild(script);
+    }
+
+    // Elementos de <head> que cambian con la página; los <script> no se tocan (el
+    // runtime sigue cargado) y <noscript> solo sirve sin JavaScript
+    function headNodes(head) {
+        return Array.prototype.filter.call(head.children, function(node) {
+            return ['SCRIPT', 'NOSCRIPT', 'TITLE'].indexOf(node.nodeName) < 0;
+        });
+    }
+
+    // Un <link> se identifica por su href: el CSS crítico carga styles.css con
+    // rel="preload" y lo cambia a "stylesheet" al llegar
+    function headKey(node) {
+        return node.nodeName === 'LINK' ? 'link ' + node.getAttribute('href') : node.outerHTML;
+    }
+
+    // Añade a <head> lo que trae la página nueva; se resuelve con la función que quita lo
+    // de la anterior cuando han cargado sus hojas de estilos
+    function mergeHead(doc) {
+        var old = {};
+        headNodes(document.head).forEach(function(node) { old[headKey(node)] = node; });
+        var keep = {};
+        var loading = [];
+        headNodes(doc.head).forEach(function(node) {
+            var key = headKey(node);
+            keep[key] = true;
+            if (old[key]) return;
+            node = document.adoptNode(node);
+            if (node.nodeName === 'LINK' && node.rel === 'stylesheet') {
+                loading.push(new Promise(function(resolve) {
+                    node.addEventListener('load', resolve);
+                    node.addEventListener('error', resolve);
+                }));
+            }
+            document.head.appendChild(node);
+        });
+        return Promise.all(loading).then(function() {
+            return function() {
+                Object.keys(old).forEach(function(key) {
+                    if (!keep[key] && old[key].parentNode) old[key].parentNode.removeChild(old[key]);
+                });
+            };
+        });
+    }
+
+    function swap(doc, url, name) {
+        current = url.pathname + url.search;
+        document.title = doc.title;
+        var nodes = Array.prototype.filter.call(doc.body.childNodes, function(node) {
+            return node.nodeName !== 'SCRIPT';
+        });
+        while (document.body.firstChild) document.body.removeChild(document.body.firstChild);
+        nodes.forEach(function(node) { document.body.appendChild(document.adoptNode(node)); });
+        if (typeof initializeEvents === 'function') initializeEvents();
+        runPageScript(name);
+        observeLinks();
+        var target = url.hash && document.getElementById(decodeURIComponent(url.hash.slice(1)));
+        if (target) target.scrollIntoView(); else window.scrollTo(0, 0);
+        document.dispatchEvent(new CustomEvent('dars:navigate', {detail: {url: url.href, page: name}}));
+    }
+
+    function navigate(url, push) {
+        var name = pageOf(url);
+        if (!name) { location.href = url.href; return; }
+        var id = ++navigation;
+        var doc;
+        fetchPage(url).then(function(html) {
+            if (id !== navigation) return;
+            doc = new DOMParser().parseFromString(html, 'text/html');
+            return mergeHead(doc).then(function(removeOld) {
+                if (id !== navigation) return;
+                if (push) history.pushState({dars: true}, '', url.href);
+                swap(doc, url, name);
+                removeOld();
+            });
+        }).catch(function() { location.href = url.href; });
+    }
+
+    function prefetchLink(event) {
+        var link = event.target.closest && event.target.closest('a[href]');
+        var url = linkUrl(link);
+        if (url) fetchPage(url);
+    }
+
+    var observer = null;
+    function observeLinks() {
+        if (!observer) return;
+        observer.disconnect();
+        document.querySelectorAll('a[href]').forEach(function(link) {
+            if (linkUrl(link)) observer.observe(link);
+        });
+    }
+
+    document.addEventListener('click', function(event) {
+        if (event.defaultPrevented || event.button !== 0 || event.metaKey || event.ctrlKey
+            || event.shiftKey || event.altKey) return;
+        var link = event.target.closest && event.target.closest('a[href]');
+        var url = linkUrl(link);
+        if (!url) return;
+        if (url.pathname === location.pathname && url.search === location.search && url.hash) return;
+        event.preventDefault();
+        navigate(url, true);
+    });
+    document.addEventListener('mouseover', prefetchLink);
+    document.addEventListener('focusin', prefetchLink);
+    document.addEventListener('touchstart', prefetchLink, {passive: true});
+    window.addEventListener('popstate', function() {
+        // Solo cambió el fragmento: el navegador ya se ocupa
+        if (location.pathname + location.search === current) return;
+        navigate(new URL(location.href), false);
+    });
+
+    fetch('__MANIFEST__', {credentials: 'same-origin'}).then(function(response) {
+        return response.ok ? response.json() : null;
+    }).then(function(data) {
+        if (!data || data.version !== __VERSION__) return;
+        manifest = data;
+        // El script de la página inicial ya se ejecutó con la carga normal
+        var first = manifest.pages[pageOf(new URL(location.href))];
+        if (first && first.script) ran[first.script] = true;
+        history.replaceState({dars: true}, '', location.href);
+        if ('IntersectionObserver' in window) {
+            var idle = window.requestIdleCallback || function(callback) { setTimeout(callback, 1); };
+            observer = new IntersectionObserver(function(entries) {
+                entries.forEach(function(entry) {
+                    if (!entry.isIntersecting) return;
+                    observer.unobserve(entry.target);
+                    idle(function() { var url = linkUrl(entry.target); if (url) fetchPage(url); });
+                });
+            });
+            observeLinks();
+        }
+    }).catch(function() {});
+})();
+""".replace('__MANIFEST__', MANIFEST_FILE).replace('__VERSION__', str(MANIFEST_VERSION))
+
+
+def route_manifest(pages: Iterable[Tuple[str, str]], runtime_file: str = 'runtime_dars.js') -> str:
+    """routes.json a partir de (archivo html, script de la página) en orden de exportación"""
+    return json.dumps({
+        'version': MANIFEST_VERSION,
+        'runtime': runtime_file,
+        'pages': {html_file: {'script': script_file} for html_file, script_file in pages},
+    }, indent=2, ensure_ascii=False)
@@ -0,0 +1,94 @@
+"""
+Subconjunto de la hoja de estilos que usa un documento (o una parte de él).
+
+La hoja de estilos de Dars trae las reglas de todos los componentes. Aquí se filtra a las
+que pueden aplicarse a un conjunto de clases: una regla con clases `dars-*` se queda si
+todas sus clases están en el conjunto, o las añade el runtime de una función que el
+documento usa (dars-tab-active...). Las reglas sin clases dars (`*`, `body`, estilos
+globales con clases propias) y los bloques @ se quedan siempre; un @keyframes solo si
+alguna regla lo nombra.
+
+Lo usan el modo bundle (bundle.py) y el CSS crítico (HTMLCSSJSExporter.critical_css).
+"""
+
+import re
+from typing import Iterable, Set, Tuple
+
+# Clases que añade el runtime en el navegador, por función (ver generate_javascript)
+FEATURE_CLASSES = {
+    'tabs': ('dars-tab-active', 'dars-tab-panel-active'),
+    'accordion': ('dars-accordion-open',),
+}
+# Clase del componente que necesita cada función del runtime
+FEATURE_MARKERS = {
+    'tabs': 'dars-tabs',
+    'accordion': 'dars-accordion',
+    'lazy': 'dars-lazy',
+}
+
+_CLASS_ATTR = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')''')
+_SELECTOR_CLASS = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+_KEYFRAMES = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+
+
+def used_classes(document: str) -> Set[str]:
+    """Clases de todos los atributos class de un documento"""
+    classes = set()
+    for double, single in _CLASS_ATTR.findall(document):
+        classes.update((double or single).split())
+    return classes
+
+
+def page_features(classes: Set[str]) -> Set[str]:
+    """Funciones del runtime que necesita una página, según sus clases"""
+    return {feature for feature, marker in FEATURE_MARKERS.items() if marker in classes}
+
+
+def feature_classes(classes: Set[str]) -> Set[str]:
+    """`classes` más las que el runtime puede añadir en el navegador"""
+    classes = set(classes)
+    for feature in page_features(classes):
+        classes.update(FEATURE_CLASSES.get(feature, ()))
+    return classes
+
+
+def _split_rules(css: str) -> Iterable[Tuple[str, str]]:
+    """(prelude, bloque completo) de cada regla de primer nivel, sin comentarios"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    depth = 0
+    start = 0
+    prelude_end = None
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude_end = index
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield css[start:prelude_end].strip(), css[prelude_end:index + 1]
+                start = index + 1
+
+
+def subset_css(css: str, classes: Set[str]) -> str:
+    """Las reglas de `css` que pueden aplicarse a un documento con estas clases"""
+    rules = []
+    keyframes = []
+    for prelude, block in _split_rules(css):
+        if prelude.startswith('@'):
+            match = _KEYFRAMES.match(prelude)
+            if match:
+                keyframes.append((match.group(1), prelude, block))
+            else:
+                rules.append(f"{prelude} {block}")
+            continue
+        selectors = [selector.strip() for selector in prelude.split(',')]
+        kept = [selector for selector in selectors
+                if all(name in classes for name in _SELECTOR_CLASS.findall(selector) if name.startswith('dars-'))]
+        if kept:
+            rules.append(f"{', '.join(kept)} {block}")
+    kept_css = '\n'.join(rules)
+    for name, prelude, block in keyframes:
+        if re.search(rf'\b{re.escape(name)}\b', kept_css):
+            rules.append(f"{prelude} {block}")
+    return '\n'.join(rules) + '\n'
@@ -0,0 +1,253 @@
+"""
+Caché de fragmentos: HTML renderizado de subárboles caros (navbars, footers, tablas
+alimentadas por consultas lentas) que se repiten en muchas páginas o peticiones.
+
+El componente Cached (dars.components.basic.cached) marca el subárbol; el exportador
+HTML guarda su render como RenderPlan en un almacén con límite de tamaño:
+
+  - MemoryFragmentStore: LRU en el proceso (el almacén por defecto, compartido por todos
+    los exportadores del proceso);
+  - DiskFragmentStore: un archivo por fragmento en un directorio, que pueden compartir
+    varios procesos (workers de `--partition`, workers de SSR).
+
+Se guarda el plan y no el HTML: los IDs automáticos quedan como huecos, así el mismo
+fragmento encaja en cualquier posición de cualquier página. Cada entrada puede tener
+TTL (segundos). Todos los almacenes cuentan hits, misses, evictions y expiradas (stats()).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from dars.exporters.web.render_plan import RenderNeeds, RenderPlan
+
+
+class FragmentStore:
+    """Interfaz de un almacén de fragmentos: get, put (con TTL opcional), clear y len"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def get(self, key: str) -> Optional[RenderPlan]:
+        raise NotImplementedError
+
+    def put(self, key: str, plan: RenderPlan, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self), 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'expired': self.expired}
+
+
+def _plan_size(plan: RenderPlan) -> int:
+    return sum(len(segment) for segment in plan.segments) + 16 * len(plan.holes)
+
+
+class MemoryFragmentStore(FragmentStore):
+    """LRU en memoria con límite de entradas y de tamaño (caracteres de HTML)"""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        # clave -> (plan, caducidad o None, tamaño)
+        self._entries: 'OrderedDict[str, Tuple[RenderPlan, Optional[float], int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[RenderPlan]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.time():
+                self._remove(key)
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, plan: RenderPlan, ttl: Optional[float] = None):
+        size = _plan_size(plan)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (plan, time.time() + ttl if ttl is not None else None, size)
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        _plan, _expires, size = self._entries.pop(key)
+        self.size -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        stats['bytes'] = self.size
+        return stats
+
+
+class DiskFragmentStore(FragmentStore):
+    """
+    Un archivo JSON por fragmento en `directory`. Las escrituras son atómicas
+    (archivo temporal + os.replace), así varios procesos pueden compartir el directorio.
+    Cada lectura actualiza el mtime del archivo, y al pasar de `max_bytes` se borran los
+    menos usados recientemente.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        super().__init__()
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        # Estimación local del tamaño del directorio; se recalcula al desalojar
+        self._size = sum(size for _path, size, _mtime in self._scan())
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.directory, digest + '.json')
+
+    def _scan(self):
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return []
+        files = []
+        for entry in entries:
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # lo borró otro proceso
+                files.append((entry.path, stat.st_size, stat.st_mtime))
+        return files
+
+    def get(self, key: str) -> Optional[RenderPlan]:
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.misses += 1
+            return None
+        if data.get('key') != key:
+            self.misses += 1
+            return None
+        expires = data.get('expires')
+        if expires is not None and expires <= time.time():
+            self._unlink(path)
+            self.expired += 1
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        holes = tuple((name, raw) for name, raw in data['holes'])
+        needs = RenderNeeds(*(frozenset(values) for values in data.get('needs', ((), (), ()))))
+        return RenderPlan(tuple(data['segments']), holes, data['id_count'], needs)
+
+    def put(self, key: str, plan: RenderPlan, ttl: Optional[float] = None):
+        payload = json.dumps({
+            'key': key,
+            'expires': time.time() + ttl if ttl is not None else None,
+            'segments': plan.segments,
+            'holes': plan.holes,
+            'id_count': plan.id_count,
+            'needs': [sorted(values) for values in plan.needs],
+        }, ensure_ascii=False).encode('utf-8')
+        if len(payload) > self.max_bytes:
+            return
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            self._unlink(temp_path)
+            raise
+        with self._lock:
+            self._size += len(payload)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Borra los archivos menos usados hasta quedar en el 90 % de max_bytes"""
+        files = sorted(self._scan(), key=lambda item: item[2])
+        size = sum(item[1] for item in files)
+        target = self.max_bytes * 0.9
+        for path, file_size, _mtime in files:
+            if size <= target:
+                break
+            if self._unlink(path):
+                self.evictions += 1
+            size -= file_size
+        self._size = size
+
+    @staticmethod
+    def _unlink(path: str) -> bool:
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self):
+        with self._lock:
+            for path, _size, _mtime in self._scan():
+                self._unlink(path)
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._scan())
+
+    def stats(self) -> Dict[str, int]:
+        stats = super().stats()
+        stats['bytes'] = self._size
+        return stats
+
+
+_default_store: Optional[FragmentStore] = None
+
+
+def default_fragment_store() -> FragmentStore:
+    """Almacén del proceso que usan los exportadores sin `fragment_store` propio"""
+    global _default_store
+    if _default_store is None:
+        _default_store = MemoryFragmentStore()
+    return _default_store
+
+
+def set_default_fragment_store(store: Optional[FragmentStore]):
+    """Cambia el almacén por defecto (None vuelve a un MemoryFragmentStore nuevo)"""
+    global _default_store
+    _default_store = store
@@ -1,153 +1,519 @@
-from dars.exporters.base import Exporter
+from __future__ import annotations
+
+from dars.exporters.base import Exporter, ExportResult, ProgressCallback
+from dars.exporters.output_writer import OutputWriter
 from dars.core.app import App
 from dars.core.component import Component
-from dars.components.basic.text import Text
-from dars.components.basic.button import Button
-from dars.components.basic.input import Input
-from dars.components.basic.container import Container
-from dars.components.basic.image import Image
-from dars.components.basic.link import Link
-from dars.components.basic.textarea import Textarea
-from dars.components.basic.checkbox import Checkbox
-from dars.components.basic.radiobutton import RadioButton
-from dars.components.basic.select import Select
-from dars.components.basic.slider import Slider
-from dars.components.basic.datepicker import DatePicker
-from dars.components.advanced.card import Card
-from dars.components.advanced.modal import Modal
-from dars.components.advanced.navbar import Navbar
-from dars.components.advanced.table import Table
-from dars.components.advanced.tabs import Tabs
-from dars.components.advanced.accordion import Accordion
-from dars.components.basic.progressbar import ProgressBar
-from dars.components.basic.spinner import Spinner
-from dars.components.basic.tooltip import Tooltip
-from typing import Dict, Any
+from dars.exporters.web.fragment_cache import default_fragment_store
+from dars.exporters.web.page_template import TemplatePlanCache
+from dars.exporters.web.render_context import AppPageView, RenderContext
+from dars.exporters.web.render_plan import compile_plan, run_plan
+from typing import Dict, Any, Iterator, Optional, Set, Tuple, Union, TYPE_CHECKING
+import copy
 import os
-from bs4 import BeautifulSoup
+import sys
+
+if TYPE_CHECKING:
+    from dars.components.basic.text import Text
+    from dars.components.basic.button import Button
+    from dars.components.basic.input import Input
+    from dars.components.basic.container import Container
+    from dars.components.basic.image import Image
+    from dars.components.basic.link import Link
+    from dars.components.basic.textarea import Textarea
+    from dars.components.basic.checkbox import Checkbox
+    from dars.components.basic.radiobutton import RadioButton
+    from dars.components.basic.select import Select
+    from dars.components.basic.slider import Slider
+    from dars.components.basic.datepicker import DatePicker
+    from dars.components.advanced.card import Card
+    from dars.components.advanced.modal import Modal
+    from dars.components.advanced.navbar import Navbar
+    from dars.components.advanced.table import Table
+    from dars.components.advanced.tabs import Tabs
+    from dars.components.advanced.accordion import Accordion
+    from dars.components.basic.progressbar import ProgressBar
+    from dars.components.basic.spinner import Spinner
+    from dars.components.basic.tooltip import Tooltip
+
+# (módulo, clase, método) en el mismo orden de prioridad que la antigua cadena de isinstance.
+# Los módulos no se importan aquí: si un componente existe, su módulo ya está cargado.
+_RENDER_DISPATCH = (
+    ('dars.components.basic.page', 'Page', 'render_page'),
+    ('dars.components.layout.grid', 'GridLayout', 'render_grid'),
+    ('dars.components.layout.flex', 'FlexLayout', 'render_flex'),
+    ('dars.components.basic.text', 'Text', 'render_text'),
+    ('dars.components.basic.button', 'Button', 'render_button'),
+    ('dars.components.basic.input', 'Input', 'render_input'),
+    ('dars.components.basic.container', 'Container', 'render_container'),
+    ('dars.components.basic.image', 'Image', 'render_image'),
+    ('dars.components.basic.link', 'Link', 'render_link'),
+    ('dars.components.basic.textarea', 'Textarea', 'render_textarea'),
+    ('dars.components.advanced.card', 'Card', 'render_card'),
+    ('dars.components.advanced.modal', 'Modal', 'render_modal'),
+    ('dars.components.advanced.navbar', 'Navbar', 'render_navbar'),
+    ('dars.components.basic.checkbox', 'Checkbox', 'render_checkbox'),
+    ('dars.components.basic.radiobutton', 'RadioButton', 'render_radiobutton'),
+    ('dars.components.basic.select', 'Select', 'render_select'),
+    ('dars.components.basic.slider', 'Slider', 'render_slider'),
+    ('dars.components.basic.datepicker', 'DatePicker', 'render_datepicker'),
+    ('dars.components.advanced.table', 'Table', 'render_table'),
+    ('dars.components.advanced.tabs', 'Tabs', 'render_tabs'),
+    ('dars.components.advanced.accordion', 'Accordion', 'render_accordion'),
+    ('dars.components.basic.progressbar', 'ProgressBar', 'render_progressbar'),
+    ('dars.components.basic.spinner', 'Spinner', 'render_spinner'),
+    ('dars.components.basic.tooltip', 'Tooltip', 'render_tooltip'),
+    ('dars.components.basic.cached', 'Cached', 'render_cached'),
+)
+
+_render_methods_by_type: Dict[type, str] = {}
+
+# Métodos de render que copian el HTML de sus hijos tal cual entre su apertura y su cierre:
+# solo en estos componentes generate_html_chunks baja a los hijos para emitirlos por separado
+_STREAMED_CHILDREN = ('render_container', 'render_page', 'render_generic_component')
+_CHILDREN_MARKER = '\ue002'
+
+
+class _ChildrenSlot:
+    """Hijo falso que marca dónde van los hijos reales al emitir la apertura y el cierre"""
+
+    children = ()
+
+    def render(self, exporter=None) -> str:
+        return _CHILDREN_MARKER
+
+
+_CHILDREN_SLOT = _ChildrenSlot()
+_render_methods_by_type[_ChildrenSlot] = '_render_children_slot'
+
+
+def _loaded_class(module_name: str, class_name: str):
+    """Devuelve la clase solo si su módulo ya fue importado (sin forzar la importación)"""
+    module = sys.modules.get(module_name)
+    return getattr(module, class_name, None) if module is not None else None
+
+
+def _resolve_render_method(component_type: type) -> str:
+    method = _render_methods_by_type.get(component_type)
+    if method is None:
+        method = 'render_generic_component'
+        for module_name, class_name, candidate in _RENDER_DISPATCH:
+            cls = _loaded_class(module_name, class_name)
+            if cls is not None and issubclass(component_type, cls):
+                method = candidate
+                break
+        _render_methods_by_type[component_type] = method
+    return method
+
+
+def _prettify_html(html_content: str) -> str:
+    """Formatea el HTML con BeautifulSoup si está instalado"""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        return html_content  # Si no está bs4, sigue igual
+    from bs4.element import Tag
+    soup = BeautifulSoup(html_content, "html.parser")
+    pretty = soup.prettify()
+    # El árbol de bs4 está lleno de ciclos (parent/next_element) que solo libera el GC cíclico,
+    # así que la memoria de cada página se acumulaba. soup.decompose() no baja a los descendientes:
+    # se descompone cada hijo de primer nivel para que todo se libere en cuanto se escribe
+    for element in list(soup.contents):
+        if isinstance(element, Tag):
+            element.decompose()
+        else:
+            element.extract()
+    soup.decompose()
+    return pretty
+
 
 class HTMLCSSJSExporter(Exporter):
     """Exportador para HTML, CSS y JavaScript"""
     
+    def __init__(self, release_page_trees: bool = False, plan_cache=None, fragment_store=None,
+                 writer_workers: int = 4, critical_css: Optional[int] = None, resource_hints: bool = True,
+                 above_fold: int = 3, max_prefetch: int = 5, defer_scripts: bool = True,
+                 client_router: bool = False, islands: bool = False):
+        super().__init__()
+        # Solo configuración y cachés con lock: el estado de cada render va en un RenderContext
+        # (render_context.py), así una instancia puede renderizar desde varios hilos a la vez.
+        # Si es True, export() suelta el árbol de cada página (page.root = None) en cuanto la
+        # escribe. Reduce la memoria en apps muy grandes, pero la App ya no se puede re-exportar.
+        self.release_page_trees = release_page_trees
+        # Planes compilados de PageTemplate (ver page_template.py)
+        self._template_plans = TemplatePlanCache()
+        # Caché opcional de planes por subárbol (render_plan.PlanCache)
+        self.plan_cache = plan_cache
+        # Almacén de fragmentos de Cached (fragment_cache.py); None usa el del proceso
+        self.fragment_store = fragment_store
+        # Hilos que escriben los archivos (output_writer.py); el resumen de cada exportación
+        # va en el ExportResult que devuelve export(), no en el exportador
+        self.writer_workers = writer_workers
+        # CSS crítico: con N, el CSS de los N primeros componentes de primer nivel de cada
+        # página va en línea en <head> y styles.css se carga sin bloquear (render_critical_css)
+        self.critical_css = critical_css
+        # <link rel="preload"/"prefetch"> en el <head> (resource_hints.py): hoja de estilos,
+        # fuentes, imágenes de los `above_fold` primeros componentes y hasta `max_prefetch`
+        # páginas enlazadas. defer_scripts carga runtime y scripts con defer
+        self.resource_hints = resource_hints
+        self.above_fold = above_fold
+        self.max_prefetch = max_prefetch
+        self.defer_scripts = defer_scripts
+        # Navegación en el cliente entre páginas (client_router.py): el runtime lleva el
+        # router y los archivos compartidos incluyen el manifiesto de rutas (routes.json)
+        self.client_router = client_router
+        # Islas (islands.py): JS solo para los componentes interactivos, que un cargador en
+        # línea hidrata uno a uno; una página sin islas ni scripts no lleva <script>
+        self.islands = islands
+
     def get_platform(self) -> str:
         return "html"
         
-    def export(self, app: App, output_path: str) -> bool:
-        """Exporta la aplicación a HTML/CSS/JS (soporta multipágina)."""
+    def export(self, app: App, output_path: str, partition: Optional[Tuple[int, int]] = None,
+               atomic: Union[bool, str] = False, bundle=None,
+               on_progress: Optional[ProgressCallback] = None) -> ExportResult:
+        """Exporta la aplicación a HTML/CSS/JS (soporta multipágina).
+        partition=(k, n) exporta solo la parte k de n de las páginas, para repartir una app
+        grande entre varios procesos; los archivos compartidos y PWA los escribe la parte 0.
+        atomic=True (o 'symlink' / 'rename') construye en un directorio aparte y lo publica
+        en output_path de una vez al terminar (ver atomic_output.py).
+        bundle=BundleOptions() (o True) escribe cada página como un único HTML con su CSS,
+        JS e imágenes pequeñas en línea (ver bundle.py).
+        on_progress(completados, total, descripción) se llama tras cada paso real.
+        Devuelve un ExportResult (verdadero si terminó bien) con write_stats y, en modo
+        bundle, bundle_report."""
+        if atomic and partition is not None:
+            raise ValueError("atomic no se puede combinar con partition")
+        result = ExportResult()
+        swap = None
+        if atomic:
+            from dars.exporters.atomic_output import AtomicOutput
+            swap = AtomicOutput(output_path, mode='auto' if atomic is True else atomic)
         try:
-            self.create_output_directory(output_path)
-
-            # Generar CSS y JS globales (compartidos)
-            css_content = self.generate_css(app)
-            self.write_file(os.path.join(output_path, "styles.css"), css_content)
-
-            runtime_js = self.generate_javascript(app)
-            self.write_file(os.path.join(output_path, "runtime_dars.js"), runtime_js)
-
-            script_js = ""  # Aquí podrías agregar lógica para scripts de usuario en el futuro
-            self.write_file(os.path.join(output_path, "script.js"), script_js)
-
-            # Multipágina: exportar un HTML, CSS y JS por cada página registrada
-            if hasattr(app, "is_multipage") and app.is_multipage():
-                import copy
-                # Determinar la página index (principal)
-                index_page = None
-                if hasattr(app, 'get_index_page'):
-                    index_page = app.get_index_page()
-                # Exportar cada página
-                for slug, page in app.pages.items():
-                    import copy
-                    page_app = copy.copy(app)
-                    page_app.root = page.root
-                    if page.title:
-                        page_app.title = page.title
-                    if page.meta:
-                        for k, v in page.meta.items():
-                            setattr(page_app, k, v)
-                    # --- Aseguramos que root nunca sea lista, igual que single-page ---
-                    from dars.components.basic.container import Container
-                    if isinstance(page_app.root, list):
-                        page_app.root = Container(children=page_app.root)
-                    # --- Generación idéntica a single-page, solo cambia el nombre de archivo ---
-                    if index_page is not None and page is index_page:
-                        css_content = self.generate_css(page_app)
-                        self.write_file(os.path.join(output_path, "styles.css"), css_content)
-                        # --- scripts globales + scripts de la Page ---
-                        scripts = list(getattr(app, 'scripts', []))
-                        if hasattr(page_app.root, 'get_scripts'):
-                            scripts += page_app.root.get_scripts()
-                        script_js = self._generate_combined_script_js(scripts)
-                        self.write_file(os.path.join(output_path, "script.js"), script_js)
-                        html_content = self.generate_html(page_app, css_file="styles.css", script_file="script.js")
-                        filename = "index.html"
-                        try:
-                            soup = BeautifulSoup(html_content, "html.parser")
-                            html_content = soup.prettify()
-                        except ImportError:
-                            pass
-                        self.write_file(os.path.join(output_path, filename), html_content)
-                    else:
-                        css_content = self.generate_css(page_app)
-                        scripts = list(getattr(app, 'scripts', []))
-                        if hasattr(page_app.root, 'get_scripts'):
-                            scripts += page_app.root.get_scripts()
-                        script_js = self._generate_combined_script_js(scripts)
-                        script_name = f"script_{slug}.js"
-                        self.write_file(os.path.join(output_path, script_name), script_js)
-                        html_content = self.generate_html(page_app, css_file="styles.css", script_file=script_name)
-                        filename = f"{slug}.html"
-                        try:
-                            soup = BeautifulSoup(html_content, "html.parser")
-                            html_content = soup.prettify()
-                        except ImportError:
-                            pass
-                        self.write_file(os.path.join(output_path, filename), html_content)
-                        self.write_file(os.path.join(output_path, f"styles_{slug}.css"), css_content)
-                        # El script_{slug}.js ya fue generado correctamente arriba, y el HTML ya fue generado, no sobrescribir
+            if swap is not None:
+                # Los archivos iguales a los del build publicado se enlazan desde él
+                link_from = swap.current_path
+                output_path = swap.begin()
             else:
-                # Single-page clásico
-                css_content = self.generate_css(app)
-                self.write_file(os.path.join(output_path, "styles.css"), css_content)
-                script_js = ""  # Aquí podrías agregar lógica para scripts de usuario en el futuro
-                self.write_file(os.path.join(output_path, "script.js"), script_js)
-                html_content = self.generate_html(app, css_file="styles.css", script_file="script.js")
-                try:
-                    soup = BeautifulSoup(html_content, "html.parser")
-                    html_content = soup.prettify()
-                except ImportError:
-                    pass  # Si no está bs4, sigue igual
-                self.write_file(os.path.join(output_path, "index.html"), html_content)
-
-            # Generar archivos PWA si está habilitado
-            if getattr(app, 'pwa_enabled', False):
-                self._generate_pwa_files(app, output_path)
-
-            return True
+                link_from = None
+                self.create_output_directory(output_path)
+
+            # Cada página se renderiza y se pasa al escritor, que la escribe en segundo plano
+            # mientras se renderiza la siguiente; la cola del escritor está acotada, así la
+            # memoria no crece con el número de páginas
+            writer = OutputWriter(output_path, workers=self.writer_workers, link_from=link_from)
+            result.write_stats = writer.stats
+            with writer:
+                result.bundle_report = self._write_export(app, writer, partition, bundle, on_progress)
+
+            if swap is not None:
+                swap.commit()
+            return result
         except Exception as e:
+            if swap is not None:
+                swap.abort()
             print(f"Error al exportar: {e}")
-            return False
+            result.ok = False
+            result.error = e
+            return result
+
+    def export_archive(self, app: App, target, format: Optional[str] = None, precompress: bool = False,
+                       compresslevel: Optional[int] = None, bundle=None,
+                       on_progress: Optional[ProgressCallback] = None) -> ExportResult:
+        """Exporta directamente a un zip o tar, sin pasar por disco (ver archive_writer.py).
+        target: ruta (el formato sale de la extensión), stream binario, o ZipFile/TarFile abierto.
+        format: 'zip', 'tar', 'tar.gz', 'tar.bz2' o 'tar.xz' (por defecto zip para streams).
+        precompress: añade .gz (y .br con brotli) de cada asset de texto.
+        bundle, on_progress: como en export(). Devuelve un ExportResult, como export()."""
+        from dars.exporters.archive_writer import ArchiveWriter
+        result = ExportResult()
+        try:
+            writer = ArchiveWriter(target, format=format, precompress=precompress, compresslevel=compresslevel)
+            result.write_stats = writer.stats
+            with writer:
+                result.bundle_report = self._write_export(app, writer, bundle=bundle, on_progress=on_progress)
+            return result
+        except Exception as e:
+            print(f"Error al exportar: {e}")
+            result.ok = False
+            result.error = e
+            return result
+
+    def _write_export(self, app: App, writer, partition: Optional[Tuple[int, int]] = None, bundle=None,
+                      on_progress: Optional[ProgressCallback] = None):
+        """Escribe todos los pasos de una exportación con `writer` (OutputWriter o ArchiveWriter).
+        Devuelve el BundleReport en modo bundle, si no None"""
+        writes_shared = partition is None or partition[0] == 0
+        pwa_enabled = writes_shared and getattr(app, 'pwa_enabled', False)
+        page_count = self.count_page_targets(app, partition)
+        # Con fuentes de páginas sin count el total es desconocido (progreso indeterminado)
+        total_steps = None if page_count is None else 1 + page_count + (1 if pwa_enabled else 0)
+        report_progress = on_progress or (lambda completed, total, description: None)
+
+        bundle_report = None
+        if bundle:
+            from dars.exporters.web.bundle import PageBundler
+            bundler = PageBundler(None if bundle is True else bundle)
+            bundle_report = bundler.report
+            steps = self.iter_bundle_steps(app, partition, bundler)
+        else:
+            steps = self.iter_export_steps(app, partition)
+        # Los archivos compartidos se escriben al final: la página index genera su propio
+        # styles.css y script.js, que tienen prioridad, y un archivo comprimido no puede
+        # sobrescribir una entrada
+        _name, shared = next(steps)
+        report_progress(1, total_steps, "shared")
+        step = 1
+        for step, (description, files) in enumerate(steps, start=2):
+            for filename in files:
+                shared.pop(filename, None)
+            writer.write_files(files)
+            files = None
+            report_progress(step, total_steps, description)
+        writer.write_files(shared)
+
+        # Generar archivos PWA si está habilitado
+        if pwa_enabled:
+            self._generate_pwa_files(app, None, writer)
+            report_progress(step + 1, total_steps or step + 1, "pwa")
+        return bundle_report
+
+    def iter_export_steps(self, app: App, partition: Optional[Tuple[int, int]] = None):
+        """Pasos de export() sin escribir nada: ("shared", archivos compartidos) y luego
+        (slug, archivos) por página, {nombre relativo: contenido}. Los archivos PWA no
+        están incluidos (_generate_pwa_files los escribe directamente)"""
+        writes_shared = partition is None or partition[0] == 0
+        # Generar CSS y JS globales (compartidos)
+        yield "shared", (self.render_shared_files(app) if writes_shared else {})
+        # Multipágina: un HTML, CSS y JS por cada página registrada; si no, single-page clásico
+        for slug, page, is_index in self.iter_page_targets(app, partition):
+            files = self.render_page_files(app, slug, page, is_index)
+            if self.release_page_trees and page is not None:
+                page.root = None
+            # Las páginas de add_page_source no se guardan en la App: se sueltan aquí
+            page = None
+            yield slug or "index", files
+            files = None
+
+    def iter_bundle_steps(self, app: App, partition: Optional[Tuple[int, int]] = None, bundler=None):
+        """Como iter_export_steps, pero cada página es un solo HTML autocontenido (bundle.py)
+        y no hay archivos compartidos. El informe de tamaños queda en `bundler.report`: el
+        PageBundler lo pasa quien llama (por defecto uno con las opciones por defecto)"""
+        from dars.exporters.web.bundle import PageBundler
+        from dars.exporters.web.css_subset import page_features, used_classes
+        if self.critical_css:
+            raise ValueError("critical_css no se combina con el modo bundle, que ya lleva en línea el CSS de cada página")
+        if self.client_router:
+            raise ValueError("client_router no se combina con el modo bundle: las páginas no comparten runtime")
+        if self.islands:
+            raise ValueError("islands no se combina con el modo bundle, que ya lleva en línea el runtime de cada página")
+        if bundler is None:
+            bundler = PageBundler()
+        yield "shared", {}
+        for slug, page, is_index in self.iter_page_targets(app, partition):
+            files = self.render_page_files(app, slug, page, is_index)
+            page_app = self._page_app(app, page) if page is not None else app
+            html_name = "index.html" if is_index else f"{slug}.html"
+            css_name = "styles.css" if is_index else f"styles_{slug}.css"
+            script_name = "script.js" if is_index else f"script_{slug}.js"
+            document = files[html_name]
+            classes = used_classes(document)
+            # Solo las funciones del runtime que usan los componentes de esta página
+            runtime_js = self.generate_javascript(page_app, features=page_features(classes))
+            # Todas las páginas enlazan "styles.css" (y su preload): es el href que se sustituye,
+            # con el CSS de la propia página
+            document = bundler.bundle(html_name, document, {"styles.css": files[css_name]},
+                                      {"runtime_dars.js": runtime_js, script_name: files[script_name]},
+                                      classes=classes)
+            if self.release_page_trees and page is not None:
+                page.root = None
+            page = page_app = files = None
+            yield slug or "index", {html_name: document}
+
+    def export_async(self, app: App, output_path: str, partition: Optional[Tuple[int, int]] = None,
+                     writers: int = 4, max_pending: int = 8, on_progress: Optional[ProgressCallback] = None):
+        """Versión asyncio de export(): `await exporter.export_async(app, path)` o
+        `async for progress in exporter.export_async(...)`. Ver async_export.py"""
+        from dars.exporters.web.async_export import AsyncExport
+        return AsyncExport(self, app, output_path, partition, writers=writers, max_pending=max_pending,
+                           on_progress=on_progress)
+
+    def render_shared_files(self, app: App) -> Dict[str, str]:
+        """Archivos compartidos por todas las páginas: {nombre relativo: contenido}"""
+        if self.client_router and self.islands:
+            raise ValueError("client_router no se combina con islands: el router necesita el runtime en todas las páginas")
+        files = {
+            "styles.css": self.generate_css(app),
+            "runtime_dars.js": self.generate_javascript(app),
+            "script.js": "",  # Aquí podrías agregar lógica para scripts de usuario en el futuro
+        }
+        if self.client_router:
+            files["routes.json"] = self.render_route_manifest(app)
+        return files
+
+    def render_route_manifest(self, app: App) -> str:
+        """routes.json del router: cada página (de todas las particiones) con su script.
+        Solo recorre los nombres; las páginas de add_page_source no se renderizan"""
+        from dars.exporters.web.client_router import route_manifest
+        return route_manifest(
+            ("index.html", "script.js") if is_index else (f"{slug}.html", f"script_{slug}.js")
+            for slug, _page, is_index in self.iter_page_targets(app)
+        )
 
-            
-    def _generate_pwa_files(self, app: 'App', output_path: str) -> None:
-        """Genera manifest.json, iconos y service worker para PWA"""
-        import json, os
+    def iter_page_targets(self, app: App, partition: Optional[Tuple[int, int]] = None):
+        """Itera (slug, page, is_index) en orden de exportación.
+        En single-page se produce una única entrada (None, None, True).
+        Las páginas de App.add_page_source() se construyen aquí, una a una."""
+        if hasattr(app, "is_multipage") and app.is_multipage():
+            # Determinar la página index (principal)
+            index_page = None
+            if hasattr(app, 'get_index_page'):
+                index_page = app.get_index_page()
+            if hasattr(app, 'iter_pages'):
+                pages = app.iter_pages(partition)
+            else:
+                pages = app.pages.values()
+            for page in pages:
+                if index_page is not None:
+                    is_index = page is index_page
+                else:
+                    # Sin páginas de add_page: App.iter_pages marca la primera de las fuentes
+                    is_index = bool(getattr(page, 'index', False))
+                yield page.name, page, is_index
+        elif partition is None or partition[0] == 0:
+            yield None, None, True
+
+    def count_page_targets(self, app: App, partition: Optional[Tuple[int, int]] = None) -> Optional[int]:
+        """Número de páginas que exportará iter_page_targets (para el progreso), o None si
+        alguna fuente de páginas no lo indica"""
+        if hasattr(app, "is_multipage") and app.is_multipage():
+            total = app.page_count() if hasattr(app, 'page_count') else len(app.pages)
+        else:
+            total = 1
+        if total is None or partition is None:
+            return total
+        k, n = partition
+        return total * (k + 1) // n - total * k // n
+
+    def _page_app(self, app: App, page) -> AppPageView:
+        """La App vista desde una página (raíz, título y meta propios), sin copiarla"""
+        return AppPageView(app, page)
+
+    def render_page_files(self, app: App, slug, page, is_index: bool,
+                          subtree_keys: Optional[Dict[int, str]] = None) -> Dict[str, str]:
+        """Renderiza los archivos de una página: {nombre relativo: contenido}.
+        subtree_keys: fingerprints {id(componente): hash} del árbol, para plan_cache"""
+        if getattr(page, 'template', None) is not None:
+            return self._render_template_page_files(app, slug, page, is_index)
+        if page is None:
+            # Single-page clásico
+            css_content = self.generate_css(app)
+            # Con islas los scripts de la App van en script.js: el runtime solo se pide si hay islas
+            script_js = self.page_script_js(app, app) if self.islands else ""
+            html_content = self.generate_html(app, css_file="styles.css",
+                                              script_file=self._script_file("script.js", script_js),
+                                              context=self.new_context(app, subtree_keys),
+                                              critical_css=self.render_critical_css(app, css_content))
+            return {
+                "styles.css": css_content,
+                "script.js": script_js,
+                "index.html": self.prettify_html(html_content),
+            }
+
+        page_app = self._page_app(app, page)
+        css_content = self.generate_css(page_app)
+        script_js = self.page_script_js(app, page_app)
+        context = self.new_context(page_app, subtree_keys)
+        critical_css = self.render_critical_css(page_app, css_content)
+        # --- Generación idéntica a single-page, solo cambia el nombre de archivo ---
+        if is_index:
+            html_content = self.generate_html(page_app, css_file="styles.css",
+                                              script_file=self._script_file("script.js", script_js),
+                                              context=context, critical_css=critical_css)
+            return {
+                "styles.css": css_content,
+                "script.js": script_js,
+                "index.html": self.prettify_html(html_content),
+            }
+        script_name = f"script_{slug}.js"
+        html_content = self.generate_html(page_app, css_file="styles.css",
+                                          script_file=self._script_file(script_name, script_js),
+                                          context=context, critical_css=critical_css)
+        return {
+            script_name: script_js,
+            f"{slug}.html": self.prettify_html(html_content),
+            f"styles_{slug}.css": css_content,
+        }
+
+    def _compile_page_template(self, app: App, template):
+        """(plan, css, js) de una PageTemplate: se calculan una vez por App y plantilla"""
+        from dars.exporters.web.page_template import SCRIPT_FILE_FIELD, field
+        page_app = self._page_app(app, template.as_page(None))
+        css_content = self.generate_css(page_app)
+        script_js = self.page_script_js(app, page_app)
+        plan = template.compile(self, app, script_file=self._script_file(field(SCRIPT_FILE_FIELD), script_js),
+                                critical_css=self.render_critical_css(page_app, css_content))
+        return plan, css_content, script_js
+
+    def _script_file(self, script_file, script_js: str):
+        """El script de la página, o None si con islas no tiene código (no se enlaza)"""
+        return None if self.islands and not script_js.strip() else script_file
+
+    def render_critical_css(self, page_app: App, css: str) -> Optional[str]:
+        """
+        CSS crítico de una página: las reglas de `css` que usan la raíz y sus primeros
+        `critical_css` hijos (lo que se ve sin hacer scroll), o None si está desactivado.
+        Se calcula desde el árbol: esos componentes se renderizan aparte y se filtra la hoja
+        de estilos con sus clases (css_subset.py), sin navegador.
+        """
+        if not self.critical_css:
+            return None
+        from dars.exporters.web.css_subset import feature_classes, subset_css, used_classes
+        root = self._document_root(page_app)
+        above_fold = ""
+        if root is not None:
+            children = getattr(root, 'children', None)
+            if isinstance(children, list) and len(children) > self.critical_css:
+                # Copia superficial: el árbol de la página no se toca
+                root = copy.copy(root)
+                root.children = children[:self.critical_css]
+            above_fold = self.render_tree(root, self.new_context(page_app))
+        return subset_css(css, feature_classes(used_classes(above_fold)))
+
+    def _render_template_page_files(self, app: App, slug, page, is_index: bool) -> Dict[str, str]:
+        """Como render_page_files, pero uniendo el plan precompilado con el registro de la página"""
+        from dars.exporters.web.page_template import SCRIPT_FILE_FIELD
+        plan, css_content, script_js = self._template_plans.get(
+            app, page.template, lambda: self._compile_page_template(app, page.template))
+        script_name = "script.js" if is_index else f"script_{slug}.js"
+        html_content = plan.render({**page.record, SCRIPT_FILE_FIELD: script_name})
+        if is_index:
+            return {"styles.css": css_content, "script.js": script_js, "index.html": html_content}
+        return {script_name: script_js, f"{slug}.html": html_content, f"styles_{slug}.css": css_content}
+
+    def _generate_pwa_files(self, app: 'App', output_path: Optional[str], writer=None) -> None:
+        """Genera manifest.json, iconos y service worker para PWA a través de `writer`
+        (OutputWriter o ArchiveWriter); sin él, con un OutputWriter propio en output_path"""
+        if writer is None:
+            with OutputWriter(output_path, workers=self.writer_workers) as own_writer:
+                self._generate_pwa_files(app, output_path, own_writer)
+            return
         # Manifest
-        self._generate_manifest_json(app, output_path)
+        self._generate_manifest_json(app, writer)
         # Iconos por defecto (placeholder, puedes mejorar esto)
-        self._generate_default_icons(output_path)
+        self._generate_default_icons(writer)
         # Service worker
         sw_path = getattr(app, 'service_worker_path', None)
         sw_enabled = getattr(app, 'service_worker_enabled', True)
         if sw_enabled:
             if sw_path:
                 # Copiar el personalizado
-                import shutil
-                shutil.copy(sw_path, os.path.join(output_path, 'sw.js'))
+                writer.copy(sw_path, 'sw.js')
             else:
-                self._generate_basic_service_worker(output_path)
+                self._generate_basic_service_worker(writer)
 
-    def _generate_manifest_json(self, app: 'App', output_path: str) -> None:
-        import json, os, shutil
+    def _generate_manifest_json(self, app: 'App', writer) -> None:
+        import json
         manifest = {
             "name": getattr(app, 'pwa_name', getattr(app, 'title', 'Dars App')),
             "short_name": getattr(app, 'pwa_short_name', 'Dars'),
@@ -158,15 +524,12 @@ class HTMLCSSJSExporter(Exporter):
             "theme_color": getattr(app, 'theme_color', '#4a90e2'),
             "orientation": getattr(app, 'pwa_orientation', 'portrait')
         }
-        icons = self._get_icons_manifest(app, output_path)
+        icons = self._get_icons_manifest(app, writer)
         if icons is not None:
             manifest["icons"] = icons
-        manifest_path = os.path.join(output_path, "manifest.json")
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        writer.write("manifest.json", json.dumps(manifest, indent=2))
 
-    def _get_icons_manifest(self, app: 'App', output_path: str) -> list:
-        import os, shutil
+    def _get_icons_manifest(self, app: 'App', writer) -> list:
         user_icons = getattr(app, 'icons', None)
         if user_icons is not None:
             # Si el usuario define icons=[] explícito, no ponemos icons
@@ -174,22 +537,18 @@ class HTMLCSSJSExporter(Exporter):
                 return None
             # Si el usuario define iconos personalizados
             icons_manifest = []
-            icons_dir = os.path.join(output_path, "icons")
-            os.makedirs(icons_dir, exist_ok=True)
             for icon in user_icons:
                 if isinstance(icon, dict):
                     src = icon.get("src")
                     if src and os.path.isfile(src):
                         # Copiamos el icono al output
-                        dest_path = os.path.join(icons_dir, os.path.basename(src))
-                        shutil.copy(src, dest_path)
+                        writer.copy(src, f"icons/{os.path.basename(src)}")
                         icon["src"] = f"icons/{os.path.basename(src)}"
                     icons_manifest.append(icon)
                 elif isinstance(icon, str):
                     # Si solo es una ruta, la copiamos y generamos el dict
                     if os.path.isfile(icon):
-                        dest_path = os.path.join(icons_dir, os.path.basename(icon))
-                        shutil.copy(icon, dest_path)
+                        writer.copy(icon, f"icons/{os.path.basename(icon)}")
                         icons_manifest.append({
                             "src": f"icons/{os.path.basename(icon)}",
                             "sizes": "192x192",
@@ -212,22 +571,18 @@ class HTMLCSSJSExporter(Exporter):
             }
         ]
 
-    def _generate_default_icons(self, output_path: str) -> None:
-        import os, shutil
+    def _generate_default_icons(self, writer) -> None:
         # Ruta de los iconos PWA por defecto incluidos en el framework
         base_dir = os.path.dirname(os.path.abspath(__file__))
         default_icons_dir = os.path.join(base_dir, "icons", "pwa")
-        icons_dir = os.path.join(output_path, "icons")
-        os.makedirs(icons_dir, exist_ok=True)
         # Copiar icon-192x192.png y icon-512x512.png si existen
         for fname in ["icon-192x192.png", "icon-512x512.png"]:
             src = os.path.join(default_icons_dir, fname)
-            dst = os.path.join(icons_dir, fname)
             if os.path.isfile(src):
-                shutil.copy(src, dst)
+                writer.copy(src, f"icons/{fname}")
 
 
-    def _generate_basic_service_worker(self, output_path: str) -> None:
+    def _generate_basic_service_worker(self, writer) -> None:
         sw_content = '''// Service Worker básico para Dars PWA
 const CACHE_NAME = 'dars-pwa-cache-v1';
 const urlsToCache = [
@@ -259,9 +614,16 @@ self.addEventListener('fetch', event => {
   );
 });
 '''
-        sw_path = os.path.join(output_path, "sw.js")
-        with open(sw_path, 'w', encoding='utf-8') as f:
-            f.write(sw_content)
+        writer.write("sw.js", sw_content)
+
+    def page_script_js(self, app: App, page_app: App) -> str:
+        """JS propio de una página: scripts globales de la App más los de su raíz.
+        Con client_router los globales solo van en el runtime, que el router no recarga:
+        así no se vuelven a ejecutar al visitar otra página"""
+        scripts = [] if self.client_router else list(getattr(app, 'scripts', []))
+        if hasattr(page_app.root, 'get_scripts'):
+            scripts += page_app.root.get_scripts()
+        return self._generate_combined_script_js(scripts)
 
     def _generate_combined_script_js(self, scripts):
         """Combina y concatena el código de todos los scripts (InlineScript/FileScript)"""
@@ -272,17 +634,62 @@ self.addEventListener('fetch', event => {
             js += "\n\n"
         return js
 
-    def generate_html(self, app: App, css_file: str = "styles.css", script_file: str = "script.js") -> str:
-        """Genera el contenido HTML con todas las propiedades de la aplicación"""
-        body_content = ""
+    def prettify_html(self, html_content: str) -> str:
+        """Formatea el HTML final de una página (BeautifulSoup si está instalado)"""
+        return _prettify_html(html_content)
+
+    def generate_html(self, app: App, css_file: str = "styles.css", script_file: Optional[str] = "script.js",
+                      runtime_file: str = "runtime_dars.js", context: Optional[RenderContext] = None,
+                      critical_css: Optional[str] = None) -> str:
+        """Genera el contenido HTML con todas las propiedades de la aplicación.
+        `context` (new_context) recoge lo que necesita la página; si no se da, se crea uno.
+        Con `critical_css`, ese CSS va en línea y `css_file` se carga sin bloquear el render"""
+        root_component = self._document_root(app)
+        if context is None:
+            context = self.new_context(app)
+        body_content = self.render_tree(root_component, context) if root_component else ""
+        # No modificar el HTML con BeautifulSoup para no perder tags/scripts
+        return (self._document_head(app, css_file, critical_css) + body_content
+                + self._document_tail(runtime_file, script_file, context))
+
+    def generate_html_chunks(self, app: App, css_file: str = "styles.css", script_file: Optional[str] = "script.js",
+                             runtime_file: str = "runtime_dars.js", chunk_size: int = 16384,
+                             context: Optional[RenderContext] = None,
+                             critical_css: Optional[str] = None) -> Iterator[str]:
+        """
+        El mismo documento que generate_html, en fragmentos para respuestas en streaming.
+        El primero es el <head> completo (meta tags, links y hoja de estilos), antes de
+        renderizar nada, para que el navegador empiece a pedir CSS y JS. Después el cuerpo
+        se emite componente a componente según se renderiza, agrupado en fragmentos de
+        al menos `chunk_size` caracteres. Sin prettify: ''.join() es igual a generate_html.
+        """
+        yield self._document_head(app, css_file, critical_css)
+        buffer = []
+        size = 0
+        root_component = self._document_root(app)
+        if context is None:
+            context = self.new_context(app)
+        if root_component:
+            for part in self.iter_render_tree(root_component, context):
+                buffer.append(part)
+                size += len(part)
+                if size >= chunk_size:
+                    yield ''.join(buffer)
+                    buffer = []
+                    size = 0
+        buffer.append(self._document_tail(runtime_file, script_file, context))
+        yield ''.join(buffer)
+
+    def _document_root(self, app: App):
         from dars.components.basic.container import Container
         root_component = app.root
         # Protección: si root es lista, envolver en Container correctamente
         if isinstance(root_component, list):
             root_component = Container(children=root_component)
-        if root_component:
-            body_content = self.render_component(root_component)
-        
+        return root_component
+
+    def _document_head(self, app: App, css_file: str, critical_css: Optional[str] = None) -> str:
+        """Documento hasta la apertura de <body> (incluida)"""
         # Generar meta tags
         meta_tags_html = self._generate_meta_tags(app)
         
@@ -294,26 +701,82 @@ self.addEventListener('fetch', event => {
         
         # Generar Twitter Card tags
         twitter_tags_html = self._generate_twitter_tags(app)
+
+        # Preload/prefetch justo después del charset, para que el navegador los vea cuanto antes
+        charset_html = f"<meta charset=\"{app.config.get('charset', 'UTF-8')}\">"
+        hints_html = self._generate_resource_hints(app, None if critical_css is not None else css_file)
+        if hints_html:
+            charset_html += "\n    " + hints_html
+
+        stylesheet_html = f'<link rel="stylesheet" href="{css_file}">'
+        if critical_css is not None:
+            # CSS crítico en línea; la hoja completa se pide como preload y se aplica al llegar
+            inline_css = critical_css.replace('</', '<\\/')
+            stylesheet_html = (
+                f'<style>\n{inline_css}</style>\n'
+                f'    <link rel="preload" href="{css_file}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                f'    <noscript>{stylesheet_html}</noscript>'
+            )
         
-        html_template = f"""<!DOCTYPE html>
+        return f"""<!DOCTYPE html>
 <html lang="{app.language}">
 <head>
-    <meta charset="{app.config.get('charset', 'UTF-8')}">
+    {charset_html}
     {meta_tags_html}
     <title>{app.title}</title>
     {links_html}
     {og_tags_html}
     {twitter_tags_html}
-    <link rel=\"stylesheet\" href=\"{css_file}\">
+    {stylesheet_html}
 </head>
 <body>
-    {body_content}
-    <script src=\"runtime_dars.js\"></script>
-    <script src=\"{script_file}\"></script>
-</body>
-</html>"""
-        # No modificar el HTML con BeautifulSoup para no perder tags/scripts
-        return html_template
+    """
+
+    def _document_tail(self, runtime_file: str, script_file: Optional[str],
+                       context: Optional[RenderContext] = None) -> str:
+        """Scripts y cierre del documento; script_file=None si la página no tiene script.
+        Con islas, el runtime no se enlaza: lo pide el cargador, y solo si `context`
+        renderizó alguna isla"""
+        # defer: se ejecutan en orden tras parsear el documento, antes de DOMContentLoaded
+        defer_attr = " defer" if self.defer_scripts else ""
+        if self.islands:
+            from dars.exporters.web.islands import HYDRATORS, render_loader
+            has_islands = context is not None and not context.features.isdisjoint(HYDRATORS)
+            scripts = [render_loader(runtime_file)] if has_islands else []
+        else:
+            scripts = [f'<script src="{runtime_file}"{defer_attr}></script>']
+        if script_file is not None:
+            scripts.append(f'<script src="{script_file}"{defer_attr}></script>')
+        return "".join(f"\n    {script}" for script in scripts) + "\n</body>\n</html>"
+
+    def _lazy(self, html: str, context: RenderContext) -> str:
+        """Contenido que no se ve al cargar, en un <template> que el runtime instancia al
+        abrirse (lazy_content.py)"""
+        from dars.exporters.web.lazy_content import lazy_template
+        context.features.add('lazy')
+        return lazy_template(html)
+
+    def _island(self, kind: str, context: RenderContext) -> str:
+        """Marca de isla de un componente interactivo (islands.py), o "" sin islas"""
+        if not self.islands:
+            return ""
+        from dars.exporters.web.islands import island_attr
+        context.features.add(kind)
+        return island_attr(kind)
+
+    def _generate_resource_hints(self, app: App, css_file: Optional[str]) -> str:
+        """Preload de la hoja de estilos (si se da), fuentes e imágenes above the fold, y
+        prefetch de las páginas enlazadas (ver resource_hints.py)"""
+        if not self.resource_hints:
+            return ""
+        from dars.exporters.web.resource_hints import (above_fold_components, image_sources, iter_components,
+                                                       linked_pages, render_hints)
+        root = self._document_root(app)
+        Image = _loaded_class('dars.components.basic.image', 'Image')
+        Link = _loaded_class('dars.components.basic.link', 'Link')
+        images = image_sources(above_fold_components(root, self.above_fold), Image)
+        pages = linked_pages(iter_components(root), Link, self.max_prefetch)
+        return render_hints(css_file, getattr(app, 'fonts', ()), images, pages)
 
     
     def _generate_meta_tags(self, app: App) -> str:
@@ -872,6 +1335,21 @@ body {
 
 """
         
+        # @font-face de las fuentes declaradas con App.add_font(url, family=...)
+        for font in getattr(app, 'fonts', ()):
+            if not font.get('family'):
+                continue
+            from dars.exporters.web.resource_hints import font_type
+            known = font_type(font['url'])
+            format_attr = f" format(\"{known[1]}\")" if known else ""
+            css_content += "@font-face {\n"
+            css_content += f"    font-family: \"{font['family']}\";\n"
+            css_content += f"    src: url(\"{font['url']}\"){format_attr};\n"
+            css_content += f"    font-weight: {font['weight']};\n"
+            css_content += f"    font-style: {font['style']};\n"
+            css_content += "    font-display: swap;\n"
+            css_content += "}\n\n"
+
         # Agregar estilos globales de la aplicación definidos por el usuario
         for selector, styles in app.global_styles.items():
             css_content += f"{selector} {{\n"
@@ -880,8 +1358,17 @@ body {
             
         return css_content
         
-    def generate_javascript(self, app: App) -> str:
-        """Genera el contenido JavaScript"""
+    def generate_javascript(self, app: App, features: Optional[Set[str]] = None) -> str:
+        """Genera el contenido JavaScript. `features` (RenderContext.features) dice qué
+        funciones del runtime incluir; sin él se buscan en todas las páginas (app_features).
+        Con islas, el runtime solo define las funciones de hidratación (islands.py)"""
+        from dars.exporters.web.islands import HYDRATORS, island_runtime
+        from dars.exporters.web.lazy_content import LAZY_JS
+        if features is None:
+            features = self.app_features(app)
+        has_lazy = 'lazy' in features
+        if self.islands:
+            return island_runtime() + (LAZY_JS.lstrip("\n") + "\n" if has_lazy else "")
         js_content = """// Dars Runtime
 document.addEventListener('DOMContentLoaded', function() {
     console.log('Dars App loaded');
@@ -893,55 +1380,30 @@ document.addEventListener('DOMContentLoaded', function() {
 function initializeEvents() {
     // Los eventos específicos se agregarán aquí
 """
-
-        def has_component_type(component, cls):
-            if isinstance(component, cls):
-                return True
-            if hasattr(component, 'children'):
-                for child in getattr(component, 'children', []):
-                    if has_component_type(child, cls):
-                        return True
-            return False
-
-        has_tabs = has_component_type(app.root, Tabs) if hasattr(app, 'root') else False
-        has_accordion = has_component_type(app.root, Accordion) if hasattr(app, 'root') else False
+        has_tabs = 'tabs' in features
+        has_accordion = 'accordion' in features
         # Aquí puedes añadir otros has_<componente> para lógica futura
 
         if has_tabs:
             js_content += "    // Tabs interactivas\n"
-            js_content += """    document.querySelectorAll('.dars-tabs').forEach(function(tabsEl) {
-        const tabButtons = tabsEl.querySelectorAll('.dars-tab');
-        const panels = tabsEl.querySelectorAll('.dars-tab-panel');
-        tabButtons.forEach(function(btn, i) {
-            btn.addEventListener('click', function() {
-                tabButtons.forEach(b => b.classList.remove('dars-tab-active'));
-                panels.forEach(p => p.classList.remove('dars-tab-panel-active'));
-                btn.classList.add('dars-tab-active');
-                if (panels[i]) panels[i].classList.add('dars-tab-panel-active');
-            });
-        });
-    });\n"""
+            js_content += "    document.querySelectorAll('.dars-tabs').forEach(function(tabsEl) {\n"
+            js_content += HYDRATORS['tabs'][1] + "    });\n"
         if has_accordion:
             js_content += "    // Accordion interactivo\n"
-            js_content += """    document.querySelectorAll('.dars-accordion').forEach(function(accEl) {
-        accEl.querySelectorAll('.dars-accordion-title').forEach(function(titleEl) {
-            titleEl.addEventListener('click', function() {
-                const section = titleEl.parentElement;
-                const isOpen = section.classList.contains('dars-accordion-open');
-                if (isOpen) {
-                    section.classList.remove('dars-accordion-open');
-                } else {
-                    // Si es acordeón exclusivo, cerrar otros
-                    accEl.querySelectorAll('.dars-accordion-section').forEach(function(sec) {
-                        sec.classList.remove('dars-accordion-open');
-                    });
-                    section.classList.add('dars-accordion-open');
-                }
-            });
-        });
-    });\n"""
+            js_content += "    document.querySelectorAll('.dars-accordion').forEach(function(accEl) {\n"
+            js_content += HYDRATORS['accordion'][1] + "    });\n"
+        if has_lazy:
+            js_content += "    // Modales con contenido diferido\n"
+            js_content += "    document.querySelectorAll('.dars-modal').forEach(darsWatchLazyModal);\n"
         js_content += "}\n\n"
 
+        if has_lazy:
+            js_content += LAZY_JS.lstrip("\n") + "\n"
+
+        if self.client_router:
+            from dars.exporters.web.client_router import ROUTER_JS
+            js_content += ROUTER_JS.lstrip("\n") + "\n"
+
         # Agregar scripts de la aplicación
         for script in app.scripts:
             js_content += f"// Script: {script.__class__.__name__}\n"
@@ -950,66 +1412,135 @@ function initializeEvents() {
             
         return js_content
         
-    def render_component(self, component: Component) -> str:
-        """Renderiza un componente a HTML"""
-        from dars.components.basic.page import Page
-        from dars.components.layout.grid import GridLayout
-        from dars.components.layout.flex import FlexLayout
-        if isinstance(component, Page):
-            return self.render_page(component)
-        if isinstance(component, GridLayout):
-            return self.render_grid(component)
-        if isinstance(component, FlexLayout):
-            return self.render_flex(component)
-        if isinstance(component, Text):
-            return self.render_text(component)
-        elif isinstance(component, Button):
-            return self.render_button(component)
-        elif isinstance(component, Input):
-            return self.render_input(component)
-        elif isinstance(component, Container):
-            return self.render_container(component)
-        elif isinstance(component, Image):
-            return self.render_image(component)
-        elif isinstance(component, Link):
-            return self.render_link(component)
-        elif isinstance(component, Textarea):
-            return self.render_textarea(component)
-        elif isinstance(component, Card):
-            return self.render_card(component)
-        elif isinstance(component, Modal):
-            return self.render_modal(component)
-        elif isinstance(component, Navbar):
-            return self.render_navbar(component)
-        elif isinstance(component, Checkbox):
-            return self.render_checkbox(component)
-        elif isinstance(component, RadioButton):
-            return self.render_radiobutton(component)
-        elif isinstance(component, Select):
-            return self.render_select(component)
-        elif isinstance(component, Slider):
-            return self.render_slider(component)
-        elif isinstance(component, DatePicker):
-            return self.render_datepicker(component)
-        elif isinstance(component, Table):
-            return self.render_table(component)
-        elif isinstance(component, Tabs):
-            return self.render_tabs(component)
-        elif isinstance(component, Accordion):
-            return self.render_accordion(component)
-        elif isinstance(component, ProgressBar):
-            return self.render_progressbar(component)
-        elif isinstance(component, Spinner):
-            return self.render_spinner(component)
-        elif isinstance(component, Tooltip):
-            return self.render_tooltip(component)
-        else:
-            # Componente genérico
-            return self.render_generic_component(component)
+    def app_features(self, app: App) -> Set[str]:
+        """
+        Funciones del runtime compartido (tabs, accordion, lazy) que usa alguna página de
+        la App. Recorre el árbol de cada página, de todas las particiones y también las de
+        add_page_source, por los mismos contenedores que renderiza el exportador
+        (resource_hints.nested_components). Las páginas de una PageTemplate comparten árbol
+        y se recorre una vez; un Cached con función se construye una vez por clave.
+        """
+        from dars.exporters.web.resource_hints import iter_components
+        # Si el módulo nunca se importó, no puede haber instancias
+        Tabs = _loaded_class('dars.components.advanced.tabs', 'Tabs')
+        Accordion = _loaded_class('dars.components.advanced.accordion', 'Accordion')
+        features: Set[str] = set()
+        templates = set()
+        cached_fragments: Dict[str, Any] = {}
+        for _slug, page, _is_index in self.iter_page_targets(app):
+            template = getattr(page, 'template', None)
+            if template is not None:
+                if template in templates:
+                    continue
+                templates.add(template)
+            root = self._document_root(app) if page is None else page.root
+            for component in iter_components(root, cached_fragments):
+                if Tabs is not None and isinstance(component, Tabs):
+                    features.add('tabs')
+                elif Accordion is not None and isinstance(component, Accordion):
+                    features.add('accordion')
+                if getattr(component, 'lazy', False) is True:
+                    features.add('lazy')
+        return features
+
+    def generate_unique_id(self, component: Component, context: Optional[RenderContext] = None) -> str:
+        """ID del componente, o uno automático según el orden de render en la página"""
+        if context is None:
+            return super().generate_unique_id(component)
+        return context.allocate_id(component)
+
+    def new_context(self, app=None, subtree_keys: Optional[Dict[int, str]] = None) -> RenderContext:
+        """Contexto para renderizar una página. plan_cache solo se usa si subtree_keys trae
+        los fingerprints del árbol: hashear el árbol cuesta más que renderizarlo, así que solo
+        compensa a quien ya lo hizo (IncrementalBuilder calcula el de cada página de todos modos)"""
+        return RenderContext(app, subtree_keys if self.plan_cache is not None else None)
+
+    def render_tree(self, root: Component, context: Optional[RenderContext] = None) -> str:
+        """Renderiza el árbol de una página; los IDs automáticos empiezan en 0"""
+        if context is None:
+            context = self.new_context()
+        if context.subtree_keys is not None and id(root) not in context.subtree_keys:
+            context.subtree_keys = None
+        return self.render_component(root, context)
+
+    def render_component(self, component: Component, context: Optional[RenderContext] = None) -> str:
+        """Renderiza un componente a HTML (con plan_cache, ejecutando el plan de su subárbol)"""
+        if context is None:
+            context = self.new_context()
+        keys = context.subtree_keys
+        if keys is not None and component.children:
+            key = keys.get(id(component))
+            if key is not None:
+                plan = self.plan_cache.get(key)
+                if plan is None:
+                    plan = compile_plan(self, component, context)
+                    self.plan_cache.put(key, plan)
+                return run_plan(plan, context)
+        context.components.add(component.__class__.__name__)
+        return getattr(self, _resolve_render_method(type(component)))(component, context)
+
+    def iter_render_tree(self, root: Component, context: Optional[RenderContext] = None) -> Iterator[str]:
+        """Como render_tree, pero en fragmentos: la apertura de cada contenedor, sus hijos
+        uno a uno y su cierre. Los subárboles con plan en plan_cache salen de una vez"""
+        if context is None:
+            context = self.new_context()
+        if context.subtree_keys is not None and id(root) not in context.subtree_keys:
+            context.subtree_keys = None
+        return self._iter_component(root, context)
+
+    def _iter_component(self, component, context: RenderContext) -> Iterator[str]:
+        method = _resolve_render_method(type(component))
+        keys = context.subtree_keys
+        if (method not in _STREAMED_CHILDREN or not getattr(component, 'children', None)
+                or (keys is not None and id(component) in keys)):
+            yield self.render_component(component, context)
+            return
+        # Apertura y cierre: el mismo componente con un único hijo marcador (asigna su ID
+        # antes que los hijos, igual que el render normal)
+        first_id = context.next_id
+        shell = copy.copy(component)
+        shell.children = [_CHILDREN_SLOT]
+        opening, marker, closing = getattr(self, method)(shell, context).partition(_CHILDREN_MARKER)
+        context.components.discard(_ChildrenSlot.__name__)
+        if not marker or _CHILDREN_MARKER in closing:
+            context.next_id = first_id
+            yield self.render_component(component, context)
+            return
+        context.components.add(component.__class__.__name__)
+        yield opening
+        for child in self._streamed_children(component, method):
+            yield from self._iter_component(child, context)
+        yield closing
+
+    @staticmethod
+    def _streamed_children(component, method: str):
+        """Los hijos que renderizaría `method`, con sus mismos filtros"""
+        children = component.children
+        if method == 'render_generic_component':
+            return children
+        if not isinstance(children, list):
+            return []
+        if method == 'render_page':
+            return [child for child in children if hasattr(child, 'render')]
+        flat_children = []
+        for child in children:
+            if isinstance(child, list):
+                flat_children.extend([c for c in child if hasattr(c, 'render')])
+            elif hasattr(child, 'render'):
+                flat_children.append(child)
+        return flat_children
+
+    def _render_children_slot(self, slot, context: RenderContext) -> str:
+        return _CHILDREN_MARKER
+
+    def render_component_direct(self, component: Component, context: RenderContext) -> str:
+        """Renderiza un componente recorriendo su árbol, sin consultar plan_cache en él mismo"""
+        context.components.add(component.__class__.__name__)
+        return getattr(self, _resolve_render_method(type(component)))(component, context)
 
-    def render_grid(self, grid):
+    def render_grid(self, grid, context: RenderContext):
         """Renderiza un GridLayout como un div con CSS grid."""
-        component_id = self.generate_unique_id(grid)
+        component_id = self.generate_unique_id(grid, context)
         class_attr = f'class="dars-grid {grid.class_name or ""}"'
         style = f'display: grid; grid-template-rows: repeat({grid.rows}, 1fr); grid-template-columns: repeat({grid.cols}, 1fr); gap: {getattr(grid, "gap", "16px")};'
         # Render anchors/positions
@@ -1050,12 +1581,12 @@ function initializeEvents() {
                         elif anchor.y == 'bottom': anchor_style += 'align-self: end;'
                         elif '%' in anchor.y or 'px' in anchor.y: anchor_style += f'top: {anchor.y}; position: relative;'
             grid_item_style = f'grid-row: {row} / span {row_span}; grid-column: {col} / span {col_span}; {anchor_style}'
-            children_html += f'<div style="{grid_item_style}">{self.render_component(child)}</div>'
+            children_html += f'<div style="{grid_item_style}">{self.render_component(child, context)}</div>'
         return f'<div id="{component_id}" {class_attr} style="{style}">{children_html}</div>'
 
-    def render_flex(self, flex):
+    def render_flex(self, flex, context: RenderContext):
         """Renderiza un FlexLayout como un div con CSS flexbox."""
-        component_id = self.generate_unique_id(flex)
+        component_id = self.generate_unique_id(flex, context)
         class_attr = f'class="dars-flex {flex.class_name or ""}"'
         style = f'display: flex; flex-direction: {getattr(flex, "direction", "row")}; flex-wrap: {getattr(flex, "wrap", "wrap")}; justify-content: {getattr(flex, "justify", "flex-start")}; align-items: {getattr(flex, "align", "stretch")}; gap: {getattr(flex, "gap", "16px")};'
         children_html = ""
@@ -1087,12 +1618,12 @@ function initializeEvents() {
                         elif anchor.y == 'center': anchor_style += 'align-self: center;'
                         elif anchor.y == 'bottom': anchor_style += 'align-self: flex-end;'
                         elif '%' in anchor.y or 'px' in anchor.y: anchor_style += f'top: {anchor.y}; position: relative;'
-            children_html += f'<div style="{anchor_style}">{self.render_component(child)}</div>'
+            children_html += f'<div style="{anchor_style}">{self.render_component(child, context)}</div>'
         return f'<div id="{component_id}" {class_attr} style="{style}">{children_html}</div>'
 
-    def render_page(self, page):
+    def render_page(self, page, context: RenderContext):
         """Renderiza un componente Page como root de una página multipage"""
-        component_id = self.generate_unique_id(page)
+        component_id = self.generate_unique_id(page, context)
         class_attr = f'class="dars-page {page.class_name or ""}"'
         style_attr = f'style="{self.render_styles(page.style)}"' if page.style else ""
         # Renderizar hijos
@@ -1102,22 +1633,22 @@ function initializeEvents() {
             children = []
         for child in children:
             if hasattr(child, 'render'):
-                children_html += self.render_component(child)
+                children_html += self.render_component(child, context)
         return f'<div id="{component_id}" {class_attr} {style_attr}>{children_html}</div>'
 
 
             
-    def render_text(self, text: Text) -> str:
+    def render_text(self, text: Text, context: RenderContext) -> str:
         """Renderiza un componente Text"""
-        component_id = self.generate_unique_id(text)
+        component_id = self.generate_unique_id(text, context)
         class_attr = f'class="dars-text {text.class_name or ""}"'
         style_attr = f'style="{self.render_styles(text.style)}"' if text.style else ""
         
         return f'<span id="{component_id}" {class_attr} {style_attr}>{text.text}</span>'
         
-    def render_button(self, button: Button) -> str:
+    def render_button(self, button: Button, context: RenderContext) -> str:
         """Renderiza un componente Button"""
-        component_id = self.generate_unique_id(button)
+        component_id = self.generate_unique_id(button, context)
         class_attr = f'class="dars-button {button.class_name or ""}"'
         style_attr = f'style="{self.render_styles(button.style)}"' if button.style else ""
         disabled_attr = "disabled" if button.disabled else ""
@@ -1125,9 +1656,9 @@ function initializeEvents() {
         
         return f'<button id="{component_id}" {class_attr} {style_attr} {type_attr} {disabled_attr}>{button.text}</button>'
         
-    def render_input(self, input_comp: Input) -> str:
+    def render_input(self, input_comp: Input, context: RenderContext) -> str:
         """Renderiza un componente Input"""
-        component_id = self.generate_unique_id(input_comp)
+        component_id = self.generate_unique_id(input_comp, context)
         class_attr = f'class="dars-input {input_comp.class_name or ""}"'
         style_attr = f'style="{self.render_styles(input_comp.style)}"' if input_comp.style else ""
         type_attr = f'type="{input_comp.input_type}"'
@@ -1143,9 +1674,9 @@ function initializeEvents() {
         
         return f'<input id="{component_id}" {attrs_str} />'
         
-    def render_container(self, container: Container) -> str:
+    def render_container(self, container: Container, context: RenderContext) -> str:
         """Renderiza un componente Container"""
-        component_id = self.generate_unique_id(container)
+        component_id = self.generate_unique_id(container, context)
         class_attr = f'class="dars-container {container.class_name or ""}"'
         style_attr = f'style="{self.render_styles(container.style)}"' if container.style else ""
 
@@ -1162,13 +1693,15 @@ function initializeEvents() {
             elif hasattr(child, 'render'):
                 flat_children.append(child)
         for child in flat_children:
-            children_html += self.render_component(child)
+            children_html += self.render_component(child, context)
 
         return f'<div id="{component_id}" {class_attr} {style_attr}>{children_html}</div>'
         
-    def render_image(self, image: Image) -> str:
+    def render_image(self, image: Image, context: RenderContext) -> str:
         """Renderiza un componente Image"""
-        component_id = self.generate_unique_id(image)
+        component_id = self.generate_unique_id(image, context)
+        if image.src:
+            context.assets.add(image.src)
         class_attr = f'class="dars-image {image.class_name or ""}"'
         style_attr = f'style="{self.render_styles(image.style)}"' if image.style else ""
         width_attr = f'width="{image.width}"' if image.width else ""
@@ -1176,18 +1709,18 @@ function initializeEvents() {
 
         return f'<img id="{component_id}" src="{image.src}" alt="{image.alt}" {width_attr} {height_attr} {class_attr} {style_attr} />'
 
-    def render_link(self, link: Link) -> str:
+    def render_link(self, link: Link, context: RenderContext) -> str:
         """Renderiza un componente Link"""
-        component_id = self.generate_unique_id(link)
+        component_id = self.generate_unique_id(link, context)
         class_attr = f'class="dars-link {link.class_name or ""}"'
         style_attr = f'style="{self.render_styles(link.style)}"' if link.style else ""
         target_attr = f'target="{link.target}"'
 
         return f'<a id="{component_id}" href="{link.href}" {target_attr} {class_attr} {style_attr}>{link.text}</a>'
 
-    def render_textarea(self, textarea: Textarea) -> str:
+    def render_textarea(self, textarea: Textarea, context: RenderContext) -> str:
         """Renderiza un componente Textarea"""
-        component_id = self.generate_unique_id(textarea)
+        component_id = self.generate_unique_id(textarea, context)
         class_attr = f'class="dars-textarea {textarea.class_name or ""}"'
         style_attr = f'style="{self.render_styles(textarea.style)}"' if textarea.style else ""
         rows_attr = f'rows="{textarea.rows}"'
@@ -1204,48 +1737,50 @@ function initializeEvents() {
 
         return f'<textarea id="{component_id}" {attrs_str}>{textarea.value}</textarea>'
 
-    def render_card(self, card: Card) -> str:
+    def render_card(self, card: Card, context: RenderContext) -> str:
         """Renderiza un componente Card"""
-        component_id = self.generate_unique_id(card)
+        component_id = self.generate_unique_id(card, context)
         class_attr = f'class="dars-card {card.class_name or ""}"'
         style_attr = f'style="{self.render_styles(card.style)}"' if card.style else ""
         title_html = f'<h2>{card.title}</h2>' if card.title else ""
         children_html = ""
         for child in card.children:
-            children_html += self.render_component(child)
+            children_html += self.render_component(child, context)
 
         return f'<div id="{component_id}" {class_attr} {style_attr}>{title_html}{children_html}</div>'
 
-    def render_modal(self, modal: Modal) -> str:
+    def render_modal(self, modal: Modal, context: RenderContext) -> str:
         """Renderiza un componente Modal"""
-        component_id = self.generate_unique_id(modal)
+        component_id = self.generate_unique_id(modal, context)
         class_attr = f'class="dars-modal {modal.class_name or ""}"'
         style_attr = f'style="{self.render_styles(modal.style)}"' if modal.style else ""
         title_html = f'<h2>{modal.title}</h2>' if modal.title else ""
         children_html = ""
         for child in modal.children:
-            children_html += self.render_component(child)
+            children_html += self.render_component(child, context)
+        if getattr(modal, 'lazy', False) and not modal.is_open:
+            title_html, children_html = "", self._lazy(title_html + children_html, context)
 
         display_style = "display: flex;" if modal.is_open else "display: none;"
         modal_overlay_style = f'style="{display_style} position: fixed; top: 0; left: 0; width: 100%; height: 100%; background-color: rgba(0,0,0,0.5); justify-content: center; align-items: center; z-index: 1000; {style_attr}"'
 
-        return f'<div id="{component_id}" {class_attr} {modal_overlay_style}>\n    <div class="dars-modal-content" style="background: white; padding: 20px; border-radius: 8px; max-width: 500px; width: 90%;">\n        {title_html}\n        {children_html}\n    </div>\n</div>'
+        return f'<div id="{component_id}" {class_attr} {modal_overlay_style}{self._island("modal", context)}>\n    <div class="dars-modal-content" style="background: white; padding: 20px; border-radius: 8px; max-width: 500px; width: 90%;">\n        {title_html}\n        {children_html}\n    </div>\n</div>'
 
-    def render_navbar(self, navbar: Navbar) -> str:
+    def render_navbar(self, navbar: Navbar, context: RenderContext) -> str:
         """Renderiza un componente Navbar"""
-        component_id = self.generate_unique_id(navbar)
+        component_id = self.generate_unique_id(navbar, context)
         class_attr = f'class="dars-navbar {navbar.class_name or ""}"'
         style_attr = f'style="{self.render_styles(navbar.style)}"' if navbar.style else ""
         brand_html = f'<div class="dars-navbar-brand">{navbar.brand}</div>' if navbar.brand else ""
         children_html = ""
         for child in navbar.children:
-            children_html += self.render_component(child)
+            children_html += self.render_component(child, context)
 
         return f'<nav id="{component_id}" {class_attr} {style_attr}>{brand_html}<div class="dars-navbar-nav">{children_html}</div></nav>'
 
-    def render_checkbox(self, checkbox: Checkbox) -> str:
+    def render_checkbox(self, checkbox: Checkbox, context: RenderContext) -> str:
         """Renderiza un componente Checkbox"""
-        component_id = self.generate_unique_id(checkbox)
+        component_id = self.generate_unique_id(checkbox, context)
         class_attr = f'class="dars-checkbox {checkbox.class_name or ""}"'
         style_attr = f'style="{self.render_styles(checkbox.style)}"' if checkbox.style else ""
         checked_attr = "checked" if checkbox.checked else ""
@@ -1261,9 +1796,9 @@ function initializeEvents() {
         
         return f'<div class="dars-checkbox-wrapper"><input type="checkbox" id="{component_id}" {attrs_str}>{label_html}</div>'
 
-    def render_radiobutton(self, radio: RadioButton) -> str:
+    def render_radiobutton(self, radio: RadioButton, context: RenderContext) -> str:
         """Renderiza un componente RadioButton"""
-        component_id = self.generate_unique_id(radio)
+        component_id = self.generate_unique_id(radio, context)
         class_attr = f'class="dars-radio {radio.class_name or ""}"'
         style_attr = f'style="{self.render_styles(radio.style)}"' if radio.style else ""
         checked_attr = "checked" if radio.checked else ""
@@ -1279,9 +1814,9 @@ function initializeEvents() {
         
         return f'<div class="dars-radio-wrapper"><input type="radio" id="{component_id}" {attrs_str}>{label_html}</div>'
 
-    def render_select(self, select: Select) -> str:
+    def render_select(self, select: Select, context: RenderContext) -> str:
         """Renderiza un componente Select"""
-        component_id = self.generate_unique_id(select)
+        component_id = self.generate_unique_id(select, context)
         class_attr = f'class="dars-select {select.class_name or ""}"'
         style_attr = f'style="{self.render_styles(select.style)}"' if select.style else ""
         disabled_attr = "disabled" if select.disabled else ""
@@ -1305,9 +1840,9 @@ function initializeEvents() {
         
         return f'<select id="{component_id}" {attrs_str}>{options_html}</select>'
 
-    def render_slider(self, slider: Slider) -> str:
+    def render_slider(self, slider: Slider, context: RenderContext) -> str:
         """Renderiza un componente Slider"""
-        component_id = self.generate_unique_id(slider)
+        component_id = self.generate_unique_id(slider, context)
         class_attr = f'class="dars-slider {slider.class_name or ""}"'
         style_attr = f'style="{self.render_styles(slider.style)}"' if slider.style else ""
         disabled_attr = "disabled" if slider.disabled else ""
@@ -1324,11 +1859,13 @@ function initializeEvents() {
         
         wrapper_class = "dars-slider-vertical" if slider.orientation == "vertical" else "dars-slider-horizontal"
         
-        return f'<div class="dars-slider-wrapper {wrapper_class}">{label_html}<input type="range" id="{component_id}" {attrs_str}>{value_display}</div>'
+        # Solo hay algo que hidratar si se muestra el valor
+        island_attr = self._island("slider", context) if slider.show_value else ""
+        return f'<div class="dars-slider-wrapper {wrapper_class}"{island_attr}>{label_html}<input type="range" id="{component_id}" {attrs_str}>{value_display}</div>'
 
-    def render_datepicker(self, datepicker: DatePicker) -> str:
+    def render_datepicker(self, datepicker: DatePicker, context: RenderContext) -> str:
         """Renderiza un componente DatePicker"""
-        component_id = self.generate_unique_id(datepicker)
+        component_id = self.generate_unique_id(datepicker, context)
         class_attr = f'class="dars-datepicker {datepicker.class_name or ""}"'
         style_attr = f'style="{self.render_styles(datepicker.style)}"' if datepicker.style else ""
         disabled_attr = "disabled" if datepicker.disabled else ""
@@ -1352,7 +1889,7 @@ function initializeEvents() {
         else:
             return f'<input type="{input_type}" id="{component_id}" {attrs_str}>'
 
-    def render_table(self, table: Table) -> str:
+    def render_table(self, table: Table, context: RenderContext) -> str:
         # Renderizado HTML para Table
         thead = '<thead><tr>' + ''.join(f'<th>{col["title"]}</th>' for col in table.columns) + '</tr></thead>'
         rows = table.data[:table.page_size] if table.page_size else table.data
@@ -1361,45 +1898,74 @@ function initializeEvents() {
             for row in rows) + '</tbody>'
         return f'<table class="dars-table">{thead}{tbody}</table>'
 
-    def render_tabs(self, tabs: Tabs) -> str:
+    def render_tabs(self, tabs: Tabs, context: RenderContext) -> str:
+        context.features.add('tabs')
         tab_headers = ''.join(
             f'<button class="dars-tab{ " dars-tab-active" if i == tabs.selected else "" }" data-tab="{i}">{title}</button>'
             for i, title in enumerate(tabs.tabs)
         )
-        panels_html = ''.join(
-            f'<div class="dars-tab-panel{ " dars-tab-panel-active" if i == tabs.selected else "" }">{self.render_component(panel) if hasattr(panel, "render") else panel}</div>'
-            for i, panel in enumerate(tabs.panels)
-        )
-        return f'<div class="dars-tabs"><div class="dars-tabs-header">{tab_headers}</div><div class="dars-tabs-panels">{panels_html}</div></div>'
-
-    def render_accordion(self, accordion: Accordion) -> str:
-        html = '<div class="dars-accordion">'
+        lazy = getattr(tabs, 'lazy', False)
+        panels_html = ''
+        for i, panel in enumerate(tabs.panels):
+            panel_html = self.render_component(panel, context) if hasattr(panel, "render") else panel
+            if lazy and i != tabs.selected:
+                panel_html = self._lazy(panel_html, context)
+            panels_html += f'<div class="dars-tab-panel{ " dars-tab-panel-active" if i == tabs.selected else "" }">{panel_html}</div>'
+
+        return f'<div class="dars-tabs"{self._island("tabs", context)}><div class="dars-tabs-header">{tab_headers}</div><div class="dars-tabs-panels">{panels_html}</div></div>'
+
+    def render_accordion(self, accordion: Accordion, context: RenderContext) -> str:
+        context.features.add('accordion')
+        html = f'<div class="dars-accordion"{self._island("accordion", context)}>'
         for i, (title, content) in enumerate(accordion.sections):
             opened = ' dars-accordion-open' if i in accordion.open_indices else ''
-            html += f'<div class="dars-accordion-section{opened}"><div class="dars-accordion-title">{title}</div><div class="dars-accordion-content">{self.render_component(content) if hasattr(content, "render") else content}</div></div>'
+            content_html = self.render_component(content, context) if hasattr(content, "render") else content
+            if getattr(accordion, 'lazy', False) and not opened:
+                content_html = self._lazy(content_html, context)
+            html += f'<div class="dars-accordion-section{opened}"><div class="dars-accordion-title">{title}</div><div class="dars-accordion-content">{content_html}</div></div>'
         html += '</div>'
         return html
 
-    def render_progressbar(self, bar: ProgressBar) -> str:
+    def render_progressbar(self, bar: ProgressBar, context: RenderContext) -> str:
         percent = min(max(bar.value / bar.max_value * 100, 0), 100)
         return f'<div class="dars-progressbar"><div class="dars-progressbar-bar" style="width: {percent}%;"></div></div>'
 
-    def render_spinner(self, spinner: Spinner) -> str:
+    def render_spinner(self, spinner: Spinner, context: RenderContext) -> str:
         return '<div class="dars-spinner"></div>'
 
-    def render_tooltip(self, tooltip: Tooltip) -> str:
-        return f'<div class="dars-tooltip dars-tooltip-{tooltip.position}">{self.render_component(tooltip.child) if hasattr(tooltip.child, "render") else tooltip.child}<span class="dars-tooltip-text">{tooltip.text}</span></div>'
-
-    def render_generic_component(self, component: Component) -> str:
+    def render_cached(self, cached, context: RenderContext) -> str:
+        """Renderiza un Cached desde la caché de fragmentos (o lo compila y lo guarda)"""
+        store = cached.fragment_store
+        if store is None:
+            store = self.fragment_store if self.fragment_store is not None else default_fragment_store()
+        key = cached.cache_key()
+        plan = store.get(key)
+        if plan is None:
+            plan = compile_plan(self, cached.resolve(), context)
+            store.put(key, plan, cached.ttl)
+        return run_plan(plan, context)
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Contadores de las cachés de render que usa este exportador"""
+        store = self.fragment_store if self.fragment_store is not None else default_fragment_store()
+        stats = {'fragments': store.stats()}
+        if self.plan_cache is not None:
+            stats['plans'] = self.plan_cache.stats()
+        return stats
+
+    def render_tooltip(self, tooltip: Tooltip, context: RenderContext) -> str:
+        return f'<div class="dars-tooltip dars-tooltip-{tooltip.position}">{self.render_component(tooltip.child, context) if hasattr(tooltip.child, "render") else tooltip.child}<span class="dars-tooltip-text">{tooltip.text}</span></div>'
+
+    def render_generic_component(self, component: Component, context: RenderContext) -> str:
         """Renderiza un componente genérico"""
-        component_id = self.generate_unique_id(component)
+        component_id = self.generate_unique_id(component, context)
         class_attr = f'class="{component.class_name or ""}"'
         style_attr = f'style="{self.render_styles(component.style)}"' if component.style else ""
         
         # Renderizar hijos
         children_html = ""
         for child in component.children:
-            children_html += self.render_component(child)
+            children_html += self.render_component(child, context)
             
         return f'<div id="{component_id}" {class_attr} {style_attr}>{children_html}</div>'
 
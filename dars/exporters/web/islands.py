@@ -0,0 +1,132 @@
+"""
+Islas: JavaScript solo para los componentes interactivos (opcional:
+HTMLCSSJSExporter(islands=True)).
+
+Sin islas, cada página carga runtime_dars.js y su script_*.js aunque sea texto estático.
+Con islas:
+
+  - cada componente que necesita el runtime se marca al renderizarse con
+    `data-dars-island="<tipo>"` (Tabs, Accordion, Modal y Slider con show_value);
+  - la página lleva al final un cargador pequeño en línea que hidrata cada isla por
+    separado: cuando entra en pantalla (IntersectionObserver) o, si no se ve (un Modal
+    cerrado), en tiempo ocioso; y antes, si el usuario la toca o le da el foco;
+  - el runtime (runtime_dars.js) se pide la primera vez que se hidrata una isla y solo
+    define las funciones de hidratación (window.darsIslands), sin recorrer el documento;
+  - el script de la página solo se enlaza si tiene código (Page.add_script, App.scripts).
+
+Una página sin islas ni scripts no lleva ningún <script>.
+"""
+
+from typing import Dict, Tuple
+
+ISLAND_ATTRIBUTE = 'data-dars-island'
+
+# Tipo de isla -> (parámetro, cuerpo de la función que la hidrata)
+HYDRATORS: Dict[str, Tuple[str, str]] = {
+    'tabs': ('tabsEl', """        const tabButtons = tabsEl.querySelectorAll('.dars-tab');
+        const panels = tabsEl.querySelectorAll('.dars-tab-panel');
+        tabButtons.forEach(function(btn, i) {
+            btn.addEventListener('click', function() {
+                tabButtons.forEach(b => b.classList.remove('dars-tab-active'));
+                panels.forEach(p => p.classList.remove('dars-tab-panel-active'));
+                btn.classList.add('dars-tab-active');
+                if (panels[i]) panels[i].classList.add('dars-tab-panel-active');
+            });
+        });
+"""),
+    'accordion': ('accEl', """        accEl.querySelectorAll('.dars-accordion-title').forEach(function(titleEl) {
+            titleEl.addEventListener('click', function() {
+                const section = titleEl.parentElement;
+                const isOpen = section.classList.contains('dars-accordion-open');
+                if (isOpen) {
+                    section.classList.remove('dars-accordion-open');
+                } else {
+                    // Si es acordeón exclusivo, cerrar otros
+                    accEl.querySelectorAll('.dars-accordion-section').forEach(function(sec) {
+                        sec.classList.remove('dars-accordion-open');
+                    });
+                    section.classList.add('dars-accordion-open');
+                }
+            });
+        });
+"""),
+    'modal': ('modalEl', """        // Se cierra con Escape o con un clic fuera del contenido
+        function close() { modalEl.style.display = 'none'; }
+        modalEl.addEventListener('click', function(event) { if (event.target === modalEl) close(); });
+        document.addEventListener('keydown', function(event) { if (event.key === 'Escape') close(); });
+        // Contenido diferido (lazy=True, ver lazy_content.py)
+        if (typeof darsWatchLazyModal === 'function') darsWatchLazyModal(modalEl);
+"""),
+    'slider': ('sliderEl', """        const input = sliderEl.querySelector('input[type="range"]');
+        const output = sliderEl.querySelector('.dars-slider-value');
+        if (input && output) input.addEventListener('input', function() { output.textContent = input.value; });
+"""),
+}
+
+# Islas que normalmente no se ven al cargar: se hidratan en tiempo ocioso, no al verse
+IDLE_KINDS = ('modal',)
+
+LOADER_JS = r"""
+(function() {
+    var runtime = null;
+    var idleKinds = __IDLE_KINDS__;
+    var idle = window.requestIdleCallback || function(callback) { return setTimeout(callback, 200); };
+    function loadRuntime() {
+        if (!runtime) runtime = new Promise(function(resolve, reject) {
+            var script = document.createElement('script');
+            script.src = '__RUNTIME__';
+            script.onload = resolve;
+            script.onerror = reject;
+            document.head.appendChild(script);
+        });
+        return runtime;
+    }
+    function hydrate(el) {
+        if (el.hasAttribute('data-dars-hydrated')) return;
+        el.setAttribute('data-dars-hydrated', '');
+        loadRuntime().then(function() {
+            var hydrator = window.darsIslands && window.darsIslands[el.getAttribute('data-dars-island')];
+            if (hydrator) hydrator(el);
+        }, function() { runtime = null; el.removeAttribute('data-dars-hydrated'); });
+    }
+    var observer = 'IntersectionObserver' in window && new IntersectionObserver(function(entries) {
+        entries.forEach(function(entry) {
+            if (!entry.isIntersecting) return;
+            observer.unobserve(entry.target);
+            hydrate(entry.target);
+        });
+    });
+    document.querySelectorAll('[data-dars-island]').forEach(function(el) {
+        if (observer && idleKinds.indexOf(el.getAttribute('data-dars-island')) < 0) observer.observe(el);
+        else idle(function() { hydrate(el); });
+    });
+    // Si el usuario llega antes a una isla, se hidrata en ese momento
+    ['pointerover', 'focusin', 'touchstart'].forEach(function(type) {
+        document.addEventListener(type, function(event) {
+            var el = event.target.closest && event.target.closest('[data-dars-island]');
+            if (el) hydrate(el);
+        }, {passive: true});
+    });
+})();
+""".replace('__IDLE_KINDS__', '[' + ', '.join(f"'{kind}'" for kind in IDLE_KINDS) + ']')
+
+
+def island_attr(kind: str) -> str:
+    """Atributo que marca la raíz de una isla (con un espacio delante)"""
+    return f' {ISLAND_ATTRIBUTE}="{kind}"'
+
+
+def render_loader(runtime_file: str) -> str:
+    """<script> en línea que hidrata las islas de la página, pidiendo `runtime_file`"""
+    # Va en cada página: sin la sangría
+    js = '\n'.join(line.strip() for line in LOADER_JS.strip().splitlines())
+    return '<script>\n' + js.replace('__RUNTIME__', runtime_file) + '\n</script>'
+
+
+def island_runtime() -> str:
+    """runtime_dars.js en modo islas: solo las funciones de hidratación"""
+    js = ("// Dars Runtime (islas): el cargador de cada página hidrata sus islas una a una\n"
+          "var darsIslands = window.darsIslands = window.darsIslands || {};\n\n")
+    for kind, (parameter, body) in HYDRATORS.items():
+        js += f"darsIslands.{kind} = function({parameter}) {{\n{body}}};\n\n"
+    return js
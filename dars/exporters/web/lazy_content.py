@@ -0,0 +1,56 @@
+"""
+Contenido diferido de Tabs, Accordion y Modal con lazy=True.
+
+Sin lazy, todos los paneles de unas pestañas, las secciones cerradas de un acordeón y el
+contenido de un modal cerrado van en el DOM inicial, aunque no se vean. Con lazy=True lo
+que no se ve al cargar se renderiza dentro de un <template class="dars-lazy">: el
+navegador lo parsea como fragmento inerte (sin estilos, layout ni imágenes) y el runtime
+lo instancia la primera vez que se abre:
+
+  - pestañas y acordeón: al hacer clic en la pestaña o el título, en la fase de captura,
+    antes de que el manejador de tabs/accordion muestre el panel;
+  - modal: cuando deja de tener display: none (un MutationObserver sobre style, class y
+    hidden), así sirve cualquier código que lo abra.
+
+Los IDs automáticos no cambian: el contenido se renderiza igual, solo va envuelto. Hasta
+que se instancia, document.getElementById() no encuentra nada dentro del <template>.
+"""
+
+LAZY_CLASS = 'dars-lazy'
+
+LAZY_JS = r"""
+// Contenido diferido (lazy=True): cada <template class="dars-lazy"> se instancia al abrirse
+function darsRenderLazy(container) {
+    var template = container && container.querySelector(':scope > template.dars-lazy');
+    if (template) template.replaceWith(template.content);
+}
+
+document.addEventListener('click', function(event) {
+    var trigger = event.target.closest && event.target.closest('.dars-tab, .dars-accordion-title');
+    if (!trigger) return;
+    if (trigger.classList.contains('dars-tab')) {
+        var panels = trigger.parentElement.nextElementSibling;
+        darsRenderLazy(panels && panels.children[trigger.getAttribute('data-tab')]);
+    } else {
+        darsRenderLazy(trigger.parentElement.querySelector(':scope > .dars-accordion-content'));
+    }
+}, true);
+
+function darsWatchLazyModal(modalEl) {
+    var content = modalEl.querySelector(':scope > .dars-modal-content');
+    if (!content || !content.querySelector(':scope > template.dars-lazy')) return;
+    var observer = new MutationObserver(check);
+    function check() {
+        if (getComputedStyle(modalEl).display === 'none') return false;
+        observer.disconnect();
+        darsRenderLazy(content);
+        return true;
+    }
+    if (!check()) observer.observe(modalEl, {attributes: true, attributeFilter: ['style', 'class', 'hidden']});
+}
+"""
+
+
+def lazy_template(html: str) -> str:
+    """`html` como contenido diferido"""
+    return f'<template class="{LAZY_CLASS}">{html}</template>'
@@ -0,0 +1,116 @@
+"""
+Plantillas de página: compilar una vez, renderizar muchas.
+
+Para miles de páginas casi iguales (productos, perfiles, artículos) no hace falta
+construir y renderizar un árbol nuevo por registro. Se construye el árbol una vez con
+campos en lugar del texto variable:
+
+    from dars.exporters.web.page_template import PageTemplate, field
+
+    template = PageTemplate(
+        Container(children=[Text(field('name')), Link(text="Buy", href=field('url'))]),
+        title=field('name'),
+    )
+    plan = template.compile()
+    html = plan.render({'name': 'Widget', 'url': '/widget'})
+
+compile() renderiza el árbol con el exportador HTML normal; cada campo sale en el HTML
+como un centinela, y el documento se parte en un RenderPlan (render_plan.py) de segmentos
+estáticos con huecos. render() solo une los segmentos con los valores escapados
+(html.escape). field('x', raw=True) inserta el valor sin escapar (HTML de confianza).
+
+Para exportar, PageTemplate.pages() produce una fuente para App.add_page_source():
+
+    app.add_page_source(template.pages(products, name='slug'), count=len(products))
+
+Un campo solo puede usarse donde el componente copia el texto tal cual (texto,
+atributos, estilos); si un componente lo transforma, compile() lanza ValueError.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from dars.core.app import App, Page
+from dars.exporters.web.render_plan import Field, RenderPlan, field  # noqa: F401 (API pública)
+
+# Hueco interno para el nombre del script de cada página (script.js / script_<slug>.js)
+SCRIPT_FILE_FIELD = '__script_file__'
+
+
+class PageTemplate:
+    """Árbol de componentes con campos, compilado a un RenderPlan por documento"""
+
+    def __init__(self, root, title: Optional[str] = None, meta: Optional[dict] = None):
+        self.root = root
+        self.title = title
+        self.meta = meta or {}
+
+    def compile(self, exporter=None, app: Optional[App] = None, css_file: str = "styles.css",
+                script_file: Optional[str] = "script.js", prettify: bool = True,
+                runtime_file: str = "runtime_dars.js", critical_css: Optional[str] = None) -> RenderPlan:
+        """Renderiza el documento completo una vez y lo parte en segmentos y huecos.
+        critical_css: como en generate_html (CSS en línea y hoja de estilos sin bloquear)"""
+        if exporter is None:
+            from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+            exporter = HTMLCSSJSExporter()
+        page_app = exporter._page_app(app if app is not None else App(), self.as_page(None))
+        html_content = exporter.generate_html(page_app, css_file=css_file, script_file=script_file,
+                                              runtime_file=runtime_file, critical_css=critical_css)
+        if prettify:
+            html_content = exporter.prettify_html(html_content)
+        return RenderPlan.from_html(html_content)
+
+    def as_page(self, name: Optional[str], record: Optional[Mapping[str, Any]] = None) -> 'TemplatePage':
+        return TemplatePage(name, self, record or {})
+
+    def render(self, record: Mapping[str, Any]) -> str:
+        """Atajo: compila (una sola vez) con un App vacío y renderiza un registro"""
+        plan = getattr(self, '_default_plan', None)
+        if plan is None:
+            plan = self._default_plan = self.compile()
+        return plan.render(record)
+
+    def pages(self, records: Union[Iterable[Mapping[str, Any]], Callable[[], Iterable[Mapping[str, Any]]]],
+              name: Union[str, Callable[[Mapping[str, Any]], str]]):
+        """
+        Fuente para App.add_page_source(): una TemplatePage por registro. `name` es la clave
+        del registro con el slug o una función registro -> slug. Si `records` es una factory,
+        la fuente se puede consumir más de una vez.
+        """
+        slug_of = name if callable(name) else (lambda record: record[name])
+
+        def source():
+            items = records() if callable(records) else records
+            for record in items:
+                yield self.as_page(slug_of(record), record)
+
+        return source if callable(records) or not hasattr(records, '__next__') else source()
+
+
+class TemplatePage(Page):
+    """Página de una PageTemplate: comparte el árbol de la plantilla y lleva su registro"""
+
+    def __init__(self, name: Optional[str], template: PageTemplate, record: Mapping[str, Any]):
+        super().__init__(name, template.root, title=template.title, meta=template.meta)
+        self.template = template
+        self.record = record
+
+
+class TemplatePlanCache:
+    """Resultado compilado por plantilla (ver HTMLCSSJSExporter); se vacía al cambiar de App.
+    Se puede usar desde varios hilos: cada plantilla se compila una sola vez"""
+
+    def __init__(self):
+        self._app = None
+        self._entries: Dict[int, Tuple[PageTemplate, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, app: App, template: PageTemplate, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            if app is not self._app:
+                self._app = app
+                self._entries = {}
+            entry = self._entries.get(id(template))
+            if entry is None or entry[0] is not template:
+                entry = self._entries[id(template)] = (template, build())
+            return entry[1]
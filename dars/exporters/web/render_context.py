@@ -0,0 +1,100 @@
+"""
+Estado de un render.
+
+HTMLCSSJSExporter no guarda nada mientras renderiza: todo lo que cambia durante el
+render de una página va en un RenderContext que se crea para esa página y se pasa a
+cada método render_*:
+
+  - el asignador de IDs automáticos (component_0, component_1... desde 0 en cada página);
+  - los fingerprints de subárbol para plan_cache (`subtree_keys`), si el llamador los tiene;
+  - lo que la página necesita: tipos de componente renderizados (qué CSS de componentes
+    usa), funciones del runtime (tabs, accordion) y assets referenciados (imágenes).
+
+Así un mismo exportador puede renderizar varias páginas o apps a la vez desde un pool de
+hilos. Las cachés compartidas (PlanCache, almacenes de fragmentos, planes de plantillas)
+tienen su propio lock.
+
+AppPageView sustituye a la copia de la App por página: muestra la App con el título,
+la raíz y los meta de una página sin copiarla ni modificarla.
+"""
+
+import types
+from typing import Any, Callable, Dict, Optional, Set
+
+from dars.exporters.web.render_plan import RenderNeeds, auto_id, id_slot
+
+
+class RenderContext:
+    """Estado de un render (una página, un plan o un fragmento)"""
+
+    __slots__ = ('app', 'next_id', 'id_format', 'subtree_keys', 'components', 'features', 'assets')
+
+    def __init__(self, app: Any = None, subtree_keys: Optional[Dict[int, str]] = None,
+                 id_format: Callable[[int], str] = auto_id):
+        self.app = app
+        self.next_id = 0
+        self.id_format = id_format
+        self.subtree_keys = subtree_keys
+        self.components: Set[str] = set()
+        self.features: Set[str] = set()
+        self.assets: Set[str] = set()
+
+    def allocate_id(self, component) -> str:
+        """ID del componente, o el siguiente automático en orden de render"""
+        if component.id:
+            return component.id
+        number = self.next_id
+        self.next_id = number + 1
+        return self.id_format(number)
+
+    def for_plan(self) -> 'RenderContext':
+        """Contexto para compilar un plan: IDs como huecos desde 0 y necesidades aparte"""
+        return RenderContext(self.app, self.subtree_keys, id_slot)
+
+    def needs(self) -> RenderNeeds:
+        return RenderNeeds(frozenset(self.components), frozenset(self.features), frozenset(self.assets))
+
+    def add_needs(self, needs: RenderNeeds):
+        self.components.update(needs.components)
+        self.features.update(needs.features)
+        self.assets.update(needs.assets)
+
+
+class AppPageView:
+    """
+    La App vista desde una página: `root`, `title` y cada clave de `meta` de la página
+    tapan el atributo de la App; todo lo demás se lee de la App. Los métodos de App
+    (get_meta_tags...) se ejecutan sobre la vista, así también ven los valores de la página.
+    """
+
+    def __init__(self, app: Any, page: Any):
+        from dars.components.basic.container import Container
+        overrides = {'root': page.root}
+        if page.title:
+            overrides['title'] = page.title
+        overrides.update(page.meta or {})
+        # Aseguramos que root nunca sea lista, igual que single-page
+        if isinstance(overrides['root'], list):
+            overrides['root'] = Container(children=overrides['root'])
+        self.__dict__['_app'] = app
+        self.__dict__['_overrides'] = overrides
+
+    def __getattr__(self, name: str):
+        overrides = self.__dict__['_overrides']
+        if name in overrides:
+            return overrides[name]
+        app = self.__dict__['_app']
+        attribute = getattr(type(app), name, None)
+        if isinstance(attribute, types.FunctionType):
+            return types.MethodType(attribute, self)
+        if isinstance(attribute, property):
+            return attribute.fget(self)
+        return getattr(app, name)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("AppPageView es de solo lectura")
+
+    @property
+    def app(self):
+        """La App original"""
+        return self.__dict__['_app']
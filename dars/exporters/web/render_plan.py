@@ -0,0 +1,190 @@
+"""
+Planes de render precompilados.
+
+Un RenderPlan es el HTML de un subárbol aplanado en segmentos constantes y huecos:
+  - IDs automáticos (component_<n>): el número se resuelve al ejecutar el plan, así un
+    mismo plan sirve en cualquier posición de la página;
+  - campos de PageTemplate (field('name')): se sustituyen por el valor escapado.
+
+Con `exporter.plan_cache = PlanCache()`, HTMLCSSJSExporter compila cada subárbol con
+hijos la primera vez y, mientras su fingerprint no cambie, ejecuta el plan en lugar de
+recorrer el árbol (hot reload con `--watch`, SSR, varias exportaciones en el mismo proceso).
+"""
+
+import html
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+# Caracteres de uso privado: no aparecen en texto normal y BeautifulSoup los conserva
+_OPEN = '\ue000'
+_CLOSE = '\ue001'
+_RAW_PREFIX = '!'
+_ID_PREFIX = '#'
+_HOLE_RE = re.compile(f'{_OPEN}([^{_OPEN}{_CLOSE}]+){_CLOSE}')
+
+
+def auto_id(number: int) -> str:
+    """ID automático de un componente sin id explícito"""
+    return f"component_{number}"
+
+
+def id_slot(number: int) -> str:
+    """Centinela de un ID automático mientras se compila un plan"""
+    return f"{_OPEN}{_ID_PREFIX}{number}{_CLOSE}"
+
+
+class RenderNeeds(NamedTuple):
+    """Lo que necesita un HTML ya renderizado: tipos de componente (su CSS), funciones
+    del runtime y assets. Va con cada plan para que ejecutarlo lo sume al RenderContext"""
+    components: FrozenSet[str] = frozenset()
+    features: FrozenSet[str] = frozenset()
+    assets: FrozenSet[str] = frozenset()
+
+
+NO_NEEDS = RenderNeeds()
+
+
+class Field(str):
+    """Marcador de un valor que cambia en cada registro; es un str con un centinela"""
+
+    def __new__(cls, name: str, raw: bool = False):
+        if (not name or _OPEN in name or _CLOSE in name
+                or name.startswith(_RAW_PREFIX) or name.startswith(_ID_PREFIX)):
+            raise ValueError(f"Nombre de campo inválido: {name!r}")
+        marker = f"{_OPEN}{_RAW_PREFIX if raw else ''}{name}{_CLOSE}"
+        instance = super().__new__(cls, marker)
+        instance.name = name
+        instance.raw = raw
+        return instance
+
+    def __reduce__(self):
+        return (Field, (self.name, self.raw))
+
+
+def field(name: str, raw: bool = False) -> Field:
+    """Campo de plantilla: field('name') se sustituye por record['name'] escapado"""
+    return Field(name, raw=raw)
+
+
+class RenderPlan:
+    """HTML precompilado: segmentos constantes intercalados con huecos.
+    Cada hueco es (número de ID automático, False) o (nombre de campo, raw)"""
+
+    __slots__ = ('segments', 'holes', 'id_count', 'needs')
+
+    def __init__(self, segments: Tuple[str, ...], holes: Tuple[Tuple[Union[int, str], bool], ...],
+                 id_count: int = 0, needs: RenderNeeds = NO_NEEDS):
+        self.segments = segments
+        self.holes = holes
+        self.id_count = id_count
+        self.needs = needs
+
+    @classmethod
+    def from_html(cls, html_content: str, id_count: Optional[int] = None,
+                  needs: RenderNeeds = NO_NEEDS) -> 'RenderPlan':
+        parts = _HOLE_RE.split(html_content)
+        segments = tuple(parts[0::2])
+        holes = []
+        for marker in parts[1::2]:
+            if marker.startswith(_ID_PREFIX):
+                holes.append((int(marker[1:]), False))
+            elif marker.startswith(_RAW_PREFIX):
+                holes.append((marker[1:], True))
+            else:
+                holes.append((marker, False))
+        for segment in segments:
+            if _OPEN in segment or _CLOSE in segment:
+                raise ValueError("Un campo de plantilla fue transformado por un componente; "
+                                 "usa field() solo como texto, atributo o estilo literal")
+        if id_count is None:
+            id_count = max((name + 1 for name, _raw in holes if isinstance(name, int)), default=0)
+        return cls(segments, tuple(holes), id_count, needs)
+
+    @property
+    def fields(self) -> List[str]:
+        """Campos que necesita render(), sin repetir y en orden de aparición"""
+        return list(dict.fromkeys(name for name, _raw in self.holes if isinstance(name, str)))
+
+    def render(self, record: Optional[Mapping[str, Any]] = None, id_base: int = 0,
+               id_format: Callable[[int], str] = auto_id) -> str:
+        """Une los segmentos con los valores: IDs desde `id_base` y campos del registro
+        (escapados salvo los raw). Sin registro, los campos se dejan como centinelas"""
+        segments = self.segments
+        parts = [segments[0]]
+        for index, (name, raw) in enumerate(self.holes, start=1):
+            if name.__class__ is int:
+                parts.append(id_format(id_base + name))
+            elif record is None:
+                parts.append(f"{_OPEN}{_RAW_PREFIX if raw else ''}{name}{_CLOSE}")
+            else:
+                try:
+                    value = record[name]
+                except KeyError:
+                    raise KeyError(f"Falta el campo '{name}' en el registro de la plantilla") from None
+                value = '' if value is None else str(value)
+                parts.append(value if raw else html.escape(value))
+            parts.append(segments[index])
+        return ''.join(parts)
+
+
+def compile_plan(exporter, component, context=None) -> RenderPlan:
+    """Renderiza `component` una vez, en un contexto propio con IDs como huecos, y
+    devuelve su plan. Lo que necesita el subárbol también se suma a `context`"""
+    from dars.exporters.web.render_context import RenderContext
+    if context is None:
+        context = RenderContext()
+    plan_context = context.for_plan()
+    html_content = exporter.render_component_direct(component, plan_context)
+    needs = plan_context.needs()
+    context.add_needs(needs)
+    return RenderPlan.from_html(html_content, plan_context.next_id, needs)
+
+
+def run_plan(plan: RenderPlan, context) -> str:
+    """Ejecuta un plan en `context`: IDs a partir del siguiente libre y sus necesidades"""
+    html_content = plan.render(id_base=context.next_id, id_format=context.id_format)
+    context.next_id += plan.id_count
+    if plan.needs is not NO_NEEDS:
+        context.add_needs(plan.needs)
+    return html_content
+
+
+class PlanCache:
+    """Caché LRU de planes por fingerprint de subárbol (se puede usar desde varios hilos)"""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._plans: 'OrderedDict[str, RenderPlan]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[RenderPlan]:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def put(self, key: str, plan: RenderPlan):
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._plans), 'hits': self.hits, 'misses': self.misses}
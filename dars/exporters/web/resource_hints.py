@@ -0,0 +1,147 @@
+"""
+Resource hints del <head>: lo que el navegador puede pedir antes de encontrarlo.
+
+  - preload de la hoja de estilos, de las fuentes declaradas con App.add_font() y de las
+    imágenes (componentes Image) de los primeros `above_fold` componentes de primer
+    nivel, lo que se ve sin hacer scroll;
+  - prefetch de las páginas a las que enlaza la página (Link, también dentro de un
+    Navbar): rutas locales a un .html, en orden de aparición y como mucho `max_prefetch`.
+
+Todo sale del árbol de componentes, sin renderizar, así el <head> se puede emitir antes
+que el cuerpo (generate_html_chunks). El recorrido entra en los mismos contenedores que el
+exportador (nested_components): paneles de Tabs, secciones de Accordion, Tooltip y Cached.
+Las URLs se escapan como atributos; con una PageTemplate, un src o href que es un campo
+se convierte en un hueco del plan como cualquier otro texto.
+"""
+
+import html
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Extensión de fuente -> (tipo MIME del preload, format() de @font-face)
+FONT_TYPES = {
+    '.woff2': ('font/woff2', 'woff2'),
+    '.woff': ('font/woff', 'woff'),
+    '.ttf': ('font/ttf', 'truetype'),
+    '.otf': ('font/otf', 'opentype'),
+}
+
+_SCHEME = re.compile(r'^[a-zA-Z][\w+.-]*:')
+
+
+def nested_components(component, cached_fragments: Optional[Dict[str, object]] = None) -> List:
+    """
+    Lo que el exportador renderiza dentro de `component`: children (con listas anidadas),
+    los paneles de Tabs, el contenido de las secciones de Accordion y el hijo de Tooltip.
+    Un Cached con componente lo lleva en children; uno con función solo se recorre si se
+    da `cached_fragments`, donde se guarda lo construido (una vez por clave)
+    """
+    nested = []
+    children = getattr(component, 'children', None)
+    if isinstance(children, list):
+        nested.extend(children)
+    panels = getattr(component, 'panels', None)
+    if isinstance(panels, list):
+        nested.extend(panels)
+    sections = getattr(component, 'sections', None)
+    if isinstance(sections, list):
+        nested.extend(section[1] for section in sections if isinstance(section, tuple) and len(section) == 2)
+    child = getattr(component, 'child', None)
+    if child is not None and not any(child is item for item in nested):
+        nested.append(child)
+    build = getattr(component, 'build', None)
+    if cached_fragments is not None and callable(build) and hasattr(component, 'cache_key'):
+        key = component.cache_key()
+        if key not in cached_fragments:
+            cached_fragments[key] = component.resolve()
+        nested.append(cached_fragments[key])
+    # Solo componentes (y listas de ellos): un panel o sección puede ser HTML en texto
+    return [item for item in nested if isinstance(item, list) or hasattr(item, 'render')]
+
+
+def iter_components(component, cached_fragments: Optional[Dict[str, object]] = None) -> Iterator:
+    """El componente y sus descendientes (nested_components), en orden de documento"""
+    if component is None:
+        return
+    stack = [component]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, list):
+            stack.extend(reversed(current))
+            continue
+        yield current
+        stack.extend(reversed(nested_components(current, cached_fragments)))
+
+
+def above_fold_components(root, count: int) -> List:
+    """La raíz con sus primeros `count` hijos y sus descendientes"""
+    if root is None:
+        return []
+    children = nested_components(root)
+    return [root] + [component for child in children[:count] for component in iter_components(child)]
+
+
+def _is_local(url: str) -> bool:
+    return bool(url) and not url.startswith(('#', '//', 'data:')) and not _SCHEME.match(url)
+
+
+def image_sources(components: Iterable, image_class) -> List[str]:
+    """src de los componentes Image (sin repetir ni data: URIs)"""
+    sources = []
+    if image_class is None:
+        return sources
+    for component in components:
+        if not isinstance(component, image_class):
+            continue
+        src = getattr(component, 'src', None)
+        if src and not str(src).startswith('data:') and src not in sources:
+            sources.append(src)
+    return sources
+
+
+def linked_pages(components: Iterable, link_class, limit: int) -> List[str]:
+    """href de los Link a otras páginas del sitio (.html locales que se abren en la misma pestaña)"""
+    pages = []
+    if link_class is None or limit <= 0:
+        return pages
+    for component in components:
+        if not isinstance(component, link_class):
+            continue
+        href = getattr(component, 'href', None)
+        if not href or not _is_local(href) or getattr(component, 'target', '_self') not in ('_self', '', None):
+            continue
+        # El fragmento no cambia el documento que se pide
+        document = href.split('#', 1)[0]
+        if document.split('?', 1)[0].endswith('.html') and document not in pages:
+            pages.append(document)
+            if len(pages) >= limit:
+                break
+    return pages
+
+
+def font_type(url: str) -> Optional[Tuple[str, str]]:
+    """(tipo MIME, formato CSS) de una fuente según su extensión, o None si no se conoce"""
+    return FONT_TYPES.get(os.path.splitext(re.split(r'[?#]', url, 1)[0])[1].lower())
+
+
+def render_hints(css_file: Optional[str], fonts: Iterable, images: Iterable[str], pages: Iterable[str]) -> str:
+    """Los <link> de preload y prefetch, uno por línea"""
+    links = []
+    if css_file:
+        links.append(f'<link rel="preload" href="{_attr(css_file)}" as="style">')
+    for font in fonts:
+        url = font['url']
+        known = font_type(url)
+        type_attr = f' type="{known[0]}"' if known else ''
+        # Las fuentes se piden siempre en modo CORS: sin crossorigin el preload no se reutiliza
+        links.append(f'<link rel="preload" href="{_attr(url)}" as="font"{type_attr} crossorigin>')
+    for src in images:
+        links.append(f'<link rel="preload" href="{_attr(src)}" as="image">')
+    for href in pages:
+        links.append(f'<link rel="prefetch" href="{_attr(href)}">')
+    return '\n    '.join(links)
+
+
+def _attr(value) -> str:
+    return html.escape(str(value), quote=True)
@@ -0,0 +1,12 @@
+"""
+Dars server: render en el servidor (SSR) de una App detrás de WSGI o ASGI.
+
+    from dars.server import SSRApp
+    application = SSRApp(app).wsgi
+
+Ver ssr.py para rutas dinámicas, caché y versión de datos.
+"""
+
+from dars.server.ssr import Request, Response, ResponseCache, SSRApp
+
+__all__ = ['SSRApp', 'Request', 'Response', 'ResponseCache']
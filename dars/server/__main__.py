@@ -0,0 +1,48 @@
+"""
+Servidor WSGI de desarrollo (stdlib) para una App en modo SSR:
+
+    python -m dars.server my_app.py --port 8000
+
+En producción, usa el callable `ssr.wsgi` con gunicorn/uwsgi o `ssr.asgi` con uvicorn.
+"""
+
+import argparse
+import socketserver
+import sys
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from dars.server.ssr import load_ssr_app
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m dars.server", description="Serve a Dars app with server-side rendering")
+    parser.add_argument('file', help="Python file defining `app` (App) or `ssr` (SSRApp)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', '-p', type=int, default=8000)
+    parser.add_argument('--cache-size', type=int, default=1024, help="Cached responses (0 disables the cache)")
+    parser.add_argument('--stream', action='store_true', help="Stream uncached pages, sending <head> first")
+    parser.add_argument('--access-log', action='store_true')
+    args = parser.parse_args(argv)
+
+    ssr = load_ssr_app(args.file, cache_size=args.cache_size, stream=args.stream)
+    handler = WSGIRequestHandler if args.access_log else QuietHandler
+    with make_server(args.host, args.port, ssr.wsgi, server_class=ThreadingWSGIServer, handler_class=handler) as server:
+        print(f"Dars SSR on http://{args.host}:{server.server_port}/ (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Load test del modo SSR: rendimiento con y sin caché de respuestas.
+
+    python -m dars.server.loadtest my_app.py --path / --path /about -n 2000
+    python -m dars.server.loadtest my_app.py --concurrency 8 --json
+
+Llama al callable WSGI en el propio proceso (sin red), así mide el render y la caché,
+no un servidor HTTP concreto. Para medir un servidor real, usa dars.cli.loadtest
+contra su URL.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from dars.cli.loadtest import LoadTestResult
+
+
+def run_wsgi_load(wsgi_app, paths: List[str], requests: int = 2000, concurrency: int = 1,
+                  headers: Optional[Dict[str, str]] = None) -> LoadTestResult:
+    """Hace `requests` peticiones GET en round-robin sobre `paths` con `concurrency` hilos"""
+    extra = {'HTTP_' + name.upper().replace('-', '_'): value for name, value in (headers or {}).items()}
+    latencies: List[float] = []
+    status_counts: Dict[int, int] = {}
+    totals = {'bytes': 0, 'errors': 0}
+    lock = threading.Lock()
+
+    def one(index: int):
+        environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': paths[index % len(paths)], 'QUERY_STRING': '',
+                   'SCRIPT_NAME': '', 'SERVER_NAME': 'loadtest', 'SERVER_PORT': '80',
+                   'wsgi.url_scheme': 'http', **extra}
+        status = []
+        started = time.perf_counter()
+        try:
+            body = b''.join(wsgi_app(environ, lambda line, _headers: status.append(int(line.split()[0]))))
+        except Exception:
+            with lock:
+                totals['errors'] += 1
+            return
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            totals['bytes'] += len(body)
+            status_counts[status[0]] = status_counts.get(status[0], 0) + 1
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        for index in range(requests):
+            one(index)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - started
+    return LoadTestResult(latencies, totals['errors'], elapsed, totals['bytes'], status_counts)
+
+
+def compare_cache(file_path: str, paths: List[str], requests: int = 2000, concurrency: int = 1,
+                  cache_size: int = 1024) -> Dict[str, LoadTestResult]:
+    """Mide la misma app con caché de respuestas (`cache_size`) y sin ella"""
+    from dars.server.ssr import load_ssr_app
+
+    results = {}
+    for label, size in (('cached', cache_size), ('uncached', 0)):
+        ssr = load_ssr_app(file_path, cache_size=size)
+        if size == 0:
+            ssr.cache = None  # también si el archivo define su propio `ssr`
+        results[label] = run_wsgi_load(ssr.wsgi, paths, requests, concurrency)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import sys
+
+    from dars.cli.loadtest import print_result
+
+    parser = argparse.ArgumentParser(description="Dars SSR load test: throughput with and without the response cache")
+    parser.add_argument("file", help="Python file defining `app` (App) or `ssr` (SSRApp)")
+    parser.add_argument("--path", action="append", help="Path to request (repeatable, round-robin; default /)")
+    parser.add_argument("--requests", "-n", type=int, default=2000)
+    parser.add_argument("--concurrency", "-c", type=int, default=1, help="Worker threads")
+    parser.add_argument("--cache-size", type=int, default=1024)
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    results = compare_cache(args.file, args.path or ['/'], args.requests, args.concurrency, args.cache_size)
+    if args.json:
+        print(json.dumps({label: result.to_dict() for label, result in results.items()}, indent=2))
+    else:
+        for label, result in results.items():
+            print_result(result, title=f"SSR load test ({label})")
+        cached, uncached = results['cached'], results['uncached']
+        if uncached.requests_per_second:
+            print(f"Cache speedup: {cached.requests_per_second / uncached.requests_per_second:.1f}x")
+    sys.exit(1 if any(result.errors for result in results.values()) else 0)
@@ -0,0 +1,452 @@
+"""
+Render en el servidor (SSR) de una App Dars, detrás de WSGI o ASGI.
+
+    from dars.server import SSRApp
+
+    ssr = SSRApp(app, data_version=lambda: catalog.version)
+
+    @ssr.route('/products/{slug}')
+    def product(request):
+        item = catalog.get(request.params['slug'])
+        return Container(children=[Text(item.name)]), item.name
+
+    application = ssr.wsgi      # gunicorn mymodule:application
+    asgi_application = ssr.asgi  # uvicorn mymodule:asgi_application
+
+Las páginas de la App (add_page) se sirven en `/` (index) y `/<slug>`; las rutas
+dinámicas construyen su árbol en cada petición. Las fuentes de páginas
+(App.add_page_source) no se sirven: se recorren una vez y pueden ser generadores, así
+que no hay forma de buscar una página por su slug sin consumirlas. Para ellas hay que
+registrar una ruta ('/{slug}') que construya la página pedida. Cada página se renderiza en memoria con el
+exportador HTML (sin escribir a disco) y la respuesta se guarda en una caché LRU con
+clave (ruta, versión de datos): mientras la versión no cambie, la siguiente petición
+no vuelve a renderizar. Todas las respuestas llevan ETag y las peticiones con
+If-None-Match reciben 304. El CSS, el runtime y los scripts se generan una vez y se
+sirven con nombre con hash de contenido (Cache-Control immutable).
+
+Con `SSRApp(app, stream=True)`, un GET que no está en caché se envía en streaming
+(generate_html_chunks): primero el <head>, para que el navegador pida CSS y JS mientras
+el cuerpo se sigue renderizando. Esa respuesta no lleva ETag ni Content-Length; al
+terminar se guarda completa en la caché y las siguientes sí los llevan.
+"""
+
+import hashlib
+import re
+import threading
+import urllib.parse
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from dars.cli.serve import IMMUTABLE_CACHE_CONTROL, _RESPONSE_REASONS, _etag_matches
+from dars.core.app import App, Page
+
+HTML_CACHE_CONTROL = 'no-cache'
+_ROUTE_PARAM_RE = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+
+class Request:
+    """Petición entrante tal y como la ve un handler de ruta"""
+
+    def __init__(self, method: str, path: str, query: str = '', headers: Optional[Dict[str, str]] = None,
+                 params: Optional[Dict[str, str]] = None, root_path: str = ''):
+        self.method = method
+        self.path = path
+        self.query_string = query
+        self.query = urllib.parse.parse_qs(query)
+        self.headers = headers or {}
+        self.params = params or {}
+        self.root_path = root_path
+        # Los rellena SSRApp al resolver la ruta
+        self.target = None
+        self.cache_key = None
+
+
+class Response:
+    """Respuesta (status, cabeceras, cuerpo). Si `chunks` no es None, el cuerpo se
+    envía en streaming a partir de ese iterador de bytes y `body` no se usa"""
+
+    __slots__ = ('status', 'headers', 'body', 'etag', 'chunks')
+
+    def __init__(self, status: int, headers: List[Tuple[str, str]], body: bytes = b'', etag: Optional[str] = None,
+                 chunks: Optional[Iterator[bytes]] = None):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.chunks = chunks
+
+    @property
+    def status_line(self) -> str:
+        return f'{self.status} {_RESPONSE_REASONS.get(self.status, "")}'.rstrip()
+
+    def not_modified(self) -> 'Response':
+        headers = [(name, value) for name, value in self.headers
+                   if name not in ('Content-Type', 'Content-Length')]
+        return Response(304, headers)
+
+    def without_body(self) -> 'Response':
+        return Response(self.status, self.headers, b'', self.etag)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def _content_response(body: bytes, content_type: str, cache_control: str, status: int = 200) -> Response:
+    etag = _etag(body)
+    return Response(status, [
+        ('Content-Type', content_type),
+        ('Content-Length', str(len(body))),
+        ('ETag', etag),
+        ('Cache-Control', cache_control),
+    ], body, etag)
+
+
+def _simple_response(status: int, extra: Optional[List[Tuple[str, str]]] = None) -> Response:
+    body = f'{status} {_RESPONSE_REASONS.get(status, "")}\n'.encode()
+    return Response(status, [('Content-Type', 'text/plain; charset=utf-8'),
+                             ('Content-Length', str(len(body)))] + (extra or []), body)
+
+
+class ResponseCache:
+    """LRU de respuestas renderizadas, con clave (prefijo, ruta, versión de datos)"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Response]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Response]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: Hashable, response: Response):
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class _Route:
+    def __init__(self, pattern: str, handler: Callable[[Request], Any], version: Optional[Callable[[Request], Hashable]]):
+        self.pattern = pattern
+        self.handler = handler
+        self.version = version
+        regex = ''
+        position = 0
+        for match in _ROUTE_PARAM_RE.finditer(pattern):
+            regex += re.escape(pattern[position:match.start()]) + f'(?P<{match.group(1)}>[^/]+)'
+            position = match.end()
+        self.regex = re.compile(regex + re.escape(pattern[position:]) + '$')
+
+
+class SSRApp:
+    """
+    Sirve una App renderizando en cada petición (con caché). `data_version` es una función
+    sin argumentos que devuelve la versión actual de los datos: al cambiar, las respuestas
+    cacheadas dejan de usarse. Las rutas dinámicas solo se cachean si tienen `version`.
+    `stream=True` envía en streaming los GET que hay que renderizar (no con prettify).
+    """
+
+    def __init__(self, app: App, exporter=None, cache_size: int = 1024,
+                 data_version: Optional[Callable[[], Hashable]] = None, prettify: bool = False,
+                 stream: bool = False, chunk_size: int = 16384):
+        if exporter is None:
+            from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+            exporter = HTMLCSSJSExporter()
+        self.app = app
+        self.exporter = exporter
+        self.cache = ResponseCache(cache_size) if cache_size else None
+        self.data_version = data_version
+        self.prettify = prettify
+        self.stream = stream and not prettify
+        self.chunk_size = chunk_size
+        self._routes: List[_Route] = []
+        # Los renders van en paralelo (el exportador guarda su estado en un RenderContext);
+        # este lock solo protege el registro de assets y los planes de plantillas
+        self._lock = threading.Lock()
+        # Planes de PageTemplate con las URLs de assets de SSR: {(id, root_path): (plantilla, plan, js)}
+        self._template_plans: Dict[Tuple[int, str], Tuple[Any, Any, str]] = {}
+        self.refresh()
+
+    # --- configuración ---
+
+    def route(self, pattern: str, handler: Optional[Callable[[Request], Any]] = None,
+              version: Optional[Callable[[Request], Hashable]] = None):
+        """
+        Registra una ruta dinámica ('/products/{slug}'). El handler recibe un Request y
+        devuelve la raíz de la página, (raíz, título) o un Page. Se puede usar como decorador.
+        """
+        def register(function):
+            self._routes.append(_Route(pattern, function, version))
+            return function
+        return register(handler) if handler is not None else register
+
+    def refresh(self):
+        """Regenera los archivos compartidos y el mapa de páginas (llamar si cambia la App)"""
+        shared = self.exporter.render_shared_files(self.app)
+        self._assets: Dict[str, Response] = {}
+        self._asset_names: Dict[str, str] = {}
+        self._shared_names = {filename: self._asset_name(filename, content) for filename, content in shared.items()}
+        self._pages: Dict[str, Page] = {}
+        if self.app.is_multipage():
+            index_page = self.app.get_index_page()
+            for slug, page in self.app.pages.items():
+                self._pages[f'/{slug}'] = page
+                self._pages[f'/{slug}.html'] = page
+            if index_page is not None:
+                self._pages['/'] = self._pages['/index.html'] = index_page
+        elif self.app.root is not None:
+            self._pages['/'] = self._pages['/index.html'] = Page('index', self.app.root)
+        self._template_plans = {}
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _asset_name(self, filename: str, content: str) -> str:
+        """Nombre con hash de contenido de un asset compartido; lo registra la primera vez"""
+        name = self._asset_names.get(content)
+        if name is None:
+            stem, dot, extension = filename.rpartition('.')
+            digest = hashlib.blake2b(content.encode('utf-8'), digest_size=6).hexdigest()
+            name = f'{stem}.{digest}.{extension}'
+            content_type = 'text/css; charset=utf-8' if extension == 'css' else 'application/javascript; charset=utf-8'
+            response = _content_response(content.encode('utf-8'), content_type, IMMUTABLE_CACHE_CONTROL)
+            with self._lock:
+                # El asset queda servible antes de que su nombre se pueda devolver a otro hilo
+                self._assets.setdefault(name, response)
+                self._asset_names[content] = name
+        return name
+
+    # --- render ---
+
+    def _match(self, request: Request):
+        """(página o ruta, clave de caché o None) para la ruta pedida; (None, None) si no existe"""
+        data_version = self.data_version() if self.data_version is not None else None
+        key = (request.root_path, request.path, request.query_string, data_version)
+        page = self._pages.get(request.path)
+        if page is not None:
+            return page, key
+        for route in self._routes:
+            match = route.regex.match(request.path)
+            if match is None:
+                continue
+            request.params = match.groupdict()
+            if route.version is None:
+                return route, None
+            return route, key + (route.version(request),)
+        return None, None
+
+    @staticmethod
+    def _as_page(result: Any, path: str) -> Optional[Page]:
+        if result is None or isinstance(result, Page):
+            return result
+        name = path.strip('/').replace('/', '_') or 'index'
+        if isinstance(result, tuple):
+            return Page(name, *result)
+        return Page(name, result)
+
+    def render_page(self, page: Page, root_path: str = '') -> str:
+        """HTML de una página con los assets compartidos como URLs absolutas"""
+        css_url = f'{root_path}/{self._shared_names["styles.css"]}'
+        runtime_url = f'{root_path}/{self._shared_names["runtime_dars.js"]}'
+        exporter = self.exporter
+        template = getattr(page, 'template', None)
+        if template is not None:
+            from dars.exporters.web.page_template import SCRIPT_FILE_FIELD, field
+            key = (id(template), root_path)
+            with self._lock:
+                entry = self._template_plans.get(key)
+                if entry is None or entry[0] is not template:
+                    page_app = exporter._page_app(self.app, template.as_page(None))
+                    plan = template.compile(exporter, self.app, css_file=css_url, prettify=self.prettify,
+                                            script_file=field(SCRIPT_FILE_FIELD), runtime_file=runtime_url)
+                    entry = self._template_plans[key] = (template, plan, exporter.page_script_js(self.app, page_app))
+            _template, plan, script_js = entry
+            script_url = f'{root_path}/{self._asset_name("script.js", script_js)}'
+            return plan.render({**page.record, SCRIPT_FILE_FIELD: script_url})
+        page_app, css_url, script_url = self._page_assets(page, root_path, css_url)
+        html_content = exporter.generate_html(page_app, css_file=css_url, script_file=script_url,
+                                              runtime_file=runtime_url)
+        if self.prettify:
+            html_content = exporter.prettify_html(html_content)
+        return html_content
+
+    def _page_assets(self, page: Page, root_path: str, css_url: str):
+        """(App de la página, URL del CSS, URL del script)"""
+        exporter = self.exporter
+        page_app = exporter._page_app(self.app, page)
+        if 'global_styles' in (page.meta or {}):
+            css_url = f'{root_path}/{self._asset_name("styles.css", exporter.generate_css(page_app))}'
+        script_url = f'{root_path}/{self._asset_name("script.js", exporter.page_script_js(self.app, page_app))}'
+        return page_app, css_url, script_url
+
+    def stream_page(self, page: Page, root_path: str = '') -> Iterator[str]:
+        """HTML de una página en fragmentos (ver generate_html_chunks)"""
+        css_url = f'{root_path}/{self._shared_names["styles.css"]}'
+        runtime_url = f'{root_path}/{self._shared_names["runtime_dars.js"]}'
+        page_app, css_url, script_url = self._page_assets(page, root_path, css_url)
+        return self.exporter.generate_html_chunks(page_app, css_file=css_url, script_file=script_url,
+                                             runtime_file=runtime_url, chunk_size=self.chunk_size)
+
+    # --- peticiones ---
+
+    def handle(self, method: str, path: str, headers: Optional[Dict[str, str]] = None,
+               query: str = '', root_path: str = '') -> Response:
+        """Atiende una petición y devuelve la respuesta completa (núcleo de WSGI y ASGI)"""
+        request = Request(method, path, query, headers, root_path=root_path)
+        response = self._fast_response(request)
+        if response is None:
+            response = self._render_response(request)
+        return self._finish(request, response)
+
+    def _fast_response(self, request: Request) -> Optional[Response]:
+        """Respuesta que no necesita render (405, assets, páginas en caché) o None"""
+        if request.method not in ('GET', 'HEAD'):
+            return _simple_response(405, [('Allow', 'GET, HEAD')])
+        asset = self._assets.get(request.path.lstrip('/'))
+        if asset is not None:
+            return asset
+        request.target, request.cache_key = self._match(request)
+        if request.target is None:
+            return _simple_response(404)
+        if self.cache is not None and request.cache_key is not None:
+            return self.cache.get(request.cache_key)
+        return None
+
+    def _render_response(self, request: Request) -> Response:
+        target = request.target
+        if isinstance(target, _Route):
+            try:
+                page = self._as_page(target.handler(request), request.path)
+            except LookupError:
+                # Un handler que no encuentra su registro (KeyError/IndexError) es un 404
+                return _simple_response(404)
+            if page is None:
+                return _simple_response(404)
+        else:
+            page = target
+        if self.stream and request.method == 'GET' and getattr(page, 'template', None) is None:
+            return self._streamed_response(request, page)
+        body = self.render_page(page, request.root_path).encode('utf-8')
+        response = _content_response(body, 'text/html; charset=utf-8', HTML_CACHE_CONTROL)
+        if self.cache is not None and request.cache_key is not None:
+            self.cache.put(request.cache_key, response)
+        return response
+
+    def _streamed_response(self, request: Request, page: Page) -> Response:
+        chunks = self.stream_page(page, request.root_path)
+        cache_key = request.cache_key if self.cache is not None else None
+
+        def body():
+            parts = []
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                parts.append(data)
+                yield data
+            # Completa: las siguientes peticiones la sirven de la caché, con ETag
+            if cache_key is not None:
+                self.cache.put(cache_key, _content_response(b''.join(parts), 'text/html; charset=utf-8',
+                                                            HTML_CACHE_CONTROL))
+
+        return Response(200, [('Content-Type', 'text/html; charset=utf-8'),
+                              ('Cache-Control', HTML_CACHE_CONTROL)], chunks=body())
+
+    @staticmethod
+    def _finish(request: Request, response: Response) -> Response:
+        if response.etag is not None and _etag_matches(request.headers.get('if-none-match'), response.etag):
+            return response.not_modified()
+        return response.without_body() if request.method == 'HEAD' else response
+
+    # --- adaptadores ---
+
+    def wsgi(self, environ: Dict[str, Any], start_response) -> List[bytes]:
+        """Aplicación WSGI (PEP 3333)"""
+        headers = {
+            name[5:].replace('_', '-').lower(): value
+            for name, value in environ.items() if name.startswith('HTTP_')
+        }
+        response = self.handle(environ.get('REQUEST_METHOD', 'GET'), environ.get('PATH_INFO', '') or '/',
+                               headers, environ.get('QUERY_STRING', ''), environ.get('SCRIPT_NAME', '').rstrip('/'))
+        start_response(response.status_line, list(response.headers))
+        return response.chunks if response.chunks is not None else [response.body]
+
+    async def asgi(self, scope: Dict[str, Any], receive, send):
+        """Aplicación ASGI 3 (http y lifespan). Los renders se hacen en un hilo aparte para
+        no bloquear el event loop; assets y respuestas en caché se sirven directamente"""
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+        import asyncio
+        headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope.get('headers', [])}
+        request = Request(scope['method'], scope.get('path') or '/', scope.get('query_string', b'').decode('latin-1'),
+                          headers, root_path=scope.get('root_path', '').rstrip('/'))
+        response = self._fast_response(request)
+        if response is None:
+            response = await asyncio.get_running_loop().run_in_executor(None, self._render_response, request)
+        response = self._finish(request, response)
+        await send({
+            'type': 'http.response.start',
+            'status': response.status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in response.headers],
+        })
+        if response.chunks is None:
+            await send({'type': 'http.response.body', 'body': response.body})
+            return
+        # Cada fragmento se renderiza en el executor y se envía en cuanto está listo
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, next, response.chunks, None)
+            if chunk is None:
+                break
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+
+
+def load_ssr_app(file_path: str, **options) -> SSRApp:
+    """Carga un archivo de app: usa su variable `ssr` (SSRApp, con sus rutas) si existe;
+    si no, envuelve su variable `app` con SSRApp(app, **options)"""
+    import importlib.util
+    import os
+    import sys
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location("user_app", file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {file_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    ssr = getattr(module, 'ssr', None)
+    if isinstance(ssr, SSRApp):
+        return ssr
+    app = getattr(module, 'app', None)
+    if not isinstance(app, App):
+        raise ImportError(f"{file_path} defines neither `ssr` (SSRApp) nor `app` (App)")
+    return SSRApp(app, **options)
@@ -0,0 +1,104 @@
+import gzip
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from dars.components.basic.container import Container
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.archive_writer import PRECOMPRESS_MIN_SIZE, ArchiveWriter, source_date_epoch
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+
+
+def _app():
+    app = App(title="archive")
+    for i in range(3):
+        # Texto suficiente para que cada página pase del mínimo de precompresión
+        paragraphs = [Text(f"page {i} paragraph {n}") for n in range(60)]
+        app.add_page(f"page{i}", Page(Container(children=paragraphs)), index=i == 0)
+    app.add_page("tiny", Page(Text("tiny")))
+    return app
+
+
+def _entries(data, format):
+    if format == 'zip':
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            return {info.filename: (info, archive.read(info)) for info in archive.infolist()}
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:*') as archive:
+        return {info.name: (info, archive.extractfile(info).read()) for info in archive.getmembers()}
+
+
+@pytest.mark.parametrize('format', ['zip', 'tar.gz'])
+@pytest.mark.parametrize('precompress', [False, True])
+def test_archives_are_byte_identical_across_runs(tmp_path, format, precompress):
+    outputs = []
+    for run in range(2):
+        target = tmp_path / f"site{run}.{format}"
+        # Un exportador y una App nuevos en cada ejecución, como dos builds separados
+        result = HTMLCSSJSExporter().export_archive(_app(), str(target), precompress=precompress)
+        assert result and result.error is None
+        outputs.append(target.read_bytes())
+    assert outputs[0] == outputs[1]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+    # A un stream sin seek sale lo mismo que a una ruta
+    stream = io.BytesIO()
+    HTMLCSSJSExporter().export_archive(_app(), stream, format=format, precompress=precompress)
+    assert stream.getvalue() == outputs[0]
+
+    for name, (info, _data) in _entries(outputs[0], format).items():
+        if format == 'zip':
+            assert info.date_time == (1980, 1, 1, 0, 0, 0)
+            assert info.external_attr >> 16 == 0o100644
+        else:
+            assert (info.mtime, info.mode, info.uid, info.gid, info.uname) == (source_date_epoch(), 0o644, 0, 0, '')
+
+
+@pytest.mark.parametrize('format', ['zip', 'tar.gz'])
+def test_precompressed_entries(tmp_path, format):
+    target = tmp_path / f"site.{format}"
+    result = HTMLCSSJSExporter().export_archive(_app(), str(target), precompress=True)
+    assert result
+    entries = _entries(target.read_bytes(), format)
+
+    for name, (_info, data) in entries.items():
+        if name.endswith(('.gz', '.br')):
+            continue
+        compressible = name.endswith(('.html', '.css', '.js')) and len(data) >= PRECOMPRESS_MIN_SIZE
+        assert (name + '.gz' in entries) == compressible, name
+        if compressible:
+            info, compressed = entries[name + '.gz']
+            assert gzip.decompress(compressed) == data
+            if format == 'zip':
+                # Ya está comprimido: se guarda tal cual
+                assert info.compress_type == zipfile.ZIP_STORED
+    assert 'page1.html.gz' in entries
+    assert 'tiny.html' in entries and 'tiny.html.gz' not in entries
+    assert result.write_stats.files_written == len(entries)
+
+
+def test_source_date_epoch_sets_entry_dates(tmp_path, monkeypatch):
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1700000000')
+    stream = io.BytesIO()
+    with ArchiveWriter(stream, format='tar.gz') as writer:
+        writer.write('index.html', '<h1>hi</h1>')
+    data = stream.getvalue()
+    # La cabecera gzip lleva la misma fecha
+    assert int.from_bytes(data[4:8], 'little') == 1700000000
+    (info, content), = _entries(data, 'tar.gz').values()
+    assert info.mtime == 1700000000 and content == b'<h1>hi</h1>'
+
+
+def test_conflicting_entry_discards_the_partial_archive(tmp_path):
+    target = tmp_path / "site.zip"
+    with pytest.raises(ValueError):
+        with ArchiveWriter(str(target)) as writer:
+            writer.write('index.html', 'a')
+            writer.write('index.html', 'a')
+            assert writer.stats.files_skipped == 1
+            writer.write('index.html', 'b')
+    assert os.listdir(tmp_path) == []
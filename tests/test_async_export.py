@@ -0,0 +1,56 @@
+import asyncio
+import os
+import time
+
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.output_writer import OutputWriter
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+from dars.scripts.script import InlineScript
+
+
+def _app():
+    app = App(title="async")
+    home = Page(Text("home"))
+    home.add_script(InlineScript("console.log('home');"))
+    app.add_page("home", home, index=True)
+    app.add_page("about", Page(Text("about")))
+    return app
+
+
+def _tree(directory):
+    files = {}
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), 'rb') as f:
+            files[name] = f.read()
+    return files
+
+
+def test_async_export_matches_sync_export(tmp_path, monkeypatch):
+    write_now = OutputWriter.write_now
+
+    def slow_shared_write(self, relative_path, content):
+        # El script.js vacío de los archivos compartidos, si se escribiera, terminaría el último
+        if relative_path == 'script.js' and not content:
+            time.sleep(0.2)
+        return write_now(self, relative_path, content)
+    monkeypatch.setattr(OutputWriter, 'write_now', slow_shared_write)
+
+    sync_dir, async_dir = str(tmp_path / "sync"), str(tmp_path / "async")
+    assert HTMLCSSJSExporter().export(_app(), sync_dir)
+    job = HTMLCSSJSExporter().export_async(_app(), async_dir)
+    result = asyncio.run(job.run())
+
+    assert result
+    assert _tree(async_dir) == _tree(sync_dir)
+    assert b"console.log('home');" in _tree(async_dir)['script.js']
+
+
+def test_async_export_reports_shared_step_last(tmp_path):
+    async def collect():
+        return [progress.name async for progress in HTMLCSSJSExporter().export_async(_app(), str(tmp_path))]
+
+    names = asyncio.run(collect())
+    assert names[-1] == 'shared'
+    assert sorted(names[:-1]) == ['about', 'home']
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from dars.exporters import atomic_output
+from dars.exporters.atomic_output import AtomicOutput
+
+exchange = pytest.mark.skipif(not atomic_output._exchange_supported(os.getcwd()),
+                              reason="renameat2(RENAME_EXCHANGE) no disponible")
+
+
+def _build(output, content, mode='auto'):
+    swap = AtomicOutput(str(output), mode=mode)
+    build_dir = swap.begin()
+    with open(os.path.join(build_dir, 'index.html'), 'w') as f:
+        f.write(content)
+    swap.commit()
+    return swap
+
+
+def _index(output):
+    with open(os.path.join(str(output), 'index.html')) as f:
+        return f.read()
+
+
+def _exchange_calls(monkeypatch):
+    calls = []
+
+    def exchange_paths(a, b):
+        calls.append((a, b))
+        return original(a, b)
+    original = atomic_output.exchange_paths
+    monkeypatch.setattr(atomic_output, 'exchange_paths', exchange_paths)
+    return calls
+
+
+@exchange
+def test_auto_converts_a_directory_to_symlink_in_one_step(tmp_path, monkeypatch):
+    output = tmp_path / 'dist'
+    output.mkdir()
+    (output / 'index.html').write_text('old')
+    calls = _exchange_calls(monkeypatch)
+
+    swap = _build(output, 'new')
+
+    assert swap.mode == 'symlink'
+    assert os.path.islink(output) and _index(output) == 'new'
+    # La salida y el enlace se intercambiaron; el directorio anterior queda como build
+    assert calls[-1][1] == str(output)
+    previous = [entry for entry in os.listdir(swap.builds_path) if entry.startswith('previous-')]
+    assert len(previous) == 1
+    assert (tmp_path / '.dist-builds' / previous[0] / 'index.html').read_text() == 'old'
+    assert sorted(os.listdir(tmp_path)) == ['.dist-builds', 'dist']
+
+    _build(output, 'newer')
+    assert _index(output) == 'newer'
+
+
+@exchange
+def test_rename_mode_exchanges_directories(tmp_path, monkeypatch):
+    output = tmp_path / 'dist'
+    _build(output, 'old', mode='rename')
+    calls = _exchange_calls(monkeypatch)
+
+    _build(output, 'new', mode='rename')
+
+    assert len(calls) == 1
+    assert not os.path.islink(output) and _index(output) == 'new'
+    assert os.listdir(tmp_path) == ['dist']
+
+
+def test_auto_falls_back_to_rename_with_a_warning(tmp_path, monkeypatch):
+    output = tmp_path / 'dist'
+    output.mkdir()
+    (output / 'index.html').write_text('old')
+    monkeypatch.setattr(atomic_output, '_renameat2', lambda: None)
+
+    with pytest.warns(RuntimeWarning, match='rename'):
+        swap = _build(output, 'new')
+
+    assert swap.mode == 'rename'
+    assert not os.path.islink(output) and _index(output) == 'new'
+    assert os.listdir(tmp_path) == ['dist']
@@ -0,0 +1,42 @@
+import os
+import re
+
+import pytest
+
+from dars.components.advanced.tabs import Tabs
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+from dars.scripts.script import InlineScript
+
+
+def _app():
+    app = App(title="bundled")
+    home = Page(Text("home", style={'color': 'red'}))
+    home.add_script(InlineScript("console.log('home');"))
+    about = Page(Text("about", style={'color': 'blue'}),
+                 Tabs(tabs=["a", "b"], panels=[Text("a"), Text("b")]))
+    about.add_script(InlineScript("console.log('about');"))
+    app.add_page("home", home, index=True)
+    app.add_page("about", about)
+    return app
+
+
+@pytest.mark.parametrize("resource_hints", [False, True])
+def test_multipage_bundle_pages_are_self_contained(tmp_path, resource_hints):
+    output = tmp_path / "out"
+    result = HTMLCSSJSExporter(resource_hints=resource_hints).export(_app(), str(output), bundle=True)
+
+    assert result
+    assert sorted(os.listdir(output)) == ["about.html", "index.html"]
+    for name, script in (("index.html", "home"), ("about.html", "about")):
+        document = (output / name).read_text(encoding="utf-8")
+        assert not re.search(r'<link\b[^>]*rel="(stylesheet|preload)"', document), name
+        assert not re.search(r'<script\b[^>]*\bsrc=', document), name
+        assert "<style>" in document
+        assert f"console.log('{script}');" in document
+    about = (output / "about.html").read_text(encoding="utf-8")
+    assert "color: blue" in about
+    assert "dars-tab" in about
+    assert [page["file"] for page in result.bundle_report.pages] == ["index.html", "about.html"]
@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+from dars.scripts.script import InlineScript
+
+
+def _read(directory, name):
+    with open(os.path.join(directory, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _app():
+    app = App(title="router")
+    app.add_script(InlineScript("window.globalRuns = (window.globalRuns || 0) + 1;"))
+    home = Page(Text("home"))
+    about = Page(Text("about"))
+    about.add_script(InlineScript("const aboutOnly = 1;"))
+    app.add_page("home", home, index=True)
+    app.add_page("about", about)
+    return app
+
+
+@pytest.mark.parametrize("client_router", [False, True])
+def test_global_scripts_run_once_with_client_router(tmp_path, client_router):
+    output = str(tmp_path / "out")
+    assert HTMLCSSJSExporter(client_router=client_router).export(_app(), output)
+
+    runtime = _read(output, "runtime_dars.js")
+    about = _read(output, "script_about.js")
+    assert "window.globalRuns" in runtime
+    assert "const aboutOnly = 1;" in about
+    # El router no recarga el runtime y ejecuta cada script de página una vez por sesión:
+    # los scripts globales no se repiten en el de cada página
+    assert ("window.globalRuns" in about) is not client_router
+    assert ("window.globalRuns" in _read(output, "script.js")) is not client_router
+    if client_router:
+        manifest = json.loads(_read(output, "routes.json"))
+        assert manifest["pages"]["about.html"] == {"script": "script_about.js"}
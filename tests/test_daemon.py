@@ -0,0 +1,124 @@
+import json
+import os
+import socket
+import sys
+import subprocess
+import threading
+import time
+
+import pytest
+
+from dars.cli import daemon
+from dars.cli.daemon import PROTOCOL_VERSION, BuildDaemon, forward_export
+
+pytestmark = pytest.mark.skipif(not daemon.daemon_supported(), reason="el daemon necesita fork() y sockets Unix")
+
+
+@pytest.fixture(autouse=True)
+def _allow_daemon(monkeypatch):
+    monkeypatch.delenv('DARS_NO_DAEMON', raising=False)
+
+
+def _reply_once(path, response):
+    """Servidor de una sola petición que responde `response` y guarda lo recibido"""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    received = []
+
+    def run():
+        conn, _ = server.accept()
+        with conn, conn.makefile('rb') as stream:
+            received.append(json.loads(stream.readline()))
+            conn.sendall(json.dumps(response).encode() + b'\n')
+        server.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, received
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Daemon en otro proceso, con el entorno que tenía al arrancar"""
+    path = str(tmp_path / 'd.sock')
+    process = subprocess.Popen([sys.executable, '-m', 'dars.cli.daemon', path],
+                               cwd=os.path.dirname(daemon.DARS_PACKAGE_DIR))
+    deadline = time.monotonic() + 30
+    while daemon.send_request({'command': 'ping'}, socket_path=path) is None:
+        assert process.poll() is None and time.monotonic() < deadline, "the daemon did not start"
+        time.sleep(0.05)
+    yield path
+    daemon.send_request({'command': 'shutdown'}, socket_path=path)
+    process.wait(10)
+
+
+def test_no_socket_falls_back(tmp_path):
+    assert forward_export('app.py', 'html', 'dist', socket_path=str(tmp_path / 'missing.sock')) is None
+
+
+def test_stale_socket_falls_back_and_is_replaced(tmp_path):
+    path = str(tmp_path / 'd.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    assert os.path.exists(path)
+    assert forward_export('app.py', 'html', 'dist', socket_path=path) is None
+
+    # Un daemon nuevo sustituye el socket abandonado en lugar de fallar al hacer bind
+    server = BuildDaemon(path)._bind()
+    with server, socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+
+
+def test_protocol_version_mismatch_falls_back(tmp_path):
+    path = str(tmp_path / 'd.sock')
+    thread, received = _reply_once(path, {'ok': True, 'version': PROTOCOL_VERSION - 1, 'title': 'old'})
+    assert forward_export('app.py', 'html', 'dist', socket_path=path) is None
+    thread.join(5)
+    assert received[0]['version'] == PROTOCOL_VERSION
+
+
+def test_daemon_rejects_old_clients(running_daemon):
+    response = daemon.send_request({'command': 'ping'}, socket_path=running_daemon)
+    assert response['ok'] and response['version'] == PROTOCOL_VERSION
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with conn:
+        conn.connect(running_daemon)
+        conn.sendall(json.dumps({'command': 'ping', 'version': PROTOCOL_VERSION - 1}).encode() + b'\n')
+        with conn.makefile('rb') as stream:
+            response = json.loads(stream.readline())
+    assert response == {'ok': False, 'version': PROTOCOL_VERSION, 'error': 'protocol mismatch'}
+
+
+def test_daemon_declines_other_dars_installation(running_daemon, monkeypatch):
+    monkeypatch.setattr(daemon, 'DARS_PACKAGE_DIR', '/elsewhere/dars')
+    assert forward_export('app.py', 'html', 'dist', socket_path=running_daemon) is None
+    status = daemon.send_request({'command': 'status'}, socket_path=running_daemon)
+    assert status['requests_served'] == 0
+
+
+def test_forwarded_export_runs_with_client_environment(running_daemon, tmp_path, monkeypatch):
+    lib = tmp_path / 'lib'
+    lib.mkdir()
+    (lib / 'client_settings.py').write_text("import os\nTITLE = os.environ['DARS_TEST_TITLE']\n")
+    project = tmp_path / 'project'
+    project.mkdir()
+    (project / 'app.py').write_text(
+        "import os\n"
+        "from client_settings import TITLE\n"
+        "from dars.all import App, Text\n"
+        "app = App(title=TITLE + ':' + os.path.basename(os.getcwd()))\n"
+        "app.set_root(Text('hi'))\n"
+    )
+    # El cliente tiene otro entorno y otro cwd que el daemon (que ya arrancó)
+    monkeypatch.setenv('DARS_TEST_TITLE', 'from-client')
+    monkeypatch.setenv('PYTHONPATH', str(lib))
+    monkeypatch.chdir(project)
+
+    result = forward_export('app.py', 'html', 'dist', socket_path=running_daemon)
+    assert result is not None, "the daemon should accept the export"
+    assert result['ok'], result.get('error')
+    assert result['title'] == 'from-client:project'
+    assert (project / 'dist' / 'index.html').exists()
+    assert 'client_settings' not in sys.modules
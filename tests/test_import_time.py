@@ -0,0 +1,34 @@
+import pytest
+
+from benchmarks.imports import IMPORT_BUDGETS_MS, check_import_budgets, measure_import_times
+
+
+@pytest.mark.parametrize("target", sorted(IMPORT_BUDGETS_MS))
+def test_cold_import_within_budget(target):
+    # python -X importtime -c "import dars" / -m dars.cli.main --help en intérpretes nuevos;
+    # el mínimo de 3 ejecuciones frente al presupuesto de benchmarks/imports.py
+    results = measure_import_times([target], runs=3)
+    assert check_import_budgets(results) == []
+
+
+def test_export_forwards_to_daemon_before_importing_rich(monkeypatch, tmp_path):
+    import sys
+
+    from dars.cli import daemon, main
+
+    seen = {}
+
+    def forward_export(*args, **kwargs):
+        seen['rich'] = sorted(name for name in sys.modules if name.startswith('rich.panel'))
+        return {'ok': True, 'title': 'app', 'stats': {}, 'elapsed_ms': 1}
+    monkeypatch.setattr(daemon, 'forward_export', forward_export)
+    for name in [name for name in sys.modules if name == 'rich' or name.startswith('rich.')]:
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(main, 'DarsExporter', type('Exporter', (main.DarsExporter,), {
+        'show_export_summary': lambda self, *args, **kwargs: None}))
+    monkeypatch.setattr(sys, 'argv', ['dars', 'export', 'app.py', '-f', 'html', '-o', str(tmp_path)])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main.main()
+    assert exit_info.value.code == 0
+    assert seen['rich'] == []
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from dars.components.advanced.modal import Modal
+from dars.components.advanced.tabs import Tabs
+from dars.components.basic.cached import Cached
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+
+
+def _read(directory, name):
+    with open(os.path.join(directory, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _lazy_tabs():
+    return Tabs(tabs=["General", "Advanced"], panels=[Text("general"), Text("advanced")], lazy=True)
+
+
+def _lazy_modal():
+    modal = Modal(title="Confirm", lazy=True)
+    modal.add_child(Text("are you sure?"))
+    return modal
+
+
+@pytest.mark.parametrize("islands", [False, True])
+@pytest.mark.parametrize("layout", ["index", "sub_page", "nested_in_panel", "cached"])
+def test_multipage_shared_runtime_includes_lazy_code(tmp_path, layout, islands):
+    app = App(title="settings")
+    if layout == "index":
+        app.add_page("home", Page(_lazy_tabs(), _lazy_modal()), index=True)
+        app.add_page("about", Page(Text("about")))
+    else:
+        app.add_page("home", Page(Text("home")), index=True)
+        if layout == "sub_page":
+            settings = Page(_lazy_tabs(), _lazy_modal())
+        elif layout == "nested_in_panel":
+            settings = Page(Tabs(tabs=["Outer"], panels=[_lazy_tabs()]))
+        else:
+            settings = Page(Cached(lambda: Page(_lazy_tabs()), key=f"test-lazy-{islands}"))
+        app.add_page("settings", settings)
+
+    output = str(tmp_path / "out")
+    assert HTMLCSSJSExporter(islands=islands).export(app, output)
+
+    runtime = _read(output, "runtime_dars.js")
+    assert "function darsRenderLazy" in runtime
+    assert "function darsWatchLazyModal" in runtime
+    page = _read(output, "index.html" if layout == "index" else "settings.html")
+    assert '<template class="dars-lazy">' in page
+
+
+def test_runtime_without_lazy_components_has_no_lazy_code(tmp_path):
+    app = App(title="plain")
+    app.add_page("home", Page(Text("home")), index=True)
+    app.add_page("tabs", Page(Tabs(tabs=["a", "b"], panels=[Text("a"), Text("b")])))
+
+    output = str(tmp_path / "out")
+    assert HTMLCSSJSExporter().export(app, output)
+
+    runtime = _read(output, "runtime_dars.js")
+    assert "darsRenderLazy" not in runtime
+    # Las pestañas de una subpágina también cuentan para el runtime compartido
+    assert "dars-tab-active" in runtime
+    assert "<template" not in _read(output, "tabs.html")
@@ -0,0 +1,54 @@
+import time
+import tracemalloc
+
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.profiler import ExportProfiler
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+
+
+def _app():
+    app = App(title="profiled")
+    app.add_page("home", Page(Text("home")), index=True)
+    app.add_page("about", Page(Text("about")))
+    return app
+
+
+def test_profile_measures_the_export_writer(tmp_path):
+    profiler = ExportProfiler(track_allocations=False)
+    exporter = HTMLCSSJSExporter()
+    with profiler.attach(exporter):
+        result = exporter.export(_app(), str(tmp_path / "out"))
+
+    assert result
+    data = profiler.to_dict()
+    files = result.write_stats.files_written + result.write_stats.files_skipped
+    assert data['phases']['write']['calls'] == files
+    assert data['phases']['write_wait']['calls'] >= 1
+    assert data['output']['files_written'] == result.write_stats.files_written
+    # El escritor instrumentado es el de la exportación, no el exportador
+    assert '_write_export' not in vars(exporter)
+
+
+def test_allocation_snapshot_is_not_timed(tmp_path, monkeypatch):
+    delay = 0.3
+    take_snapshot = tracemalloc.take_snapshot
+
+    def slow_snapshot():
+        time.sleep(delay)
+        return take_snapshot()
+    monkeypatch.setattr(tracemalloc, 'take_snapshot', slow_snapshot)
+
+    profiler = ExportProfiler(memory_report=True)
+    exporter = HTMLCSSJSExporter()
+    try:
+        with profiler.attach(exporter):
+            assert exporter.export(_app(), str(tmp_path / "out"))
+    finally:
+        profiler.stop()
+
+    assert profiler.allocation_sites
+    data = profiler.to_dict()
+    assert data['phases']['export']['wall_ms'] < delay * 1000
+    assert sum(data['pages'].values()) < delay * 1000
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from dars.components.advanced.accordion import Accordion
+from dars.components.advanced.modal import Modal
+from dars.components.advanced.tabs import Tabs
+from dars.components.basic.button import Button
+from dars.components.basic.container import Container
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.exporters.web.bundle import BundleOptions
+from dars.exporters.web.html_css_js import HTMLCSSJSExporter
+
+
+def _app(pages=12, title="concurrent"):
+    app = App(title=title)
+    for i in range(pages):
+        modal = Modal(title=f"modal {i}", lazy=i % 2 == 0)
+        modal.add_child(Text(f"modal body {i}"))
+        root = Page(
+            Container(children=[Text(f"page {i}"), Button(f"button {i}")], style={'padding': f'{i}px'}),
+            Tabs(tabs=["a", "b"], panels=[Text(f"a{i}"), Text(f"b{i}")], lazy=i % 3 == 0),
+            Accordion(sections=[("one", Text(f"one {i}")), ("two", Text(f"two {i}"))]),
+            modal,
+        )
+        app.add_page(f"page{i}", root, index=i == 0)
+    return app
+
+
+def test_concurrent_render_page_files_matches_sequential():
+    app = _app()
+    exporter = HTMLCSSJSExporter()
+    targets = list(exporter.iter_page_targets(app))
+    sequential = [exporter.render_page_files(app, slug, page, is_index) for slug, page, is_index in targets]
+
+    assert 'page 3' in sequential[3]['page3.html'] and ' object at 0x' not in sequential[3]['page3.html']
+
+    # La misma instancia, 8 hilos a la vez: el estado de cada render va en su RenderContext
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(3):
+            concurrent = list(pool.map(lambda target: exporter.render_page_files(app, *target), targets))
+            assert concurrent == sequential
+
+
+def test_concurrent_exports_return_their_own_results(tmp_path):
+    exporter = HTMLCSSJSExporter()
+    apps = [_app(pages=pages, title=f"app{pages}") for pages in (2, 5, 9)]
+
+    progress = {app.title: [] for app in apps}
+
+    def export(app):
+        return exporter.export(app, str(tmp_path / app.title), bundle=app.title == "app5",
+                               on_progress=lambda completed, total, name: progress[app.title].append(total))
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(export, apps))
+
+    for app, result in zip(apps, results):
+        assert result and result.error is None
+        # Cada exportación recibe solo su progreso: shared y una entrada por página
+        pages = len(app.pages)
+        assert progress[app.title] == [pages + 1] * (pages + 1)
+        written = sorted(p.name for p in (tmp_path / app.title).iterdir())
+        assert result.write_stats.files_written == len(written)
+        if app.title == "app5":
+            assert len(result.bundle_report.pages) == 5
+        else:
+            assert result.bundle_report is None
+
+
+def test_failed_export_result_is_false(tmp_path):
+    exporter = HTMLCSSJSExporter()
+    result = exporter.export(_app(pages=2), str(tmp_path / "out"),
+                             bundle=BundleOptions(max_bytes=10))
+    assert not result
+    assert isinstance(result.error, ValueError)
@@ -0,0 +1,170 @@
+import asyncio
+import gzip
+import os
+import time
+
+import pytest
+
+from dars.cli.serve import IMMUTABLE_CACHE_CONTROL, InotifyWatcher, StaticServer
+
+
+async def _get(server, target, headers=None, method='GET'):
+    """(status, cabeceras, cuerpo) de una petición con Connection: close"""
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    lines = [f'{method} {target} HTTP/1.1', 'Host: test', 'Connection: close']
+    lines.extend(f'{name}: {value}' for name, value in (headers or {}).items())
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    head, _, body = data.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    response_headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        response_headers[name.strip().lower()] = value.strip()
+    return int(status_line.split()[1]), response_headers, body
+
+
+def _serve(directory, scenario):
+    async def main():
+        server = StaticServer(str(directory), port=0)
+        await server.start()
+        try:
+            await scenario(server)
+        finally:
+            await server.close()
+    asyncio.run(main())
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / 'index.html').write_text('<h1>home</h1>')
+    (tmp_path / 'about.html').write_text('<h1>about</h1>')
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'index.html').write_text('<h1>docs</h1>')
+    (tmp_path / 'data.txt').write_bytes(bytes(range(100)))
+    (tmp_path / 'app.3f2a9c1b.js').write_text('console.log(1)')
+    script = tmp_path / 'script.js'
+    script.write_text('var x = 1;\n' * 200)
+    # Los hermanos precomprimidos son más nuevos que el original
+    (tmp_path / 'script.js.gz').write_bytes(gzip.compress(script.read_bytes(), mtime=0))
+    (tmp_path / 'script.js.br').write_bytes(b'brotli-bytes')
+    return tmp_path
+
+
+def test_pages_redirects_and_404(site):
+    async def scenario(server):
+        status, headers, body = await _get(server, '/')
+        assert status == 200 and body == b'<h1>home</h1>'
+        assert headers['content-length'] == str(len(body))
+        assert headers['cache-control'] == 'no-cache'
+
+        status, _headers, body = await _get(server, '/about')
+        assert status == 200 and body == b'<h1>about</h1>'
+
+        status, headers, _body = await _get(server, '/docs?lang=es&page=2')
+        assert status == 301 and headers['location'] == '/docs/?lang=es&page=2'
+        status, headers, _body = await _get(server, '/docs')
+        assert status == 301 and headers['location'] == '/docs/'
+
+        status, _headers, body = await _get(server, '/docs/')
+        assert status == 200 and body == b'<h1>docs</h1>'
+
+        assert (await _get(server, '/missing.css'))[0] == 404
+        assert (await _get(server, '/../etc/passwd'))[0] == 404
+    _serve(site, scenario)
+
+
+def test_byte_ranges(site):
+    async def scenario(server):
+        status, headers, body = await _get(server, '/data.txt', {'Range': 'bytes=10-19'})
+        assert status == 206 and body == bytes(range(10, 20))
+        assert headers['content-range'] == 'bytes 10-19/100'
+
+        status, headers, body = await _get(server, '/data.txt', {'Range': 'bytes=-5'})
+        assert status == 206 and body == bytes(range(95, 100))
+
+        status, headers, body = await _get(server, '/data.txt', {'Range': 'bytes=90-'})
+        assert status == 206 and body == bytes(range(90, 100))
+
+        status, headers, _body = await _get(server, '/data.txt', {'Range': 'bytes=100-'})
+        assert status == 416 and headers['content-range'] == 'bytes */100'
+
+        # Multirango no soportado: recurso completo
+        status, _headers, body = await _get(server, '/data.txt', {'Range': 'bytes=0-1,5-6'})
+        assert status == 200 and len(body) == 100
+
+        # If-Range con un ETag viejo ignora el Range
+        status, _headers, body = await _get(server, '/data.txt', {'Range': 'bytes=0-1', 'If-Range': '"old"'})
+        assert status == 200 and len(body) == 100
+    _serve(site, scenario)
+
+
+def test_accept_encoding_selects_precompressed_sibling(site):
+    original = (site / 'script.js').read_bytes()
+
+    async def scenario(server):
+        status, headers, body = await _get(server, '/script.js', {'Accept-Encoding': 'gzip, br'})
+        assert status == 200 and headers['content-encoding'] == 'br' and body == b'brotli-bytes'
+        assert headers['vary'] == 'Accept-Encoding'
+        br_etag = headers['etag']
+
+        status, headers, body = await _get(server, '/script.js', {'Accept-Encoding': 'gzip, br;q=0'})
+        assert headers['content-encoding'] == 'gzip' and gzip.decompress(body) == original
+        assert headers['etag'] != br_etag
+
+        status, headers, body = await _get(server, '/script.js', {'Accept-Encoding': 'identity'})
+        assert 'content-encoding' not in headers and body == original
+        assert headers['content-type'] == 'application/javascript; charset=utf-8'
+
+        # Range siempre se resuelve sobre la representación sin comprimir
+        status, headers, body = await _get(server, '/script.js', {'Accept-Encoding': 'br', 'Range': 'bytes=0-2'})
+        assert status == 206 and 'content-encoding' not in headers and body == original[:3]
+    _serve(site, scenario)
+
+
+def test_conditional_requests_and_immutable_assets(site):
+    async def scenario(server):
+        status, headers, _body = await _get(server, '/app.3f2a9c1b.js')
+        assert status == 200 and headers['cache-control'] == IMMUTABLE_CACHE_CONTROL
+        status, revalidated, body = await _get(server, '/app.3f2a9c1b.js', {'If-None-Match': headers['etag']})
+        assert status == 304 and body == b''
+        assert revalidated['etag'] == headers['etag']
+
+        status, headers, _body = await _get(server, '/script.js', {'Accept-Encoding': 'gzip'})
+        status, _headers, _body = await _get(server, '/script.js',
+                                             {'Accept-Encoding': 'gzip', 'If-None-Match': headers['etag']})
+        assert status == 304
+        # El ETag de la variante gzip no vale para la variante sin comprimir
+        status, _headers, _body = await _get(server, '/script.js', {'If-None-Match': headers['etag']})
+        assert status == 200
+    _serve(site, scenario)
+
+
+@pytest.mark.skipif(not InotifyWatcher.available(), reason="inotify solo en Linux")
+def test_inotify_invalidates_cached_metadata(site):
+    async def scenario(server):
+        assert server.cache.watched
+        status, headers, _body = await _get(server, '/about')
+        assert status == 200
+        assert (await _get(server, '/new.html'))[0] == 404
+
+        # Con inotify las entradas no caducan por TTL: solo un evento las invalida
+        server.cache.ttl = 3600
+        (site / 'about.html').write_text('<h1>about v2</h1>')
+        (site / 'new.html').write_text('<h1>new</h1>')
+        deadline = time.monotonic() + 5
+        while True:
+            await asyncio.sleep(0.02)
+            status, changed, body = await _get(server, '/about')
+            if body == b'<h1>about v2</h1>' or time.monotonic() > deadline:
+                break
+        assert body == b'<h1>about v2</h1>' and changed['etag'] != headers['etag']
+        status, _headers, body = await _get(server, '/new.html')
+        assert status == 200 and body == b'<h1>new</h1>'
+
+        os.remove(site / 'new.html')
+        await asyncio.sleep(0.1)
+        assert (await _get(server, '/new.html'))[0] == 404
+    _serve(site, scenario)
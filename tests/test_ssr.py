@@ -0,0 +1,140 @@
+import asyncio
+from wsgiref.util import setup_testing_defaults
+
+from dars.components.basic.page import Page
+from dars.components.basic.text import Text
+from dars.core.app import App
+from dars.server import SSRApp
+
+
+def _app():
+    app = App(title="ssr")
+    app.add_page("home", Page(Text("home page")), index=True)
+    app.add_page("about", Page(Text("about page")))
+    return app
+
+
+def _wsgi(ssr, path, headers=None, method='GET'):
+    """(status, cabeceras, cuerpo) de una petición WSGI en el proceso"""
+    environ = {'REQUEST_METHOD': method, 'PATH_INFO': path}
+    for name, value in (headers or {}).items():
+        environ['HTTP_' + name.upper().replace('-', '_')] = value
+    setup_testing_defaults(environ)
+    started = {}
+
+    def start_response(status, response_headers):
+        started['status'] = status
+        started['headers'] = dict(response_headers)
+
+    body = b''.join(ssr.wsgi(environ, start_response))
+    return int(started['status'].split()[0]), started['headers'], body
+
+
+def _asgi(ssr, path, headers=None):
+    """(status, cabeceras, fragmentos del cuerpo) de una petición ASGI"""
+    scope = {'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'', 'root_path': '',
+             'headers': [(name.encode(), value.encode()) for name, value in (headers or {}).items()]}
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(ssr.asgi(scope, receive, send))
+    start = messages[0]
+    assert start['type'] == 'http.response.start'
+    headers = {name.decode(): value.decode() for name, value in start['headers']}
+    chunks = [message['body'] for message in messages[1:] if message['body']]
+    return start['status'], headers, chunks
+
+
+def test_wsgi_pages_etag_and_404():
+    ssr = SSRApp(_app())
+    status, headers, body = _wsgi(ssr, '/')
+    assert status == 200 and b'home page' in body
+    assert headers['Content-Length'] == str(len(body))
+
+    status, _headers, body = _wsgi(ssr, '/about')
+    assert status == 200 and b'about page' in body
+
+    status, _headers, body = _wsgi(ssr, '/', {'If-None-Match': headers['ETag']})
+    assert status == 304 and body == b''
+
+    status, _headers, _body = _wsgi(ssr, '/missing')
+    assert status == 404
+
+
+def test_wsgi_serves_hashed_assets_as_immutable():
+    ssr = SSRApp(_app())
+    _status, _headers, body = _wsgi(ssr, '/')
+    css = next(part.split('"')[0] for part in body.decode().split('href="/')[1:] if part.startswith('styles.'))
+    status, headers, _body = _wsgi(ssr, '/' + css)
+    assert status == 200
+    assert 'immutable' in headers['Cache-Control']
+
+
+def test_asgi_pages_etag_and_404():
+    ssr = SSRApp(_app())
+    status, headers, chunks = _asgi(ssr, '/about')
+    assert status == 200 and b'about page' in b''.join(chunks)
+    status, _headers, chunks = _asgi(ssr, '/about', {'if-none-match': headers['etag']})
+    assert status == 304 and chunks == []
+    status, _headers, _chunks = _asgi(ssr, '/missing')
+    assert status == 404
+
+
+def test_routes_are_cached_only_with_version():
+    versions = {'data': 1}
+    calls = []
+    ssr = SSRApp(_app(), data_version=lambda: versions['data'])
+
+    @ssr.route('/products/{slug}', version=lambda request: request.params['slug'])
+    def product(request):
+        calls.append(('product', request.params['slug']))
+        return Text(f"product {request.params['slug']}"), request.params['slug']
+
+    @ssr.route('/live/{slug}')
+    def live(request):
+        calls.append(('live', request.params['slug']))
+        return Text("live")
+
+    for _ in range(3):
+        status, _headers, body = _wsgi(ssr, '/products/chair')
+        assert status == 200 and b'product chair' in body
+        assert _wsgi(ssr, '/live/feed')[0] == 200
+    assert calls.count(('product', 'chair')) == 1
+    assert calls.count(('live', 'feed')) == 3
+
+    # Otra versión de datos: la respuesta en caché ya no sirve
+    versions['data'] = 2
+    _wsgi(ssr, '/products/chair')
+    assert calls.count(('product', 'chair')) == 2
+    _wsgi(ssr, '/products/table')
+    assert calls.count(('product', 'table')) == 1
+
+
+def test_route_handler_lookup_error_is_404():
+    ssr = SSRApp(_app())
+    ssr.route('/items/{id}', lambda request: {}[request.params['id']])
+    assert _wsgi(ssr, '/items/7')[0] == 404
+
+
+def test_streamed_first_chunk_has_the_whole_head():
+    ssr = SSRApp(_app(), stream=True, chunk_size=16)
+    status, headers, chunks = _asgi(ssr, '/')
+    assert status == 200 and 'etag' not in headers
+    assert len(chunks) > 1
+    first = chunks[0].decode()
+    assert first.count('<head>') == 1 and '</head>' in first
+    assert 'rel="stylesheet"' in first
+    assert 'home page' not in first
+    assert b'home page' in b''.join(chunks)
+
+    # Terminado el streaming, la respuesta queda en caché y lleva ETag
+    status, headers, chunks = _asgi(ssr, '/')
+    assert status == 200 and 'etag' in headers
+
+    status, _headers, body = _wsgi(SSRApp(_app(), stream=True), '/about')
+    assert status == 200 and b'about page' in body